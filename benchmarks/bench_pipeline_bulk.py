@@ -0,0 +1,49 @@
+"""
+Benchmarks `Pipeline.encrypt_many` throughput for an increasing number of workers.
+
+Usage: python benchmarks/bench_pipeline_bulk.py [--records 200000] [--chunk-size 256]
+       [--workers 1 2 4 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from fast_encrypt import CaesarsCipher, MorseCode, Pipeline, Vigenere  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--records', type=int, default=200_000)
+    parser.add_argument('--chunk-size', type=int, default=256)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, os.cpu_count()])
+    parser.add_argument('--unordered', action='store_true')
+    args = parser.parse_args()
+
+    pipeline = Pipeline([CaesarsCipher(3), Vigenere('KEY'), MorseCode()])
+    records = [f'Record {i}: the quick brown fox' for i in range(args.records)]
+
+    print(f'{"workers":>7} {"time (s)":>9} {"records/s":>10} {"speedup":>9}')
+
+    baseline = None
+
+    for workers in args.workers:
+        start = time.perf_counter()
+        pipeline.encrypt_many(
+            records, workers=workers, chunk_size=args.chunk_size, ordered=not args.unordered
+        )
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+
+        print(
+            f'{workers:>7} {elapsed:>9.3f} {args.records / elapsed:>10.0f} '
+            f'{baseline / elapsed:>8.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmarks `Pipeline.encrypt` against `Pipeline.encrypt_stream` with several chunk sizes.
+
+Usage: python benchmarks/bench_pipeline_stream.py [--chars 4000000] [--chunk-sizes 4096 65536]
+"""
+
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from fast_encrypt import CaesarsCipher, MorseCode, Pipeline, Vigenere  # noqa: E402
+
+TEXT = 'The quick brown fox jumps over the lazy dog. '
+
+
+class NullWriter:
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--chars', type=int, default=4_000_000)
+    parser.add_argument('--chunk-sizes', type=int, nargs='+', default=[4096, 65536, 1048576])
+    args = parser.parse_args()
+
+    pipeline = Pipeline([CaesarsCipher(3), Vigenere('KEY'), MorseCode()])
+    text = TEXT * (args.chars // len(TEXT) + 1)
+
+    start = time.perf_counter()
+    pipeline.encrypt(text)
+    encrypt_time = time.perf_counter() - start
+
+    print(f'{"method":>24} {"time (s)":>9} {"Mchars/s":>9}')
+    print(f'{"encrypt":>24} {encrypt_time:>9.3f} {len(text) / encrypt_time / 1e6:>9.2f}')
+
+    for chunk_size in args.chunk_sizes:
+        start = time.perf_counter()
+        pipeline.encrypt_stream(io.StringIO(text), NullWriter(), chunk_size=chunk_size)
+        stream_time = time.perf_counter() - start
+
+        print(
+            f'{f"encrypt_stream({chunk_size})":>24} {stream_time:>9.3f} '
+            f'{len(text) / stream_time / 1e6:>9.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
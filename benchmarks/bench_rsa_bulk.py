@@ -0,0 +1,50 @@
+"""
+Benchmarks `RSA.decrypt_many` throughput for an increasing number of workers.
+
+Usage: python benchmarks/bench_rsa_bulk.py [--key-length 2048] [--messages 256] [--workers 1 2 4 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from fast_encrypt import RSA  # noqa: E402
+
+TEXT = 'The quick brown fox jumps over the lazy dog. '
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--key-length', type=int, default=2048)
+    parser.add_argument('--messages', type=int, default=256)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, os.cpu_count()])
+    args = parser.parse_args()
+
+    rsa = RSA(args.key_length)
+    public_key, private_key = rsa.generate_keypair(public_exponent=65537)
+    cipher_texts = rsa.encrypt_many(
+        public_key, [TEXT] * args.messages, packing='block', output_format='bytes'
+    )
+
+    print(f'{"workers":>7} {"time (s)":>9} {"msgs/s":>9} {"speedup":>9}')
+
+    baseline = None
+
+    for workers in args.workers:
+        start = time.perf_counter()
+        rsa.decrypt_many(private_key, cipher_texts, workers=workers)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+
+        print(
+            f'{workers:>7} {elapsed:>9.3f} {args.messages / elapsed:>9.1f} '
+            f'{baseline / elapsed:>8.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
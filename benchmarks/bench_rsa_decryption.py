@@ -0,0 +1,62 @@
+"""
+Benchmarks `RSA.decrypt` with the legacy `(d, n)` tuple against 2, 3 and 4-prime CRT keys.
+
+Usage: python benchmarks/bench_rsa_decryption.py [--key-lengths 1024 2048] [--repeat 3]
+"""
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from fast_encrypt import RSA  # noqa: E402
+
+TEXT = 'The quick brown fox jumps over the lazy dog. ' * 4
+
+
+def time_decryption(rsa: RSA, private_key, cipher_text: str, repeat: int) -> float:
+    best = math.inf
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rsa.decrypt(private_key, cipher_text)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--key-lengths', type=int, nargs='+', default=[1024, 2048])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f'{"modulus":>7} {"(d, n) (s)":>11} {"2 primes (s)":>13} '
+        f'{"3 primes (s)":>13} {"4 primes (s)":>13} {"speedup":>9}'
+    )
+
+    for key_length in args.key_lengths:
+        rsa = RSA(key_length)
+        times = []
+
+        for primes in (2, 3, 4):
+            public_key, private_key = rsa.generate_keypair(public_exponent=65537, primes=primes)
+            cipher_text = rsa.encrypt(public_key, TEXT)
+
+            if primes == 2:
+                times.append(time_decryption(rsa, tuple(private_key), cipher_text, args.repeat))
+
+            times.append(time_decryption(rsa, private_key, cipher_text, args.repeat))
+
+        print(
+            f'{2 * key_length:>7} {times[0]:>11.4f} {times[1]:>13.4f} '
+            f'{times[2]:>13.4f} {times[3]:>13.4f} {times[0] / min(times):>8.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmarks `RSA.encrypt` with a random public exponent against e=65537.
+
+Usage: python benchmarks/bench_rsa_encryption.py [--key-lengths 1024 2048 4096]
+"""
+
+import argparse
+import math
+import secrets
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from fast_encrypt import RSA  # noqa: E402
+
+TEXT = 'The quick brown fox jumps over the lazy dog. ' * 4
+
+
+def random_public_exponent(p: int, q: int) -> int:
+    phi = (p - 1) * (q - 1)
+    e = secrets.randbelow(phi - 1) + 1
+
+    while math.gcd(e, phi) != 1:
+        e = secrets.randbelow(phi - 1) + 1
+
+    return e
+
+
+def time_encryption(rsa: RSA, public_key: tuple[int, int], repeat: int) -> float:
+    best = math.inf
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rsa.encrypt(public_key, TEXT)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--key-lengths', type=int, nargs='+', default=[1024, 2048, 4096])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f'{"key_length":>10} {"random e (s)":>14} {"e=65537 (s)":>14} {"speedup":>9}')
+
+    for key_length in args.key_lengths:
+        rsa = RSA(key_length)
+        small_public_key, private_key = rsa.generate_keypair(public_exponent=65537)
+        random_public_key = random_public_exponent(private_key.p, private_key.q), private_key.n
+
+        random_time = time_encryption(rsa, random_public_key, args.repeat)
+        small_time = time_encryption(rsa, small_public_key, args.repeat)
+
+        print(
+            f'{key_length:>10} {random_time:>14.4f} {small_time:>14.4f} '
+            f'{random_time / small_time:>8.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmarks the latency of `RSA.generate_keypair`.
+
+Usage: python benchmarks/bench_rsa_keygen.py [--key-lengths 1024 2048 4096] [--runs 10]
+       [--workers 1]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from fast_encrypt import RSA  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--key-lengths', type=int, nargs='+', default=[1024, 2048, 4096])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--public-exponent', type=int, default=65537)
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args()
+
+    print(f'{"key_length":>10} {"runs":>5} {"mean (s)":>9} {"median (s)":>11} {"max (s)":>9}')
+
+    for key_length in args.key_lengths:
+        rsa = RSA(key_length)
+        latencies = []
+
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            rsa.generate_keypair(public_exponent=args.public_exponent, workers=args.workers)
+            latencies.append(time.perf_counter() - start)
+
+        print(
+            f'{key_length:>10} {args.runs:>5} {statistics.mean(latencies):>9.3f} '
+            f'{statistics.median(latencies):>11.3f} {max(latencies):>9.3f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -11,10 +11,18 @@ PyPi link https://pypi.org/project/fast-encrypt/
 
 from ._atbash import Atbash
 from ._caesars_cipher import CaesarsCipher
+from ._exceptions import (
+    KeyGenerationCancelledError,
+    KeyGenerationError,
+    KeyGenerationTimeoutError,
+)
 from ._homophonic_substitution import HomophonicSubstitution
 from ._morse_code import MorseCode
 from ._pipeline import Pipeline
 from ._rsa import RSA
+from ._rsa_key_pool import RSAKeyPool, RSAKeyPoolMetrics
+from ._rsa_private_key import RSAPrivateKey
+from ._rsa_public_key import RSAPublicKey
 from ._substitution import Substitution
 from ._vigenere import Vigenere
 
@@ -0,0 +1,136 @@
+"""
+Defines the big int arithmetic backends used by the RSA class.
+"""
+
+import itertools
+import math
+import secrets
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+
+class PythonArithmetic:
+    """
+    Class for big int arithmetic with the Python built-ins.
+
+    Methods
+    -------
+    powmod(base: int, exponent: int, modulus: int) -> int:
+        Returns `base ** exponent % modulus`.
+
+    invert(number: int, modulus: int) -> int:
+        Returns the modular inverse of the number.
+
+    gcd(a: int, b: int) -> int:
+        Returns the greatest common divisor of the numbers.
+
+    is_probable_prime(number: int, rounds: int) -> bool:
+        Tests the primality of an odd number with Miller-Rabin rounds.
+    """
+
+    name = 'python'
+
+    def powmod(self, base: int, exponent: int, modulus: int) -> int:
+        return pow(base, exponent, modulus)
+
+    def invert(self, number: int, modulus: int) -> int:
+        return pow(number, -1, modulus)
+
+    def gcd(self, a: int, b: int) -> int:
+        return math.gcd(a, b)
+
+    def is_probable_prime(self, number: int, rounds: int) -> bool:
+        exponent = number - 1
+        twos_qty = 0
+
+        while exponent % 2 == 0:
+            exponent //= 2
+            twos_qty += 1
+
+        # The first round uses base 2, which is cheaper and rejects nearly every composite.
+        bases = itertools.chain(
+            (2,), (secrets.randbelow(number - 3) + 2 for _ in range(rounds - 1))
+        )
+
+        for base in bases:
+            x = pow(base, exponent, number)
+
+            if x in (1, number - 1):
+                continue
+
+            for _ in range(twos_qty - 1):
+                x = pow(x, 2, number)
+
+                if x == number - 1:
+                    break
+            else:
+                return False
+
+        return True
+
+
+class GMPArithmetic:
+    """
+    Class for big int arithmetic with GMP, through the optional `gmpy2` package.
+
+    GMP modular exponentiation is several times faster than the Python
+    built-in `pow` for 2048 bits moduli and above. The results are converted
+    back to `int`, so the callers don't depend on the backend.
+    """
+
+    name = 'gmpy2'
+
+    def powmod(self, base: int, exponent: int, modulus: int) -> int:
+        return int(gmpy2.powmod(base, exponent, modulus))
+
+    def invert(self, number: int, modulus: int) -> int:
+        return int(gmpy2.invert(number, modulus))
+
+    def gcd(self, a: int, b: int) -> int:
+        return int(gmpy2.gcd(a, b))
+
+    def is_probable_prime(self, number: int, rounds: int) -> bool:
+        return bool(gmpy2.is_prime(number, rounds))
+
+
+_arithmetic = PythonArithmetic | GMPArithmetic
+arithmetic_names = ('auto', PythonArithmetic.name, GMPArithmetic.name)
+
+
+def get_arithmetic(name: str) -> _arithmetic:
+    """
+    Returns the arithmetic backend with the given name.
+
+    Parameters
+    ----------
+    name : str
+        `'python'`, `'gmpy2'` or `'auto'` (`'gmpy2'` when it is installed,
+        `'python'` otherwise).
+
+    Returns
+    -------
+    PythonArithmetic | GMPArithmetic
+        The arithmetic backend.
+
+    Raises
+    ------
+    ValueError
+        If the name is not valid or if `'gmpy2'` is not installed.
+    """
+
+    if name not in arithmetic_names:
+        raise ValueError(f'The arithmetic must be one of {", ".join(arithmetic_names)}.')
+
+    if name == 'auto':
+        name = GMPArithmetic.name if gmpy2 is not None else PythonArithmetic.name
+
+    if name == GMPArithmetic.name:
+        if gmpy2 is None:
+            raise ValueError('The gmpy2 arithmetic needs the gmpy2 package.')
+
+        return GMPArithmetic()
+
+    return PythonArithmetic()
@@ -2,6 +2,7 @@
 Defines a class for encrypting and decrypting text using the Atbash cipher.
 """
 
+from ._normalization import normalize_text
 from ._simple_encryptor import SimpleEncryptor
 
 
@@ -44,13 +45,31 @@ class Atbash(SimpleEncryptor):
     "Billie Joe Armstrong"
     """
 
-    def __init__(self) -> None:
+    def __init__(self, unicode_folding: bool = False) -> None:
         """
         Initializes the Atbash cipher.
+
+        Parameters
+        ----------
+        unicode_folding : bool, optional
+            If True, the text to be encrypted is also folded with the Unicode NFKD
+            normalization instead of only having its accents replaced, by default False.
+
+        Raises
+        ------
+        ValueError
+            If the unicode_folding is not a bool.
         """
 
+        self._validate_unicode_folding(unicode_folding)
+        self._unicode_folding = unicode_folding
         self._alphabet = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
         self._substitution_dict = self._create_substitution_dict()
+        self._translation_table = self._create_translation_table()
+
+    def _validate_unicode_folding(self, unicode_folding: bool) -> None:
+        if not isinstance(unicode_folding, bool):
+            raise ValueError('The unicode_folding must be a bool.')
 
     def _create_substitution_dict(self) -> dict[str, str]:
         alphabet_chars = list(self._alphabet)
@@ -64,6 +83,14 @@ class Atbash(SimpleEncryptor):
 
         return substitution_dict
 
+    def _create_translation_table(self) -> dict[int, int]:
+        original_chars = ''.join(self._substitution_dict.keys())
+        substitute_chars = ''.join(self._substitution_dict.values())
+
+        return str.maketrans(
+            original_chars + original_chars.lower(), substitute_chars + substitute_chars.lower()
+        )
+
     def encrypt(self, text: str) -> str:
         """
         Encrypts the input text using the Atbash cipher.
@@ -91,41 +118,17 @@ class Atbash(SimpleEncryptor):
 
         handled_text = self._handle_text(text)
 
-        encrypted_text = ''
-
-        for char in handled_text:
-            for original, substitute in self._substitution_dict.items():
-                if char.upper() == original:
-                    encrypted_text += substitute if char.isupper() else substitute.lower()
-                    break
-            else:
-                encrypted_text += char
+        return self._encrypt_normalized(handled_text)
 
-        return encrypted_text
+    def _encrypt_normalized(self, text: str) -> str:
+        return text.translate(self._translation_table)
 
     def _validate_text(self, text: str) -> None:
         if not isinstance(text, str):
             raise ValueError('The given value must be a str.')
 
     def _handle_text(self, text: str) -> str:
-        handled_text = text.strip()
-
-        substitute_letters = {
-            'A': ('Á', 'À', 'Ã', 'Â', 'Ä'),
-            'E': ('É', 'È', 'Ê', 'Ë'),
-            'I': ('Í', 'Ì', 'Î', 'Ï'),
-            'O': ('Ò', 'Ó', 'Ô', 'Õ', 'Ö'),
-            'U': ('Ú', 'Ù', 'Û', 'Ü'),
-            'C': ('Ç',),
-        }
-
-        for key, letters in substitute_letters.items():
-            for letter in letters:
-                if letter in handled_text.upper():
-                    handled_text = handled_text.replace(letter, key)
-                    handled_text = handled_text.replace(letter.lower(), key.lower())
-
-        return handled_text
+        return normalize_text(text.strip(), self._unicode_folding)
 
     def decrypt(self, cipher_text: str) -> str:
         """
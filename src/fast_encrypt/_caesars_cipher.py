@@ -2,6 +2,7 @@
 Defines a class for encrypting and decrypting text using Caesar's cipher.
 """
 
+from ._normalization import normalize_text
 from ._simple_encryptor import SimpleEncryptor
 
 
@@ -46,7 +47,7 @@ class CaesarsCipher(SimpleEncryptor):
     "David Gilmour"
     """
 
-    def __init__(self, shift: int) -> None:
+    def __init__(self, shift: int, unicode_folding: bool = False) -> None:
         """
         Initializes the Caesar's cipher with the given shift.
 
@@ -54,16 +55,24 @@ class CaesarsCipher(SimpleEncryptor):
         ----------
         shift : int
             The shift value for encryption and decryption (must be 0 < shift < 26).
+        unicode_folding : bool, optional
+            If True, the text to be encrypted is also folded with the Unicode NFKD
+            normalization instead of only having its accents replaced, by default False.
 
         Raises
         ------
         ValueError
-            If the shift is not a valid integer between 1 and 25.
+            If the shift is not a valid integer between 1 and 25 or the
+            unicode_folding is not a bool.
         """
 
+        self._alphabet = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
         self._validate_shift(shift)
         self._shift = shift
-        self._alphabetic_limits = ord('A'), ord('Z')
+        self._validate_unicode_folding(unicode_folding)
+        self._unicode_folding = unicode_folding
+        self._encryption_table, self._decryption_table = self._create_translation_tables()
 
     def _validate_shift(self, shift: int) -> None:
         if not isinstance(shift, int):
@@ -72,6 +81,21 @@ class CaesarsCipher(SimpleEncryptor):
         if shift < 1 or shift > 25:
             raise ValueError('The given value must be >= 1 and < 26.')
 
+    def _validate_unicode_folding(self, unicode_folding: bool) -> None:
+        if not isinstance(unicode_folding, bool):
+            raise ValueError('The unicode_folding must be a bool.')
+
+    def _create_translation_tables(self) -> tuple[dict[int, int], dict[int, int]]:
+        shifted_alphabet = self._alphabet[self._shift :] + self._alphabet[: self._shift]
+
+        original_chars = self._alphabet + self._alphabet.lower()
+        shifted_chars = shifted_alphabet + shifted_alphabet.lower()
+
+        encryption_table = str.maketrans(original_chars, shifted_chars)
+        decryption_table = str.maketrans(shifted_chars, original_chars)
+
+        return encryption_table, decryption_table
+
     def encrypt(self, text: str) -> str:
         """
         Encrypts the input text using Caesar's cipher.
@@ -99,48 +123,17 @@ class CaesarsCipher(SimpleEncryptor):
 
         handled_text = self._handle_text(text)
 
-        encrypted_text = ''
-
-        for char in handled_text:
-            if char.isalpha():
-                shifted_char_index = ord(char.upper()) + self._shift
-
-                upper_limit = self._alphabetic_limits[1]
-
-                if shifted_char_index > upper_limit:
-                    shifted_char_index -= 26
+        return self._encrypt_normalized(handled_text)
 
-                encrypted_text += (
-                    chr(shifted_char_index) if char.isupper() else chr(shifted_char_index).lower()
-                )
-            else:
-                encrypted_text += char
-
-        return encrypted_text
+    def _encrypt_normalized(self, text: str) -> str:
+        return text.translate(self._encryption_table)
 
     def _validate_text(self, text: str) -> None:
         if not isinstance(text, str):
             raise ValueError('The given value must be a str.')
 
     def _handle_text(self, text: str) -> str:
-        handled_text = text.strip()
-
-        substitute_letters = {
-            'A': ('Á', 'À', 'Ã', 'Â', 'Ä'),
-            'E': ('É', 'È', 'Ê', 'Ë'),
-            'I': ('Í', 'Ì', 'Î', 'Ï'),
-            'O': ('Ò', 'Ó', 'Ô', 'Õ', 'Ö'),
-            'U': ('Ú', 'Ù', 'Û', 'Ü'),
-            'C': ('Ç',),
-        }
-
-        for key, letters in substitute_letters.items():
-            for letter in letters:
-                if letter in handled_text.upper():
-                    handled_text = handled_text.replace(letter, key)
-                    handled_text = handled_text.replace(letter.lower(), key.lower())
-
-        return handled_text
+        return normalize_text(text.strip(), self._unicode_folding)
 
     def decrypt(self, cipher_text: str) -> str:
         """
@@ -169,24 +162,10 @@ class CaesarsCipher(SimpleEncryptor):
 
         handled_cipher_text = self._handle_cipher_text(cipher_text)
 
-        decrypted_text = ''
-
-        for char in handled_cipher_text:
-            if char.isalpha():
-                original_char_index = ord(char.upper()) - self._shift
-
-                lower_limit = self._alphabetic_limits[0]
-
-                if original_char_index < lower_limit:
-                    original_char_index += 26
-
-                decrypted_text += (
-                    chr(original_char_index) if char.isupper() else chr(original_char_index).lower()
-                )
-            else:
-                decrypted_text += char
+        return self._decrypt_normalized(handled_cipher_text)
 
-        return decrypted_text
+    def _decrypt_normalized(self, cipher_text: str) -> str:
+        return cipher_text.translate(self._decryption_table)
 
     def _handle_cipher_text(self, cipher_text: str) -> str:
         return cipher_text.strip()
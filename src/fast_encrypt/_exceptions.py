@@ -0,0 +1,21 @@
+"""
+Defines the exceptions raised when the RSA key generation is interrupted.
+"""
+
+
+class KeyGenerationError(Exception):
+    """
+    Base class for the errors that interrupt `RSA.generate_keypair`.
+    """
+
+
+class KeyGenerationTimeoutError(KeyGenerationError, TimeoutError):
+    """
+    Raised when `RSA.generate_keypair` doesn't finish before its timeout.
+    """
+
+
+class KeyGenerationCancelledError(KeyGenerationError):
+    """
+    Raised when the cancel event of `RSA.generate_keypair` is set.
+    """
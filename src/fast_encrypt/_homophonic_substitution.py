@@ -2,8 +2,11 @@
 Defines a class for encrypting and decrypting text using the homophonic substitution cipher.
 """
 
+import operator
 import random
+import re
 
+from ._normalization import normalize_text
 from ._simple_encryptor import SimpleEncryptor
 
 
@@ -51,7 +54,11 @@ class HomophonicSubstitution(SimpleEncryptor):
     "SAUL HUDSON"
     """
 
-    def __init__(self, key: int | str) -> None:
+    _special_chars = re.compile('[^A-Za-z ]')
+    _escaped_chars = re.compile('\0(.)', re.S)
+    _homophone_index_table = bytes(i % 3 for i in range(256))
+
+    def __init__(self, key: int | str, unicode_folding: bool = False) -> None:
         """
         Initializes the Homophonic Substitution cipher with the given key.
 
@@ -59,16 +66,32 @@ class HomophonicSubstitution(SimpleEncryptor):
         ----------
         key : int | str
             The key for encryption and decryption.
+        unicode_folding : bool, optional
+            If True, the text to be encrypted is also folded with the Unicode NFKD
+            normalization instead of only having its accents replaced, by default False.
+
+        Raises
+        ------
+        ValueError
+            If the key is not an int or str or the unicode_folding is not a bool.
         """
 
         self._validate_key(key)
+        self._validate_unicode_folding(unicode_folding)
+        self._unicode_folding = unicode_folding
         self._alphabet = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
         self._substitution_dict = self._create_substitution_dict(key)
+        self._homophone_tables = self._create_homophone_tables()
+        self._decryption_table = self._create_decryption_table()
 
     def _validate_key(self, key: int | str) -> None:
         if not isinstance(key, (int, str)):
             raise ValueError('The given value must be an int or str.')
 
+    def _validate_unicode_folding(self, unicode_folding: bool) -> None:
+        if not isinstance(unicode_folding, bool):
+            raise ValueError('The unicode_folding must be a bool.')
+
     def _create_substitution_dict(self, key: int | str) -> dict[str, list]:
         substitute_chars = [chr(i) for i in range(33, 127)]
 
@@ -88,6 +111,40 @@ class HomophonicSubstitution(SimpleEncryptor):
 
         return substitution_dict
 
+    def _create_homophone_tables(self) -> list[dict[int, str]]:
+        homophone_tables = []
+
+        for i in range(3):
+            homophone_table = {}
+
+            for char, substitute_chars in self._substitution_dict.items():
+                homophone_table[ord(char)] = substitute_chars[i]
+                homophone_table[ord(char.lower())] = substitute_chars[i]
+
+            homophone_tables.append(homophone_table)
+
+        return homophone_tables
+
+    def _create_decryption_table(self) -> dict[int, str | None]:
+        decryption_table = {ord('\0'): None}
+
+        for char, substitute_chars in self._substitution_dict.items():
+            for substitute_char in substitute_chars:
+                decryption_table[ord(substitute_char)] = char
+
+        return decryption_table
+
+    def _draw_homophone_indices(self, size: int) -> bytes:
+        random_generator = random.Random()
+
+        homophone_indices = b''
+
+        while len(homophone_indices) < size:
+            random_bytes = random_generator.randbytes(size - len(homophone_indices))
+            homophone_indices += random_bytes.translate(self._homophone_index_table, b'\xff')
+
+        return homophone_indices
+
     def encrypt(self, text: str) -> str:
         """
         Encrypts the input text using the Homophonic Substitution cipher.
@@ -122,51 +179,24 @@ class HomophonicSubstitution(SimpleEncryptor):
 
         handled_text = self._handle_text(text)
 
-        encrypted_text = ''
+        return self._encrypt_normalized(handled_text)
 
-        random_generator = random.Random()
+    def _encrypt_normalized(self, text: str) -> str:
+        escaped_text = self._special_chars.sub('\0\\g<0>', text)
 
-        for char in handled_text:
-            for original, substitute_chars in self._substitution_dict.items():
-                if char.upper() == original:
-                    encrypted_text += random_generator.choice(substitute_chars)
-                    break
-            else:
-                encrypted_text += char
+        homophone_candidates = zip(
+            *(escaped_text.translate(homophone_table) for homophone_table in self._homophone_tables)
+        )
+        homophone_indices = self._draw_homophone_indices(len(escaped_text))
 
-        return encrypted_text
+        return ''.join(map(operator.getitem, homophone_candidates, homophone_indices))
 
     def _validate_text(self, text: str) -> None:
         if not isinstance(text, str):
             raise ValueError('The given value must be a str.')
 
     def _handle_text(self, text: str) -> str:
-        handled_text = text.strip()
-
-        substitute_letters = {
-            'A': ('Á', 'À', 'Ã', 'Â', 'Ä'),
-            'E': ('É', 'È', 'Ê', 'Ë'),
-            'I': ('Í', 'Ì', 'Î', 'Ï'),
-            'O': ('Ò', 'Ó', 'Ô', 'Õ', 'Ö'),
-            'U': ('Ú', 'Ù', 'Û', 'Ü'),
-            'C': ('Ç',),
-        }
-
-        for key, letters in substitute_letters.items():
-            for letter in letters:
-                if letter in handled_text.upper():
-                    handled_text = handled_text.replace(letter, key)
-                    handled_text = handled_text.replace(letter.lower(), key.lower())
-
-        prepared_text = ''
-
-        for char in handled_text:
-            if char != ' ' and char.upper() not in self._alphabet:
-                prepared_text += f'\0{char}'
-            else:
-                prepared_text += char
-
-        return prepared_text
+        return normalize_text(text.strip(), self._unicode_folding)
 
     def decrypt(self, cipher_text: str) -> str:
         """
@@ -195,27 +225,13 @@ class HomophonicSubstitution(SimpleEncryptor):
 
         handled_cipher_text = self._handle_cipher_text(cipher_text)
 
-        decrypted_text = ''
-
-        is_special_char = False
-
-        for char in handled_cipher_text:
-            for original, substitute_chars in self._substitution_dict.items():
-                if is_special_char:
-                    decrypted_text += char
-                    is_special_char = False
-                    break
+        return self._decrypt_normalized(handled_cipher_text)
 
-                if char in substitute_chars:
-                    decrypted_text += original
-                    break
-            else:
-                if char == '\0':
-                    is_special_char = True
-                else:
-                    decrypted_text += char
+    def _decrypt_normalized(self, cipher_text: str) -> str:
+        text_pieces = self._escaped_chars.split(cipher_text)
+        text_pieces[::2] = [piece.translate(self._decryption_table) for piece in text_pieces[::2]]
 
-        return decrypted_text
+        return ''.join(text_pieces)
 
     def _handle_cipher_text(self, cipher_text: str) -> str:
         return cipher_text.strip()
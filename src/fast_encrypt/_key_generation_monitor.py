@@ -0,0 +1,88 @@
+"""
+Defines a class for tracking the deadline, cancellation and progress of a key generation.
+"""
+
+import time
+from typing import Any, Callable
+
+from ._exceptions import KeyGenerationCancelledError, KeyGenerationTimeoutError
+
+
+class KeyGenerationMonitor:
+    """
+    Class for tracking the deadline, cancellation and progress of a key generation.
+
+    Methods
+    -------
+    is_interrupted() -> bool:
+        Returns whether the deadline passed or the cancel event is set.
+
+    raise_if_interrupted() -> None:
+        Raises the error of the interruption, if any.
+
+    report(tested_qty: int) -> None:
+        Adds the tested candidates and calls the progress callback.
+
+    poll_interval() -> float | None:
+        Returns how long to wait for workers before checking for interruptions.
+    """
+
+    _cancel_poll_interval = 0.05
+
+    def __init__(
+        self,
+        timeout: float | None = None,
+        cancel_event: Any = None,
+        on_progress: Callable[[int, float], Any] | None = None,
+    ) -> None:
+        """
+        Initializes the monitor and starts its clock.
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            The seconds the key generation may take, by default None (no limit).
+        cancel_event : Any, optional
+            An event (with an `is_set` method) that cancels the key generation,
+            by default None.
+        on_progress : Callable[[int, float], Any] | None, optional
+            Called with the number of candidates tested so far and the elapsed
+            seconds, by default None.
+        """
+
+        self._timeout = timeout
+        self._cancel_event = cancel_event
+        self._on_progress = on_progress
+        self._start_time = time.monotonic()
+        self._deadline = self._start_time + timeout if timeout is not None else None
+        self._tested_qty = 0
+
+    def is_interrupted(self) -> bool:
+        if self._cancel_event is not None and self._cancel_event.is_set():
+            return True
+
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def raise_if_interrupted(self) -> None:
+        if self._cancel_event is not None and self._cancel_event.is_set():
+            raise KeyGenerationCancelledError('The key generation was cancelled.')
+
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            raise KeyGenerationTimeoutError(
+                f'The key generation took more than {self._timeout} seconds.'
+            )
+
+    def report(self, tested_qty: int) -> None:
+        self._tested_qty += tested_qty
+
+        if self._on_progress is not None:
+            self._on_progress(self._tested_qty, time.monotonic() - self._start_time)
+
+    def poll_interval(self) -> float | None:
+        poll_interval = self._cancel_poll_interval if self._cancel_event is not None else None
+
+        if self._deadline is not None:
+            remaining_time = max(self._deadline - time.monotonic(), 0)
+            poll_interval = min(poll_interval or remaining_time, remaining_time)
+
+        return poll_interval
@@ -0,0 +1,104 @@
+"""
+Defines the compact binary format of the RSA keys.
+
+A serialized key starts with the `b'FK'` magic bytes, a version byte, a
+key kind byte and the 2-byte big-endian quantity of numbers, followed by
+each number as its 4-byte big-endian byte length and its big-endian bytes.
+"""
+
+import struct
+
+_format_magic = b'FK'
+_format_version = 1
+_format_header = struct.Struct('>BBH')
+_number_length = struct.Struct('>I')
+
+public_key_kind = 0
+private_key_kind = 1
+
+
+def pack_key_numbers(kind: int, numbers: tuple[int, ...]) -> bytes:
+    """
+    Packs the numbers of a key in its compact binary format.
+
+    Parameters
+    ----------
+    kind : int
+        The key kind (`public_key_kind` or `private_key_kind`).
+    numbers : tuple[int, ...]
+        The non-negative numbers of the key.
+
+    Returns
+    -------
+    bytes
+        The serialized key.
+    """
+
+    parts = [_format_magic, _format_header.pack(_format_version, kind, len(numbers))]
+
+    for number in numbers:
+        number_bytes = number.to_bytes((number.bit_length() + 7) // 8, 'big')
+        parts.append(_number_length.pack(len(number_bytes)))
+        parts.append(number_bytes)
+
+    return b''.join(parts)
+
+
+def unpack_key_numbers(data: bytes, kind: int) -> tuple[int, ...]:
+    """
+    Unpacks the numbers of a key from its compact binary format.
+
+    Parameters
+    ----------
+    data : bytes
+        The serialized key.
+    kind : int
+        The expected key kind (`public_key_kind` or `private_key_kind`).
+
+    Returns
+    -------
+    tuple[int, ...]
+        The numbers of the key.
+
+    Raises
+    ------
+    ValueError
+        If the data is not a serialized key of the given kind.
+    """
+
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        raise ValueError('The given value must be bytes.')
+
+    data = memoryview(data)
+    offset = len(_format_magic) + _format_header.size
+
+    if bytes(data[: len(_format_magic)]) != _format_magic or len(data) < offset:
+        raise ValueError('The given value is not a valid key.')
+
+    version, data_kind, numbers_qty = _format_header.unpack_from(data, len(_format_magic))
+
+    if version != _format_version:
+        raise ValueError(f'The key format version {version} is not supported.')
+
+    if data_kind != kind:
+        raise ValueError('The given value is not a valid key.')
+
+    numbers = []
+
+    try:
+        for _ in range(numbers_qty):
+            (length,) = _number_length.unpack_from(data, offset)
+            offset += _number_length.size
+
+            if offset + length > len(data):
+                raise ValueError('The given value is not a valid key.')
+
+            numbers.append(int.from_bytes(data[offset : offset + length], 'big'))
+            offset += length
+    except struct.error:
+        raise ValueError('The given value is not a valid key.') from None
+
+    if offset != len(data):
+        raise ValueError('The given value is not a valid key.')
+
+    return tuple(numbers)
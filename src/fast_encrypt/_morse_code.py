@@ -2,6 +2,7 @@
 Defines a class for encrypting and decrypting text using Morse code.
 """
 
+from ._normalization import normalize_text
 from ._simple_encryptor import SimpleEncryptor
 
 
@@ -82,6 +83,31 @@ class MorseCode(SimpleEncryptor):
         '0': '-----',
     }
 
+    _morse_chars = {m_code: char for char, m_code in _chars_morse.items()}
+
+    def __init__(self, unicode_folding: bool = False) -> None:
+        """
+        Initializes the Morse code.
+
+        Parameters
+        ----------
+        unicode_folding : bool, optional
+            If True, the text to be encrypted is also folded with the Unicode NFKD
+            normalization instead of only having its accents replaced, by default False.
+
+        Raises
+        ------
+        ValueError
+            If the unicode_folding is not a bool.
+        """
+
+        self._validate_unicode_folding(unicode_folding)
+        self._unicode_folding = unicode_folding
+
+    def _validate_unicode_folding(self, unicode_folding: bool) -> None:
+        if not isinstance(unicode_folding, bool):
+            raise ValueError('The unicode_folding must be a bool.')
+
     def encrypt(self, text: str) -> str:
         """
         Encrypts the input text using Morse code.
@@ -107,52 +133,32 @@ class MorseCode(SimpleEncryptor):
 
         self._validate_text(text)
 
-        encrypted_text = self._handle_text(text)
-
-        for char, m_code in self._chars_morse.items():
-            if char in encrypted_text:
-                encrypted_text = encrypted_text.replace(char, m_code)
-
-        return encrypted_text
-
-    def _validate_text(self, text: str) -> None:
-        if not isinstance(text, str):
-            raise ValueError('The given value must be a str.')
-
-    def _handle_text(self, text: str) -> str:
-        handled_text = text.strip().upper().replace(' ', '')
+        handled_text = self._handle_text(text)
 
-        substitute_letters = {
-            'A': ('Á', 'À', 'Ã', 'Â', 'Ä'),
-            'E': ('É', 'È', 'Ê', 'Ë'),
-            'I': ('Í', 'Ì', 'Î', 'Ï'),
-            'O': ('Ò', 'Ó', 'Ô', 'Õ', 'Ö'),
-            'U': ('Ú', 'Ù', 'Û', 'Ü'),
-            'C': ('Ç',),
-        }
+        return self._encrypt_normalized(handled_text)
 
-        for key, letters in substitute_letters.items():
-            for letter in letters:
-                if letter in handled_text:
-                    handled_text = handled_text.replace(letter, key)
+    def _encrypt_normalized(self, text: str) -> str:
+        m_codes = map(self._chars_morse.get, text.upper())
 
-        chars = list(handled_text)
+        return ' '.join(filter(None, m_codes))
 
-        i = 0
+    def _encrypt_stream_chunk(self, text: str, state: dict) -> str:
+        m_code = self._encrypt_normalized(text)
 
-        while True:
-            if i == len(chars):
-                break
+        # The codes of two chunks are separated by a space, as the codes of a chunk.
+        if m_code and state.get('has_m_codes'):
+            m_code = ' ' + m_code
 
-            if chars[i] not in self._chars_morse:
-                chars.pop(i)
-                continue
+        state['has_m_codes'] = state.get('has_m_codes', False) or bool(m_code)
 
-            i += 1
+        return m_code
 
-        handled_text = ' '.join(chars)
+    def _validate_text(self, text: str) -> None:
+        if not isinstance(text, str):
+            raise ValueError('The given value must be a str.')
 
-        return handled_text
+    def _handle_text(self, text: str) -> str:
+        return normalize_text(text.strip(), self._unicode_folding)
 
     def decrypt(self, cipher_text: str) -> str:
         """
@@ -177,30 +183,19 @@ class MorseCode(SimpleEncryptor):
         "JIMIHENDRIX"
         """
 
-        self._validate_cipher_text(cipher_text)
+        self._validate_text(cipher_text)
 
         handled_m_code = self._handle_cipher_text(cipher_text)
 
-        chars = handled_m_code.split()
-
-        for i, m_char in enumerate(chars):
-            for char, m_code in self._chars_morse.items():
-                if m_char == m_code:
-                    chars[i] = char
-
-        decrypted_m_code = ''.join(chars)
-
-        return decrypted_m_code
-
-    def _validate_cipher_text(self, cipher_text: str) -> None:
-        if not isinstance(cipher_text, str):
-            raise ValueError('The given value must be a str.')
+        return self._decrypt_normalized(handled_m_code)
 
-        m_c_chars = cipher_text.strip().split()
+    def _decrypt_normalized(self, cipher_text: str) -> str:
+        m_codes = cipher_text.split()
 
-        for char in m_c_chars:
-            if char not in self._chars_morse.values():
-                raise ValueError('The given value has invalid morse chars.')
+        try:
+            return ''.join(map(self._morse_chars.__getitem__, m_codes))
+        except KeyError:
+            raise ValueError('The given value has invalid morse chars.') from None
 
     def _handle_cipher_text(self, cipher_text: str) -> str:
         return cipher_text.strip()
@@ -0,0 +1,71 @@
+"""
+Defines the accent normalization shared by the encryptors.
+"""
+
+import unicodedata
+
+_substitute_letters = {
+    'A': ('Á', 'À', 'Ã', 'Â', 'Ä'),
+    'E': ('É', 'È', 'Ê', 'Ë'),
+    'I': ('Í', 'Ì', 'Î', 'Ï'),
+    'O': ('Ò', 'Ó', 'Ô', 'Õ', 'Ö'),
+    'U': ('Ú', 'Ù', 'Û', 'Ü'),
+    'C': ('Ç',),
+}
+
+
+def _create_accents_table() -> dict[int, str]:
+    accents_table = {}
+
+    for key, letters in _substitute_letters.items():
+        for letter in letters:
+            accents_table[ord(letter)] = key
+            accents_table[ord(letter.lower())] = key.lower()
+
+    return accents_table
+
+
+class _UnicodeFoldingTable(dict):
+    """
+    Translation table that folds each code point with NFKD on its first lookup.
+
+    The folded value (the decomposed char without its combining marks) is
+    cached, so every code point is decomposed at most once per process.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        decomposed_char = unicodedata.normalize('NFKD', chr(codepoint))
+        folded_char = ''.join(char for char in decomposed_char if not unicodedata.combining(char))
+
+        self[codepoint] = folded_char
+
+        return folded_char
+
+
+_accents_table = _create_accents_table()
+_unicode_folding_table = _UnicodeFoldingTable(_accents_table)
+
+
+def normalize_text(text: str, unicode_folding: bool = False) -> str:
+    """
+    Replaces the accented letters of the text by their unaccented versions.
+
+    Parameters
+    ----------
+    text : str
+        The text to be normalized.
+    unicode_folding : bool, optional
+        If True, every char is also folded with the Unicode NFKD
+        normalization (e.g. `"ñ"` becomes `"n"` and `"²"` becomes `"2"`),
+        by default False.
+
+    Returns
+    -------
+    str
+        The normalized text.
+    """
+
+    if unicode_folding:
+        return text.translate(_unicode_folding_table)
+
+    return text.translate(_accents_table)
@@ -2,9 +2,22 @@
 Defines a class for creating a pipeline of encryption and decryption steps.
 """
 
+import concurrent.futures
+import itertools
+import math
+import multiprocessing
+import queue
+import threading
+from typing import IO, Callable, Iterable, Iterator
+
+from ._atbash import Atbash
+from ._caesars_cipher import CaesarsCipher
 from ._homophonic_substitution import HomophonicSubstitution
 from ._morse_code import MorseCode
+from ._normalization import normalize_text
 from ._simple_encryptor import SimpleEncryptor
+from ._substitution import Substitution
+from ._vigenere import Vigenere
 
 
 class Pipeline:
@@ -19,6 +32,18 @@ class Pipeline:
     decrypt(text: str) -> str:
         Decrypts the input text using the pipeline of reverse decryption steps.
 
+    encrypt_stream(reader: IO[str], writer: IO[str], chunk_size: int = 65536, queue_size: int = 4) -> int:
+        Encrypts a text read from a stream, with each step running as its own process stage.
+
+    encrypt_many(texts: Iterable[str], workers: int | None = None, chunk_size: int = 256, ordered: bool = True) -> list[str]:
+        Encrypts many texts in parallel processes.
+
+    decrypt_many(cipher_texts: Iterable[str], workers: int | None = None, chunk_size: int = 256, ordered: bool = True) -> list[str]:
+        Decrypts many cipher texts in parallel processes.
+
+    compile() -> list[str]:
+        Fuses the adjacent letter permutation and shift steps and returns the plan.
+
     Examples
     --------
     Encrypting a text using a pipeline:
@@ -53,8 +78,13 @@ class Pipeline:
             If the steps list is not valid.
         """
 
+        self._alphabet = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+        self._max_fused_key_period = 1024
+
         self._validate_steps(steps)
         self._steps = steps
+        self._compiled_steps = steps
+        self._unicode_folding = self._find_shared_unicode_folding()
 
     def _validate_steps(self, steps: list[SimpleEncryptor]) -> None:
         if not isinstance(steps, list):
@@ -87,10 +117,25 @@ class Pipeline:
                 'The list cannot contain a HomophonicSubstitution and a MorseCode at the same time.'
             )
 
+    def _find_shared_unicode_folding(self) -> bool | None:
+        # The built-in steps keep their output stripped and normalized, so when all
+        # of them share the folding the text only needs to be handled once. A
+        # custom step may not, so it falls back to handling the text in each step.
+        unicode_foldings = {getattr(step, '_unicode_folding', None) for step in self._steps}
+
+        if len(unicode_foldings) != 1:
+            return None
+
+        return unicode_foldings.pop()
+
     def encrypt(self, text: str):
         """
         Encrypts the input text using the pipeline of encryption steps.
 
+        When all the steps share the same `unicode_folding`, the text is
+        validated, stripped and normalized once for the whole pipeline
+        instead of once per step.
+
         Parameters
         ----------
         text : str
@@ -110,9 +155,22 @@ class Pipeline:
         ".-- ...- - ..- .-. -- ...- ..- .... ..- ...- --. ... .-.. ..."
         """
 
+        if self._unicode_folding is None:
+            return self._encrypt_in_each_step(text)
+
+        self._validate_text(text)
+
+        encrypted_text = normalize_text(text.strip(), self._unicode_folding)
+
+        for step in self._compiled_steps:
+            encrypted_text = step._encrypt_normalized(encrypted_text)
+
+        return encrypted_text
+
+    def _encrypt_in_each_step(self, text: str) -> str:
         encrypted_text = ''
 
-        for i, step in enumerate(self._steps):
+        for i, step in enumerate(self._compiled_steps):
             if i == 0:
                 encrypted_text = step.encrypt(text)
             else:
@@ -120,10 +178,18 @@ class Pipeline:
 
         return encrypted_text
 
+    def _validate_text(self, text: str) -> None:
+        if not isinstance(text, str):
+            raise ValueError('The given value must be a str.')
+
     def decrypt(self, text: str):
         """
         Decrypts the input text using the pipeline of reverse decryption steps.
 
+        When all the steps share the same `unicode_folding`, the text is
+        validated and stripped once for the whole pipeline instead of once
+        per step.
+
         Parameters
         ----------
         text : str
@@ -143,9 +209,22 @@ class Pipeline:
         "JOSHKLINGHOFFER"
         """
 
+        if self._unicode_folding is None:
+            return self._decrypt_in_each_step(text)
+
+        self._validate_text(text)
+
+        decrypted_text = text.strip()
+
+        for step in reversed(self._compiled_steps):
+            decrypted_text = step._decrypt_normalized(decrypted_text)
+
+        return decrypted_text
+
+    def _decrypt_in_each_step(self, text: str) -> str:
         decrypted_text = ''
 
-        reverse_steps = self._steps.copy()
+        reverse_steps = self._compiled_steps.copy()
         reverse_steps.reverse()
 
         for i, step in enumerate(reverse_steps):
@@ -155,3 +234,674 @@ class Pipeline:
                 decrypted_text = step.decrypt(decrypted_text)
 
         return decrypted_text
+
+    def encrypt_stream(
+        self, reader: IO[str], writer: IO[str], chunk_size: int = 65536, queue_size: int = 4
+    ) -> int:
+        """
+        Encrypts a text read from a stream, with each step running as its own process stage.
+
+        The text is read in chunks of `chunk_size` chars. Each step runs in
+        its own process and the chunks flow between the steps over queues
+        bounded by `queue_size`, so the steps encrypt different chunks at the
+        same time, a slow step holds back the steps before it and the memory
+        use doesn't depend on the text size. For a large text, the throughput
+        approaches the one of the slowest step. What a step needs from the
+        previous chunks, such as the `Vigenere` key index or the separator
+        between `MorseCode` codes, is kept in its process and carried across
+        chunks, so the cipher text is the same as the one of `encrypt`.
+
+        Parameters
+        ----------
+        reader : IO[str]
+            A text file-like object with the plaintext.
+        writer : IO[str]
+            A text file-like object where the cipher text is written.
+        chunk_size : int, optional
+            The number of chars read at once, by default 65536.
+        queue_size : int, optional
+            The number of chunks each queue between the steps can hold, by
+            default 4.
+
+        Returns
+        -------
+        int
+            The number of chars written.
+
+        Raises
+        ------
+        ValueError
+            If any parameter is not valid or if the pipeline has a step that
+            is not one of the encryptors of this library. The cipher text
+            written before the error is kept.
+
+        Examples
+        --------
+        >>> pipeline = Pipeline([CaesarsCipher(3), Vigenere('KEY'), MorseCode()])
+        >>> with open('plain.txt') as reader, open('cipher.txt', 'w') as writer:
+        ...     pipeline.encrypt_stream(reader, writer)
+        44
+        """
+
+        self._validate_streamable_steps()
+        self._validate_size(chunk_size, 'chunk_size')
+        self._validate_size(queue_size, 'queue_size')
+
+        if not self._compiled_steps:
+            return 0
+
+        queues = [multiprocessing.Queue(queue_size) for _ in range(len(self._compiled_steps) + 1)]
+
+        # When the steps share the folding, the first stage normalizes the text
+        # for all of them, otherwise each one normalizes its own input.
+        if self._unicode_folding is None:
+            unicode_foldings = [step._unicode_folding for step in self._compiled_steps]
+        else:
+            unicode_foldings = [self._unicode_folding] + [None] * (len(self._compiled_steps) - 1)
+
+        processes = [
+            multiprocessing.Process(
+                target=_run_stream_stage,
+                args=(step, unicode_folding, queues[i], queues[i + 1]),
+                daemon=True,
+            )
+            for i, (step, unicode_folding) in enumerate(zip(self._compiled_steps, unicode_foldings))
+        ]
+
+        # The processes are started before the reading thread, so none of them
+        # is forked while a thread holds a lock.
+        for process in processes:
+            process.start()
+
+        stop_event = threading.Event()
+        abort_event = threading.Event()
+        reading_thread = threading.Thread(
+            target=self._read_stream_stage,
+            args=(reader, chunk_size, queues[0], stop_event, abort_event),
+            daemon=True,
+        )
+        reading_thread.start()
+
+        try:
+            written, error = self._write_stream_stage(writer, queues[-1], processes, stop_event)
+        except BaseException:
+            # A stage process exited or the caller was interrupted, so the other
+            # stages and the reading thread may be blocked on the queues.
+            abort_event.set()
+
+            for process in processes:
+                process.terminate()
+
+            for stream_queue in queues:
+                stream_queue.cancel_join_thread()
+
+            raise
+        finally:
+            reading_thread.join()
+
+            for process in processes:
+                process.join()
+
+        if error is not None:
+            raise error
+
+        return written
+
+    def _read_stream_stage(
+        self,
+        reader: IO[str],
+        chunk_size: int,
+        output_queue: multiprocessing.Queue,
+        stop_event: threading.Event,
+        abort_event: threading.Event,
+    ) -> None:
+        try:
+            for chunk in self._strip_stream_chunks(self._read_stream_chunks(reader, chunk_size)):
+                if stop_event.is_set() or not self._put_stream_chunk(
+                    output_queue, chunk, abort_event
+                ):
+                    break
+        except Exception as error:
+            self._put_stream_chunk(output_queue, error, abort_event)
+        finally:
+            self._put_stream_chunk(output_queue, None, abort_event)
+
+    def _put_stream_chunk(
+        self,
+        output_queue: multiprocessing.Queue,
+        chunk: str | Exception | None,
+        abort_event: threading.Event,
+    ) -> bool:
+        while not abort_event.is_set():
+            try:
+                output_queue.put(chunk, timeout=0.1)
+            except queue.Full:
+                continue
+
+            return True
+
+        return False
+
+    def _write_stream_stage(
+        self,
+        writer: IO[str],
+        input_queue: multiprocessing.Queue,
+        processes: list[multiprocessing.Process],
+        stop_event: threading.Event,
+    ) -> tuple[int, Exception | None]:
+        error = None
+        written = 0
+
+        # After an error the queue is still drained up to the end of the stream,
+        # so no stage blocks on a full queue.
+        while (chunk := self._get_stream_chunk(input_queue, processes)) is not None:
+            if error is not None:
+                continue
+
+            if isinstance(chunk, Exception):
+                error = chunk
+                continue
+
+            try:
+                writer.write(chunk)
+            except Exception as write_error:
+                error = write_error
+                stop_event.set()
+                continue
+
+            written += len(chunk)
+
+        return written, error
+
+    def _get_stream_chunk(
+        self, input_queue: multiprocessing.Queue, processes: list[multiprocessing.Process]
+    ) -> str | Exception | None:
+        while True:
+            try:
+                return input_queue.get(timeout=0.1)
+            except queue.Empty:
+                if any(process.exitcode not in (None, 0) for process in processes):
+                    raise RuntimeError('A stream stage process exited unexpectedly.') from None
+
+    def _validate_streamable_steps(self) -> None:
+        for step in self._steps:
+            if not hasattr(step, '_unicode_folding'):
+                raise ValueError('The steps must be encryptors of fast_encrypt to be streamed.')
+
+    def _validate_size(self, size: int, name: str) -> None:
+        if not isinstance(size, int) or isinstance(size, bool):
+            raise ValueError(f'The {name} must be a int.')
+
+        if size < 1:
+            raise ValueError(f'The {name} must be >= 1.')
+
+    def _read_stream_chunks(self, reader: IO[str], chunk_size: int) -> Iterator[str]:
+        while chunk := reader.read(chunk_size):
+            if not isinstance(chunk, str):
+                raise ValueError('The given reader must read str.')
+
+            yield chunk
+
+    def _strip_stream_chunks(self, chunks: Iterator[str]) -> Iterator[str]:
+        for first_chunk in chunks:
+            first_chunk = first_chunk.lstrip()
+
+            if first_chunk:
+                break
+        else:
+            return
+
+        whitespace = ''
+
+        # The trailing whitespace of a chunk is held back until a non-whitespace
+        # char follows it, so the whitespace at the end of the text is dropped.
+        for chunk in itertools.chain((first_chunk,), chunks):
+            chunk = whitespace + chunk
+            stripped_chunk = chunk.rstrip()
+            whitespace = chunk[len(stripped_chunk) :]
+
+            if stripped_chunk:
+                yield stripped_chunk
+
+    def encrypt_many(
+        self,
+        texts: Iterable[str],
+        workers: int | None = None,
+        chunk_size: int = 256,
+        ordered: bool = True,
+    ) -> list[str]:
+        """
+        Encrypts many texts in parallel processes.
+
+        `encrypt` only uses one core. This method sends the pipeline to each
+        worker process once and spreads the texts across them in batches of
+        `chunk_size`, so the inter-process cost of short texts is shared by
+        the whole batch.
+
+        Parameters
+        ----------
+        texts : Iterable[str]
+            The texts to be encrypted.
+        workers : int | None, optional
+            The number of worker processes, by default None (the number of
+            CPUs). 1 encrypts in the current process.
+        chunk_size : int, optional
+            The number of texts sent to a worker at once, by default 256.
+        ordered : bool, optional
+            If True, the cipher texts are returned in the order of the given
+            texts, by default True. If False, the batches are returned as soon
+            as they are encrypted, so a slow batch doesn't hold back the others.
+
+        Returns
+        -------
+        list[str]
+            The encrypted cipher texts.
+
+        Raises
+        ------
+        ValueError
+            If any parameter or text is not valid.
+
+        Examples
+        --------
+        >>> pipeline = Pipeline([CaesarsCipher(3), Vigenere('KEY'), MorseCode()])
+        >>> cipher_texts = pipeline.encrypt_many(['Hello', 'World!'], workers=4)
+        """
+
+        texts = list(texts)
+
+        for text in texts:
+            self._validate_text(text)
+
+        return self._map_in_processes('encrypt', texts, workers, chunk_size, ordered)
+
+    def decrypt_many(
+        self,
+        cipher_texts: Iterable[str],
+        workers: int | None = None,
+        chunk_size: int = 256,
+        ordered: bool = True,
+    ) -> list[str]:
+        """
+        Decrypts many cipher texts in parallel processes.
+
+        Parameters
+        ----------
+        cipher_texts : Iterable[str]
+            The cipher texts to be decrypted.
+        workers : int | None, optional
+            The number of worker processes, by default None (the number of
+            CPUs). 1 decrypts in the current process.
+        chunk_size : int, optional
+            The number of cipher texts sent to a worker at once, by default 256.
+        ordered : bool, optional
+            If True, the plaintexts are returned in the order of the given
+            cipher texts, by default True. See `encrypt_many`.
+
+        Returns
+        -------
+        list[str]
+            The decrypted plaintexts.
+
+        Raises
+        ------
+        ValueError
+            If any parameter or cipher text is not valid.
+
+        Examples
+        --------
+        >>> pipeline.decrypt_many(cipher_texts, workers=4)
+        ['HELLO', 'WORLD']
+        """
+
+        cipher_texts = list(cipher_texts)
+
+        for cipher_text in cipher_texts:
+            self._validate_text(cipher_text)
+
+        return self._map_in_processes('decrypt', cipher_texts, workers, chunk_size, ordered)
+
+    def _validate_ordered(self, ordered: bool) -> None:
+        if not isinstance(ordered, bool):
+            raise ValueError('The ordered must be a bool.')
+
+    def _map_in_processes(
+        self,
+        method_name: str,
+        items: list[str],
+        workers: int | None,
+        chunk_size: int,
+        ordered: bool,
+    ) -> list[str]:
+        if workers is not None:
+            self._validate_size(workers, 'workers')
+
+        self._validate_size(chunk_size, 'chunk_size')
+        self._validate_ordered(ordered)
+
+        if workers == 1 or len(items) <= 1:
+            method = getattr(self, method_name)
+
+            return [method(item) for item in items]
+
+        batches = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+        # The pipeline goes through the initializer, so each worker receives it
+        # once instead of with every batch of items.
+        with concurrent.futures.ProcessPoolExecutor(
+            workers, initializer=_init_bulk_worker, initargs=(self, method_name)
+        ) as executor:
+            if ordered:
+                batch_results = executor.map(_run_bulk_batch, batches)
+            else:
+                futures = [executor.submit(_run_bulk_batch, batch) for batch in batches]
+                batch_results = (
+                    future.result() for future in concurrent.futures.as_completed(futures)
+                )
+
+            return list(itertools.chain.from_iterable(batch_results))
+
+    def compile(self) -> list[str]:
+        """
+        Fuses the adjacent letter permutation and shift steps and returns the plan.
+
+        Each run of adjacent `CaesarsCipher`, `Atbash` and `Substitution`
+        steps is a single permutation of the alphabet, so it is replaced by
+        one `Substitution` with the composed key. Each run of adjacent
+        `CaesarsCipher` and `Vigenere` steps is a single periodic shift, so
+        it is replaced by one `Vigenere` whose key period is the LCM of the
+        key lengths, with the shifts of each position summed. A run that
+        composes to the identity (such as `Atbash` followed by `Atbash`) is
+        dropped when the built-in steps around it already strip and normalize
+        the text, and kept as an identity step otherwise. Since
+        `Atbash.decrypt` normalizes the accents of the cipher text, a run is
+        only fused up to its last `Atbash`, unless the pipeline ends with a
+        `MorseCode`. The text is then stripped, normalized and shifted once
+        per run instead of once per step, and the pipeline returns the same
+        texts. Only the steps with the same `unicode_folding` are fused, and
+        a `Vigenere` is only fused while the key period stays up to 1024, so
+        keys of coprime lengths are split into several fused steps.
+
+        Returns
+        -------
+        list[str]
+            The steps run by `encrypt` and `decrypt`, where each fused step
+            lists the steps it replaces.
+
+        Examples
+        --------
+        >>> pipeline = Pipeline([Atbash(), CaesarsCipher(3), Atbash(), MorseCode()])
+        >>> pipeline.compile()
+        ['Substitution(Atbash, CaesarsCipher, Atbash)', 'MorseCode']
+        >>> Pipeline([CaesarsCipher(3), Vigenere('KEY'), Vigenere('AB')]).compile()
+        ['Vigenere(CaesarsCipher, Vigenere, Vigenere)']
+        >>> Pipeline([Atbash(), Atbash(), MorseCode()]).compile()
+        ['MorseCode']
+        """
+
+        compiled_steps = []
+        plan = []
+        end = 0
+
+        for run in self._split_fusable_runs():
+            end += len(run)
+
+            if len(run) == 1 or not self._is_fusable_step(run[0]):
+                compiled_steps.extend(run)
+                plan.extend(type(step).__name__ for step in run)
+            else:
+                if any(isinstance(step, Vigenere) for step in run):
+                    fused_step = self._fuse_shift_run(run, end, compiled_steps)
+                else:
+                    fused_step = self._fuse_permutation_run(run, end, compiled_steps)
+
+                if fused_step is not None:
+                    fused_name = 'Vigenere' if isinstance(fused_step, Vigenere) else 'Substitution'
+
+                    compiled_steps.append(fused_step)
+                    plan.append(f'{fused_name}({", ".join(type(step).__name__ for step in run)})')
+
+        self._compiled_steps = compiled_steps
+
+        return plan
+
+    def _is_fusable_step(self, step: SimpleEncryptor) -> bool:
+        return isinstance(step, (CaesarsCipher, Atbash, Substitution, Vigenere))
+
+    def _split_fusable_runs(self) -> list[list[SimpleEncryptor]]:
+        runs = []
+
+        # The steps of a run must share the folding, otherwise the letters folded
+        # in the middle of the run would skip the steps before them. A CaesarsCipher
+        # fits both kinds of run, while an Atbash or a Substitution never joins a
+        # Vigenere, as a permutation and a periodic shift don't compose into either.
+        # A Vigenere only joins a run while the fused key period stays bounded.
+        for step in self._steps:
+            if (
+                runs
+                and self._is_fusable_step(step)
+                and self._is_fusable_step(runs[-1][0])
+                and step._unicode_folding == runs[-1][0]._unicode_folding
+                and self._is_same_run_kind(runs[-1], step)
+            ):
+                runs[-1].append(step)
+            else:
+                runs.append([step])
+
+        split_runs = []
+        end = 0
+
+        for run in runs:
+            end += len(run)
+            split_runs.extend(self._split_after_last_atbash(run, end))
+
+        return split_runs
+
+    def _is_same_run_kind(self, run: list[SimpleEncryptor], step: SimpleEncryptor) -> bool:
+        if isinstance(step, CaesarsCipher):
+            return True
+
+        is_shift_run = any(isinstance(run_step, Vigenere) for run_step in run)
+        is_permutation_run = any(isinstance(run_step, (Atbash, Substitution)) for run_step in run)
+
+        if isinstance(step, Vigenere):
+            return (
+                not is_permutation_run
+                and self._fused_key_period([*run, step]) <= self._max_fused_key_period
+            )
+
+        return not is_shift_run
+
+    def _fused_key_period(self, run: list[SimpleEncryptor]) -> int:
+        # Coprime key lengths multiply, so a few keys could otherwise need tens of
+        # thousands of translation tables and be slower than the separate steps.
+        return math.lcm(*(len(step._shift_schedule) for step in run if isinstance(step, Vigenere)))
+
+    def _split_after_last_atbash(
+        self, run: list[SimpleEncryptor], end: int
+    ) -> list[list[SimpleEncryptor]]:
+        # Atbash.decrypt normalizes the accents of the cipher text before the
+        # steps after it are reversed, so the normalization is only kept by a
+        # fused step when the run ends with its last Atbash, unless the cipher
+        # text reaching the run never has accents.
+        atbash_indices = [i for i, step in enumerate(run) if isinstance(step, Atbash)]
+
+        if (
+            not atbash_indices
+            or atbash_indices[-1] == len(run) - 1
+            or self._decrypts_to_unaccented_text(end)
+        ):
+            return [run]
+
+        return [run[: atbash_indices[-1] + 1], run[atbash_indices[-1] + 1 :]]
+
+    def _fuse_permutation_run(
+        self, run: list[SimpleEncryptor], end: int, compiled_steps: list[SimpleEncryptor]
+    ) -> Substitution | None:
+        key = self._alphabet
+
+        for step in run:
+            key = step.encrypt(key)
+
+        if key == self._alphabet and self._is_normalized_by_other_steps(run, end, compiled_steps):
+            return None
+
+        if isinstance(run[-1], Atbash):
+            return _DecryptNormalizingSubstitution(key, run[0]._unicode_folding)
+
+        return Substitution(key, run[0]._unicode_folding)
+
+    def _fuse_shift_run(
+        self, run: list[SimpleEncryptor], end: int, compiled_steps: list[SimpleEncryptor]
+    ) -> Vigenere | None:
+        key_period = self._fused_key_period(run)
+        shift_schedule = [0] * key_period
+
+        # Both ciphers only shift the letters and a Vigenere key only advances on
+        # letters, so the shifts of the same letter position add up.
+        for step in run:
+            for key_index in range(key_period):
+                if isinstance(step, Vigenere):
+                    shift = step._shift_schedule[key_index % len(step._shift_schedule)]
+                else:
+                    shift = step._shift
+
+                shift_schedule[key_index] = (shift_schedule[key_index] + shift) % 26
+
+        shift_schedule = self._reduce_shift_schedule(shift_schedule)
+
+        if shift_schedule == [0] and self._is_normalized_by_other_steps(run, end, compiled_steps):
+            return None
+
+        key = ''.join(self._alphabet[shift] for shift in shift_schedule)
+
+        return Vigenere(key, run[0]._unicode_folding)
+
+    def _reduce_shift_schedule(self, shift_schedule: list[int]) -> list[int]:
+        # The combined schedule often repeats itself, such as when two keys share
+        # a factor, and a shorter period means fewer translation tables to apply.
+        for period in range(1, len(shift_schedule)):
+            if len(shift_schedule) % period == 0 and (
+                shift_schedule == shift_schedule[:period] * (len(shift_schedule) // period)
+            ):
+                return shift_schedule[:period]
+
+        return shift_schedule
+
+    def _is_normalized_by_other_steps(
+        self, run: list[SimpleEncryptor], end: int, compiled_steps: list[SimpleEncryptor]
+    ) -> bool:
+        # An identity run still strips and normalizes the text, so it is only
+        # dropped when the steps around it already do. Only the built-in steps are
+        # known to do it, and only the steps already compiled are sure to be kept.
+        previous_step = compiled_steps[-1] if compiled_steps else None
+        next_step = self._steps[end] if end < len(self._steps) else None
+        unicode_folding = run[0]._unicode_folding
+
+        if previous_step is None and next_step is None:
+            return False
+
+        if self._unicode_folding is None:
+            # Encrypting, the text reaching the run is already stripped and
+            # normalized, or the step after the run strips and normalizes it.
+            if not (
+                self._is_fusable_step(previous_step)
+                and self._folds_like(previous_step, unicode_folding)
+            ) and not (
+                isinstance(next_step, (MorseCode, HomophonicSubstitution))
+                and self._folds_like(next_step, unicode_folding)
+            ):
+                return False
+
+            # Decrypting, the text leaving the run is stripped by the step before
+            # it, or it is the stripped output of the step after it.
+            if not self._is_fusable_step(previous_step) and not (
+                previous_step is None
+                and (self._is_fusable_step(next_step) or isinstance(next_step, MorseCode))
+            ):
+                return False
+
+        if any(isinstance(step, Atbash) for step in run):
+            # Decrypting, the accents are normalized by the step before the run,
+            # or there are none to normalize.
+            return (
+                isinstance(previous_step, (Atbash, _DecryptNormalizingSubstitution))
+                and self._folds_like(previous_step, unicode_folding)
+            ) or self._decrypts_to_unaccented_text(end)
+
+        return True
+
+    def _decrypts_to_unaccented_text(self, end: int) -> bool:
+        # A MorseCode only decrypts to ASCII letters and digits, and the built-in
+        # steps between it and the run only permute or shift those letters.
+        next_steps = self._steps[end:]
+
+        return (
+            bool(next_steps)
+            and isinstance(next_steps[-1], MorseCode)
+            and all(self._is_fusable_step(step) for step in next_steps[:-1])
+        )
+
+    def _folds_like(self, step: SimpleEncryptor, unicode_folding: bool) -> bool:
+        return not unicode_folding or step._unicode_folding
+
+
+class _DecryptNormalizingSubstitution(Substitution):
+    """
+    Substitution that normalizes the accents of the cipher text it decrypts.
+
+    It replaces the fused runs that end with an `Atbash`, whose decryption
+    normalizes the accents like its encryption does.
+    """
+
+    def _decrypt_normalized(self, cipher_text: str) -> str:
+        return super()._decrypt_normalized(normalize_text(cipher_text, self._unicode_folding))
+
+
+def _run_stream_stage(
+    step: SimpleEncryptor,
+    unicode_folding: bool | None,
+    input_queue: multiprocessing.Queue,
+    output_queue: multiprocessing.Queue,
+) -> None:
+    state = {}
+    failed = False
+
+    # An error is passed along to the caller in place of the chunks, and the
+    # stage keeps draining its input, so no stage blocks on a full queue.
+    while (chunk := input_queue.get()) is not None:
+        if failed:
+            continue
+
+        if isinstance(chunk, Exception):
+            failed = True
+            output_queue.put(chunk)
+            continue
+
+        try:
+            if unicode_folding is not None:
+                chunk = normalize_text(chunk, unicode_folding)
+
+            encrypted_chunk = step._encrypt_stream_chunk(chunk, state)
+        except Exception as error:
+            failed = True
+            output_queue.put(error)
+            continue
+
+        if encrypted_chunk:
+            output_queue.put(encrypted_chunk)
+
+    output_queue.put(None)
+
+
+_bulk_method: Callable[[str], str] | None = None
+
+
+def _init_bulk_worker(pipeline: Pipeline, method_name: str) -> None:
+    global _bulk_method
+
+    _bulk_method = getattr(pipeline, method_name)
+
+
+def _run_bulk_batch(batch: list[str]) -> list[str]:
+    return [_bulk_method(item) for item in batch]
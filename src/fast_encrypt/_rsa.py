@@ -2,11 +2,29 @@
 Defines a class for encrypting and decrypting text using RSA algorithm.
 """
 
+import base64
+import binascii
+import codecs
+import concurrent.futures
+import hashlib
+import hmac
+import itertools
 import math
+import multiprocessing
+import random
+import re
 import secrets
+import struct
+from typing import IO, Any, Callable, Iterable, Iterator
 
-_public_key = tuple[int, int]
-_private_key = tuple[int, int]
+from ._arithmetic import get_arithmetic
+from ._key_generation_monitor import KeyGenerationMonitor
+from ._rsa_private_key import RSAPrivateKey
+from ._rsa_public_key import RSAPublicKey
+from ._rsa_token_cache import RSACacheInfo, RSATokenCache
+
+_public_key = RSAPublicKey | tuple[int, int]
+_private_key = RSAPrivateKey | tuple[int, int]
 
 
 class RSA:
@@ -22,15 +40,30 @@ class RSA:
 
     Methods
     -------
-    generate_keypair() -> tuple[_public_key, _private_key]:
+    generate_keypair(public_exponent: int | None = None, workers: int = 1, seed: int | None = None, primes: int = 2, timeout: float | None = None, cancel_event: Any = None, on_progress: Callable[[int, float], Any] | None = None) -> tuple[RSAPublicKey, RSAPrivateKey]:
         Generates the public and private key pair.
 
-    encrypt(public_key: tuple[int, int], text: str) -> str:
+    encrypt(public_key: RSAPublicKey | tuple[int, int], text: str, packing: str = 'char', output_format: str | None = None) -> str | bytes:
         Encrypts text using the specified public key.
 
-    decrypt(private_key: tuple[int, int], cipher_text: str) -> str:
+    decrypt(private_key: RSAPrivateKey | tuple[int, int], cipher_text: str | bytes, packing: str | None = None) -> str:
         Decrypts the ciphertext using the specified private key.
 
+    decrypt_stream(private_key: RSAPrivateKey | tuple[int, int], reader: IO, writer: IO[str], packing: str | None = None, chunk_size: int = 65536) -> int:
+        Decrypts a cipher text read from a stream and writes the plaintext as it goes.
+
+    encrypt_many(public_key: RSAPublicKey | tuple[int, int], texts: Iterable[str], packing: str = 'char', output_format: str | None = None, workers: int | None = None, chunk_size: int = 16) -> list[str | bytes]:
+        Encrypts many texts with the same public key in parallel processes.
+
+    decrypt_many(private_key: RSAPrivateKey | tuple[int, int], cipher_texts: Iterable[str | bytes], packing: str | None = None, workers: int | None = None, chunk_size: int = 16) -> list[str]:
+        Decrypts many cipher texts with the same private key in parallel processes.
+
+    cache_info() -> RSACacheInfo:
+        Returns the statistics of the char token cache.
+
+    cache_clear(key: _public_key | _private_key | None = None) -> None:
+        Evicts the cached char tokens of a key, or the whole cache.
+
     Examples
     --------
     Encrypting a text
@@ -53,7 +86,43 @@ class RSA:
     "Hello World!"
     """
 
-    def __init__(self, key_length: int = 1024) -> None:
+    _small_primes = tuple(
+        number
+        for number in range(3, 8192, 2)
+        if all(number % divisor for divisor in range(3, math.isqrt(number) + 1, 2))
+    )
+    _sieve_size = 4096
+    _prime_search_chunks = 8
+    _min_primes = 2
+    _max_primes = 4
+    # Miller-Rabin rounds for an error probability below 2 ** -80 on random candidates
+    # (Damgard, Landrock and Pomerance bounds, as used by OpenSSL), such as 5 rounds
+    # for the 1024-bit primes of a 1024 key length and 4 for 2048-bit primes.
+    _miller_rabin_rounds_table = (
+        (3747, 3),
+        (1345, 4),
+        (476, 5),
+        (400, 6),
+        (347, 7),
+        (308, 8),
+        (55, 27),
+    )
+    # The position of each packing is its id in the binary cipher text header,
+    # so new packings must only be appended.
+    _packings = ('char', 'block', 'envelope')
+    _output_formats = ('decimal', 'bytes', 'base64')
+    _format_magic = b'FE'
+    _format_version = 1
+    _format_header = struct.Struct('>BBI')
+    _decimal_cipher_text = re.compile(r'[0-9\s]*')
+    _envelope_key_size = 32
+    _envelope_tag_size = 16
+    _envelope_min_padding_size = 8
+    _stream_batch_size = 1024
+
+    def __init__(
+        self, key_length: int = 1024, cache_size: int = 0, arithmetic: str = 'auto'
+    ) -> None:
         """
         Initializes the RSA class with the specified key length (bits qty).
 
@@ -61,15 +130,32 @@ class RSA:
         ----------
         key_length : int, optional
             The RSA key length, by default 1024 (bits qty).
+        cache_size : int, optional
+            The maximum number of char tokens kept in a LRU cache, by default 0
+            (no cache). With `'char'` packing each char of a given key always
+            encrypts to the same token, so the cache lets repeated chars skip
+            their modular exponentiation in `encrypt` and `decrypt`.
+        arithmetic : str, optional
+            The big int arithmetic backend, by default `'auto'` (`'gmpy2'`
+            when the optional gmpy2 package is installed, `'python'`
+            otherwise). GMP modular exponentiation is several times faster
+            than the Python built-in `pow` for large keys. Both backends
+            generate the same keys from the same seed.
 
         Raises
         ------
         ValueError
-            If the key length is not a valid integer or is less than 1024.
+            If the key length is not a valid integer or is less than 1024, if
+            the cache size is not a non-negative integer or if the arithmetic
+            is not valid or not installed.
         """
 
         self._validate_key_length(key_length)
         self._key_length = key_length
+        self._validate_cache_size(cache_size)
+        self._cache_size = cache_size
+        self._token_cache = RSATokenCache(cache_size) if cache_size else None
+        self._arithmetic = get_arithmetic(arithmetic)
 
     def _validate_key_length(self, key_length: int) -> None:
         if not isinstance(key_length, int):
@@ -80,76 +166,489 @@ class RSA:
         if key_length < min_key_length:
             raise ValueError('The key_length must be bigger than 2048.')
 
-    def generate_keypair(self) -> tuple[_public_key, _private_key]:
+    def _validate_cache_size(self, cache_size: int) -> None:
+        if not isinstance(cache_size, int) or isinstance(cache_size, bool):
+            raise ValueError('The cache_size must be a int.')
+
+        if cache_size < 0:
+            raise ValueError('The cache_size must be >= 0.')
+
+    def cache_info(self) -> RSACacheInfo:
+        """
+        Returns the statistics of the char token cache.
+
+        Returns
+        -------
+        RSACacheInfo
+            The hits, misses, maximum size and current size of the cache
+            (all 0 when the cache is disabled).
+
+        Examples
+        --------
+        >>> rsa = RSA(cache_size=4096)
+        >>> public_key, private_key = rsa.generate_keypair(public_exponent=65537)
+        >>> cipher_text = rsa.encrypt(public_key, 'banana')
+        >>> rsa.cache_info()
+        RSACacheInfo(hits=3, misses=3, maxsize=4096, currsize=3)
+        """
+
+        if self._token_cache is None:
+            return RSACacheInfo(0, 0, 0, 0)
+
+        return self._token_cache.info()
+
+    def cache_clear(self, key: _public_key | _private_key | None = None) -> None:
+        """
+        Evicts the cached char tokens of a key, or the whole cache.
+
+        Parameters
+        ----------
+        key : _public_key | _private_key | None, optional
+            The key whose tokens are evicted, by default None (every token is
+            evicted and the statistics are reset).
+        """
+
+        if self._token_cache is None:
+            return
+
+        if key is None:
+            self._token_cache.clear()
+            return
+
+        first_number, n = key
+
+        self._token_cache.evict(('encrypt', first_number, n))
+        self._token_cache.evict(('decrypt', first_number, n))
+
+    def generate_keypair(
+        self,
+        public_exponent: int | None = None,
+        workers: int = 1,
+        seed: int | None = None,
+        primes: int = 2,
+        timeout: float | None = None,
+        cancel_event: Any = None,
+        on_progress: Callable[[int, float], Any] | None = None,
+    ) -> tuple[RSAPublicKey, RSAPrivateKey]:
         """
         Generates a pair of public and private keys.
 
+        The private key carries the prime factors of the modulus, so the
+        decryption can use the Chinese Remainder Theorem.
+
+        Parameters
+        ----------
+        public_exponent : int | None, optional
+            The public exponent `e`. The standard `65537` makes every
+            encryption much cheaper than with the default random exponent,
+            which is as large as the modulus. By default None (random exponent).
+        workers : int, optional
+            The number of processes searching for the primes `p` and `q` at the
+            same time, by default 1 (search in the current process). The
+            workers stop early once both primes are found.
+        seed : int | None, optional
+            The seed of the prime search, by default None (cryptographically
+            secure randomness). The same seed always generates the same key
+            pair, whatever the number of workers, so it is only meant for
+            tests and benchmarks.
+        primes : int, optional
+            The number of prime factors of the modulus, from 2 to 4, by
+            default 2. The modulus keeps `2 * key_length` bits, so with more
+            primes each one is smaller: they are found faster and the
+            decryption works on smaller moduli (multi-prime RSA, PKCS #1).
+        timeout : float | None, optional
+            The seconds the prime search may take, by default None (no limit).
+        cancel_event : Any, optional
+            An event, such as a `threading.Event`, that cancels the prime
+            search once it is set, by default None.
+        on_progress : Callable[[int, float], Any] | None, optional
+            Called after each searched sieve window (or chunk, with workers)
+            with the number of prime candidates tested so far and the elapsed
+            seconds, by default None.
+
         Returns
         -------
-        tuple[_public_key, _private_key]
-            A pair of public and private keys.
+        tuple[RSAPublicKey, RSAPrivateKey]
+            A pair of public and private keys. Both are immutable, validated
+            once and can be serialized with `to_bytes`.
+
+        Raises
+        ------
+        ValueError
+            If the public exponent is not an odd int bigger than 1, if the
+            workers is not a positive int, if the seed is not an int or if
+            the primes is not an int from 2 to 4, or if the timeout,
+            cancel_event or on_progress is not valid.
+        KeyGenerationTimeoutError
+            If the prime search takes more than the timeout.
+        KeyGenerationCancelledError
+            If the cancel event is set during the prime search.
+
+        Examples
+        --------
+        >>> rsa = RSA()
+        >>> public_key, private_key = rsa.generate_keypair(public_exponent=65537)
+        >>> public_key[0]
+        65537
+
+        Searching for the primes in 2 processes
+
+        >>> public_key, private_key = rsa.generate_keypair(public_exponent=65537, workers=2)
+
+        Generating a 3-prime key pair
+
+        >>> public_key, private_key = rsa.generate_keypair(public_exponent=65537, primes=3)
+        >>> len(private_key.primes)
+        3
+
+        Bounding the prime search to 2 seconds
+
+        >>> public_key, private_key = rsa.generate_keypair(public_exponent=65537, timeout=2)
         """
 
-        p = self._generate_prime_number()
-        q = self._generate_prime_number()
-        n = p * q
-        phi = (p - 1) * (q - 1)
+        self._validate_public_exponent(public_exponent)
+        self._validate_workers(workers)
+        self._validate_seed(seed)
+        self._validate_primes(primes)
+        self._validate_monitoring(timeout, cancel_event, on_progress)
 
-        e = secrets.randbelow(phi - 1) + 1
+        monitor = KeyGenerationMonitor(timeout, cancel_event, on_progress)
 
-        while math.gcd(e, phi) != 1:
-            e = secrets.randbelow(phi - 1) + 1
+        prime_sizes = self._prime_sizes(primes)
+        *prime_randoms, e_random = self._create_random_sources(seed, primes)
 
-        d = pow(e, -1, phi)
+        prime_factors = self._generate_prime_factors(
+            public_exponent, workers, prime_sizes, prime_randoms, monitor
+        )
 
-        public_key = e, n
-        private_key = d, n
+        while len(set(prime_factors)) < primes:
+            prime_factors = self._generate_prime_factors(
+                public_exponent, workers, prime_sizes, prime_randoms, monitor
+            )
+
+        n = math.prod(prime_factors)
+        phi = math.prod(prime_factor - 1 for prime_factor in prime_factors)
+
+        if public_exponent is not None:
+            e = public_exponent
+        else:
+            e = self._generate_public_exponent(phi, e_random)
+
+        d = self._arithmetic.invert(e, phi)
+
+        public_key = RSAPublicKey(e, n)
+        private_key = RSAPrivateKey(d, n, *prime_factors)
 
         return public_key, private_key
 
-    def _generate_prime_number(self) -> int:
-        p = 4
+    def _validate_public_exponent(self, public_exponent: int | None) -> None:
+        if public_exponent is None:
+            return
+
+        if not isinstance(public_exponent, int) or isinstance(public_exponent, bool):
+            raise ValueError('The public_exponent must be a int.')
+
+        if public_exponent < 3 or public_exponent % 2 == 0:
+            raise ValueError('The public_exponent must be an odd int bigger than 1.')
+
+    def _validate_workers(self, workers: int) -> None:
+        if not isinstance(workers, int) or isinstance(workers, bool):
+            raise ValueError('The workers must be a int.')
+
+        if workers < 1:
+            raise ValueError('The workers must be >= 1.')
+
+    def _validate_seed(self, seed: int | None) -> None:
+        if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool)):
+            raise ValueError('The seed must be a int.')
+
+    def _validate_primes(self, primes: int) -> None:
+        if not isinstance(primes, int) or isinstance(primes, bool):
+            raise ValueError('The primes must be a int.')
+
+        if not self._min_primes <= primes <= self._max_primes:
+            raise ValueError(
+                f'The primes must be between {self._min_primes} and {self._max_primes}.'
+            )
+
+    def _validate_monitoring(
+        self,
+        timeout: float | None,
+        cancel_event: Any,
+        on_progress: Callable[[int, float], Any] | None,
+    ) -> None:
+        if timeout is not None:
+            if not isinstance(timeout, (int, float)) or isinstance(timeout, bool):
+                raise ValueError('The timeout must be a int or float.')
+
+            if timeout <= 0:
+                raise ValueError('The timeout must be > 0.')
+
+        if cancel_event is not None and not callable(getattr(cancel_event, 'is_set', None)):
+            raise ValueError('The cancel_event must have an is_set method.')
+
+        if on_progress is not None and not callable(on_progress):
+            raise ValueError('The on_progress must be callable.')
+
+    def _prime_sizes(self, primes: int) -> list[int]:
+        # The modulus keeps 2 * key_length bits, whatever the number of primes.
+        modulus_size = 2 * self._key_length
+
+        return [modulus_size // primes + (index < modulus_size % primes) for index in range(primes)]
+
+    def _create_random_sources(self, seed: int | None, primes: int) -> list[random.Random]:
+        if seed is None:
+            return [secrets.SystemRandom() for _ in range(primes + 1)]
+
+        # One source per value, so the primes don't depend on the order they are found.
+        values = ['p', 'q', *(f'r{index}' for index in range(3, primes + 1)), 'e']
+
+        return [random.Random(f'{seed}:{value}') for value in values]
+
+    def _generate_public_exponent(self, phi: int, random_source: random.Random) -> int:
+        e = random_source.randrange(1, phi)
+
+        while self._arithmetic.gcd(e, phi) != 1:
+            e = random_source.randrange(1, phi)
+
+        return e
+
+    def _generate_prime_factors(
+        self,
+        public_exponent: int | None,
+        workers: int,
+        prime_sizes: list[int],
+        prime_randoms: list[random.Random],
+        monitor: KeyGenerationMonitor,
+    ) -> tuple[int, ...]:
+        if workers > 1:
+            return self._generate_prime_factors_in_parallel(
+                public_exponent, workers, prime_sizes, prime_randoms, monitor
+            )
+
+        return tuple(
+            self._generate_prime_factor(public_exponent, prime_size, random_source, monitor)
+            for prime_size, random_source in zip(prime_sizes, prime_randoms)
+        )
+
+    def _generate_prime_factor(
+        self,
+        public_exponent: int | None,
+        prime_size: int,
+        random_source: random.Random,
+        monitor: KeyGenerationMonitor,
+    ) -> int:
+        while True:
+            monitor.raise_if_interrupted()
+
+            start = self._generate_prime_candidate(random_source, prime_size)
+
+            prime, tested_qty = self._search_prime_window(
+                start, self._sieve_size, prime_size, public_exponent, monitor.is_interrupted
+            )
+            monitor.report(tested_qty)
+
+            if prime is not None:
+                return prime
+
+    def _generate_prime_factors_in_parallel(
+        self,
+        public_exponent: int | None,
+        workers: int,
+        prime_sizes: list[int],
+        prime_randoms: list[random.Random],
+        monitor: KeyGenerationMonitor,
+    ) -> tuple[int, ...]:
+        # Each sieve window is split into chunks searched by different workers. The
+        # prime of a factor is the first one of its lowest chunk, so it is the same
+        # prime the sequential search finds, whatever order the chunks finish in.
+        factors = range(len(prime_sizes))
+        chunk_size = self._sieve_size // self._prime_search_chunks
+        chunk_starts = [
+            self._generate_chunk_starts(random_source, prime_size, chunk_size)
+            for prime_size, random_source in zip(prime_sizes, prime_randoms)
+        ]
+        chunk_indices = [itertools.count() for _ in factors]
+        chunk_results: list[dict[int, int | None]] = [{} for _ in factors]
+        searched_chunks = [0 for _ in factors]
+        primes: list[int | None] = [None for _ in factors]
+
+        context = multiprocessing.get_context()
+        cancel_event = context.Event()
+
+        executor = concurrent.futures.ProcessPoolExecutor(
+            workers,
+            mp_context=context,
+            initializer=_init_prime_search_worker,
+            initargs=(self._key_length, self._arithmetic.name, cancel_event),
+        )
+        pending: dict[concurrent.futures.Future, tuple[int, int]] = {}
+
+        try:
+            while None in primes:
+                monitor.raise_if_interrupted()
+
+                missing_factors = itertools.cycle(
+                    [factor for factor in factors if primes[factor] is None]
+                )
+
+                while len(pending) < 2 * workers:
+                    factor = next(missing_factors)
+                    future = executor.submit(
+                        _search_prime_chunk,
+                        next(chunk_starts[factor]),
+                        chunk_size,
+                        prime_sizes[factor],
+                        public_exponent,
+                    )
+                    pending[future] = factor, next(chunk_indices[factor])
+
+                done, _ = concurrent.futures.wait(
+                    pending,
+                    timeout=monitor.poll_interval(),
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
 
-        while not self._is_prime(p):
-            p = self._generate_prime_candidate()
+                for future in done:
+                    factor, index = pending.pop(future)
+                    chunk_results[factor][index], tested_qty = future.result()
+                    monitor.report(tested_qty)
 
-        return p
+                for factor in factors:
+                    results = chunk_results[factor]
+
+                    while primes[factor] is None and searched_chunks[factor] in results:
+                        primes[factor] = results.pop(searched_chunks[factor])
+                        searched_chunks[factor] += 1
+        finally:
+            cancel_event.set()
+            executor.shutdown(cancel_futures=True)
+
+        return tuple(primes)
+
+    def _generate_chunk_starts(
+        self, random_source: random.Random, prime_size: int, chunk_size: int
+    ) -> Iterator[int]:
+        while True:
+            start = self._generate_prime_candidate(random_source, prime_size)
+
+            for chunk in range(self._prime_search_chunks):
+                yield start + 2 * chunk_size * chunk
+
+    def _search_prime_window(
+        self,
+        start: int,
+        size: int,
+        prime_size: int,
+        public_exponent: int | None,
+        is_interrupted: Callable[[], bool] | None = None,
+    ) -> tuple[int | None, int]:
+        sieve = self._sieve_prime_candidates(start, size)
+        tested_qty = 0
+
+        for offset in itertools.compress(range(size), sieve):
+            if is_interrupted is not None and is_interrupted():
+                break
+
+            candidate = start + 2 * offset
+
+            if candidate.bit_length() > prime_size:
+                break
+
+            tested_qty += 1
+
+            if public_exponent is not None and math.gcd(public_exponent, candidate - 1) != 1:
+                continue
+
+            if self._miller_rabin(candidate):
+                return candidate, tested_qty
+
+        return None, tested_qty
+
+    def _sieve_prime_candidates(self, start: int, size: int) -> bytearray:
+        sieve = bytearray([1]) * size
+
+        for small_prime in self._small_primes:
+            first_multiple = (-start % small_prime) * ((small_prime + 1) // 2) % small_prime
+
+            if first_multiple < size:
+                multiples_qty = (size - 1 - first_multiple) // small_prime + 1
+                sieve[first_multiple::small_prime] = bytes(multiples_qty)
+
+        return sieve
 
     def _is_prime(self, number: int) -> bool:
         if number <= 1:
             return False
-        if number <= 3:
+
+        if number == 2:
             return True
 
-        k = 128
+        for small_prime in (2, *self._small_primes):
+            if number % small_prime == 0:
+                return number == small_prime
+
+        return self._miller_rabin(number)
+
+    def _miller_rabin(self, number: int) -> bool:
+        rounds = self._miller_rabin_rounds(number.bit_length())
+
+        return self._arithmetic.is_probable_prime(number, rounds)
+
+    def _miller_rabin_rounds(self, bits: int) -> int:
+        for min_bits, rounds in self._miller_rabin_rounds_table:
+            if bits >= min_bits:
+                return rounds
 
-        for _ in range(k):
-            x = secrets.randbelow(number - 1) + 1
-            if pow(x, number - 1, number) != 1:
-                return False
-        return True
+        return 34
 
-    def _generate_prime_candidate(self) -> int:
-        prime_number = secrets.randbits(self._key_length)
-        prime_number |= (1 << self._key_length - 1) | 1
+    def _generate_prime_candidate(self, random_source: random.Random, prime_size: int) -> int:
+        prime_number = random_source.getrandbits(prime_size)
+        prime_number |= (1 << prime_size - 1) | 1
 
         return prime_number
 
-    def encrypt(self, public_key: _public_key, text: str):
+    def encrypt(
+        self,
+        public_key: _public_key,
+        text: str,
+        packing: str = 'char',
+        output_format: str | None = None,
+    ) -> str | bytes:
         """
         Encrypts the text using the specified public key.
 
         Parameters
         ----------
         public_key : _public_key
-            The public key for encryption.
+            The public key for encryption. A `RSAPublicKey` is not validated
+            again.
         text : str
             The text to be encrypted.
+        packing : str, optional
+            How the text is split into the encrypted numbers, by default `'char'`.
+            `'char'` encrypts each char on its own. `'block'` packs the UTF-8
+            bytes of the text into blocks close to the modulus size, so each
+            modular exponentiation covers hundreds of bytes and the cipher
+            text is much smaller. `'envelope'` encrypts a fresh random session
+            key with RSA once and the UTF-8 bytes of the text with a keystream
+            derived from that key (SHAKE-256, authenticated with BLAKE2b), so
+            large texts are encrypted at the speed of a symmetric cipher.
+        output_format : str | None, optional
+            The format of the cipher text, by default None (`'base64'` for the
+            `'envelope'` packing, which needs a binary format, and `'decimal'`
+            otherwise). `'decimal'` returns the encrypted numbers as
+            space-separated decimal integers.
+            `'bytes'` returns a versioned binary format with one fixed-width
+            big-endian number per modulus byte length, which skips the decimal
+            conversion (quadratic, and limited by `sys.get_int_max_str_digits()`
+            for large keys) and is several times smaller. `'base64'` returns
+            the same binary format encoded in base64.
 
         Returns
         -------
-        str
-            The encrypted text.
+        str | bytes
+            The encrypted text (`bytes` for the `'bytes'` output format).
 
         Examples
         --------
@@ -159,20 +658,266 @@ class RSA:
         >>> public_key, private_key = rsa.generate_keypair()
         >>> rsa.encrypt(public_key, 'Hello World!')
         "7847127900545330234450494651182712418090798037256595068106180662552566637..."
+
+        Encrypting a text in blocks
+
+        >>> rsa.encrypt(public_key, 'Hello World!', packing='block')
+        "1290263829173451236718909182762515290738262190162786281036287621095217281..."
+
+        Encrypting a text to the base64 format
+
+        >>> rsa.encrypt(public_key, 'Hello World!', output_format='base64')
+        "RkUBAAAAAQBkN3Qb0cVgL2a9PxJ0Q8vGm6FZC3Q0m9xk7aYpWb4v1uJ2XhLkTzq..."
+
+        Encrypting a large text in an envelope
+
+        >>> rsa.encrypt(public_key, 'Hello World!' * 100000, packing='envelope')
+        "RkUBAgAAAQCXl1y3Yg4eVx0o8b0XjIYk7p3VnB4h9R2fA1cKq8sT6mLzUe5wJd..."
         """
 
-        self._validate_key(public_key)
+        self._validate_public_key(public_key)
         self._validate_text(text)
+        self._validate_packing(packing)
+
+        if output_format is None:
+            output_format = 'base64' if packing == 'envelope' else 'decimal'
+
+        self._validate_output_format(output_format, packing)
 
         handled_text = self._handle_text(text)
 
         e, n = public_key
 
-        encrypted_text = [str(pow(ord(char), e, n)) for char in handled_text]
+        if packing == 'envelope':
+            session_number, sealed_body = self._seal_envelope(handled_text, n)
+            cipher_numbers = [self._arithmetic.powmod(session_number, e, n)]
+
+            return self._format_cipher_numbers(
+                cipher_numbers, public_key, packing, output_format, sealed_body
+            )
+
+        if packing == 'block':
+            plain_numbers = self._pack_blocks(handled_text, n)
+        else:
+            plain_numbers = map(ord, handled_text)
+
+        powmod = self._arithmetic.powmod
+
+        if packing == 'char' and self._token_cache is not None:
+            cipher_numbers = self._token_cache.map(
+                ('encrypt', e, n), plain_numbers, lambda number: powmod(number, e, n)
+            )
+        else:
+            cipher_numbers = [powmod(number, e, n) for number in plain_numbers]
+
+        return self._format_cipher_numbers(cipher_numbers, public_key, packing, output_format)
+
+    def _validate_packing(self, packing: str) -> None:
+        if packing not in self._packings:
+            raise ValueError(f'The packing must be one of {", ".join(self._packings)}.')
+
+    def _validate_output_format(self, output_format: str, packing: str) -> None:
+        if output_format not in self._output_formats:
+            raise ValueError(f'The output_format must be one of {", ".join(self._output_formats)}.')
+
+        if packing == 'envelope' and output_format == 'decimal':
+            raise ValueError('The envelope packing needs the bytes or base64 output_format.')
+
+    def _format_cipher_numbers(
+        self,
+        cipher_numbers: list[int],
+        public_key: _public_key,
+        packing: str,
+        output_format: str,
+        sealed_body: bytes = b'',
+    ) -> str | bytes:
+        if output_format == 'decimal':
+            return ' '.join(map(str, cipher_numbers))
+
+        width = self._byte_length(public_key)
+
+        header = self._format_magic + self._format_header.pack(
+            self._format_version, self._packings.index(packing), width
+        )
+        cipher_bytes = (
+            header
+            + b''.join(number.to_bytes(width, 'big') for number in cipher_numbers)
+            + sealed_body
+        )
+
+        if output_format == 'base64':
+            return base64.b64encode(cipher_bytes).decode('ascii')
+
+        return cipher_bytes
+
+    def _byte_length(self, key: _public_key | _private_key) -> int:
+        if isinstance(key, (RSAPublicKey, RSAPrivateKey)):
+            return key.byte_length
+
+        _, n = key
+
+        return (n.bit_length() + 7) // 8
+
+    def _parse_cipher_text(self, cipher_text: str | bytes) -> tuple[list[int], str | None, bytes]:
+        if isinstance(cipher_text, str):
+            handled_text = self._handle_text(cipher_text)
+
+            if self._decimal_cipher_text.fullmatch(handled_text):
+                return [int(number) for number in handled_text.split()], None, b''
+
+            try:
+                cipher_text = base64.b64decode(handled_text, validate=True)
+            except binascii.Error:
+                raise ValueError('The given value is not a valid cipher text.') from None
+
+        return self._parse_cipher_bytes(bytes(cipher_text))
+
+    def _parse_cipher_bytes(self, cipher_bytes: bytes) -> tuple[list[int], str, bytes]:
+        body_start = len(self._format_magic) + self._format_header.size
+
+        packing, width = self._parse_cipher_header(cipher_bytes)
+
+        body = memoryview(cipher_bytes)[body_start:]
+        sealed_body = b''
+
+        # The envelope has a single number, followed by the sealed body.
+        if packing == 'envelope':
+            if len(body) < width + self._envelope_tag_size:
+                raise ValueError('The given value is not a valid cipher text.')
+
+            sealed_body = bytes(body[width:])
+            body = body[:width]
+
+        if len(body) % width:
+            raise ValueError('The given value is not a valid cipher text.')
+
+        cipher_numbers = [
+            int.from_bytes(body[i : i + width], 'big') for i in range(0, len(body), width)
+        ]
+
+        return cipher_numbers, packing, sealed_body
+
+    def _parse_cipher_header(self, cipher_bytes: bytes) -> tuple[str, int]:
+        body_start = len(self._format_magic) + self._format_header.size
+
+        if not cipher_bytes.startswith(self._format_magic) or len(cipher_bytes) < body_start:
+            raise ValueError('The given value is not a valid cipher text.')
+
+        version, packing_id, width = self._format_header.unpack_from(
+            cipher_bytes, len(self._format_magic)
+        )
+
+        if version != self._format_version:
+            raise ValueError(f'The cipher text format version {version} is not supported.')
+
+        if packing_id >= len(self._packings) or not width:
+            raise ValueError('The given value is not a valid cipher text.')
+
+        return self._packings[packing_id], width
+
+    def _pack_blocks(self, text: str, n: int) -> list[int]:
+        # Each block is prefixed by a 0x01 marker byte, which keeps its leading zero
+        # bytes and makes the marked block still smaller than the modulus.
+        block_size = (n.bit_length() - 2) // 8
+
+        if block_size < 1:
+            raise ValueError('The modulus is too small for the block packing.')
+
+        text_bytes = text.encode()
+
+        return [
+            int.from_bytes(b'\x01' + text_bytes[i : i + block_size], 'big')
+            for i in range(0, len(text_bytes), block_size)
+        ]
+
+    def _unpack_blocks(self, numbers: list[int]) -> str:
+        blocks = map(self._unpack_block, numbers)
+
+        try:
+            return b''.join(blocks).decode()
+        except UnicodeDecodeError:
+            raise ValueError('The given value is not a valid block cipher text.') from None
+
+    def _unpack_block(self, number: int) -> bytes:
+        block = number.to_bytes((number.bit_length() + 7) // 8, 'big')
+
+        if block[:1] != b'\x01':
+            raise ValueError('The given value is not a valid block cipher text.')
+
+        return block[1:]
+
+    def _seal_envelope(self, text: str, n: int) -> tuple[int, bytes]:
+        size = self._envelope_number_size(n)
+
+        if size < self._envelope_key_size + self._envelope_min_padding_size:
+            raise ValueError('The modulus is too small for the envelope packing.')
+
+        session_key = secrets.token_bytes(self._envelope_key_size)
+        body = text.encode()
+
+        mac_key, keystream = self._derive_envelope_keys(session_key, len(body))
+        cipher_body = self._xor_bytes(body, keystream)
+        tag = hashlib.blake2b(cipher_body, key=mac_key, digest_size=self._envelope_tag_size)
+
+        # The session key is padded with random bytes up to the modulus size, so
+        # its power never stays below the modulus (which would let an integer
+        # root recover it with a small public exponent). The padded key gets the
+        # same 0x01 marker as the blocks of the block packing.
+        padding = secrets.token_bytes(size - self._envelope_key_size)
+        session_number = int.from_bytes(b'\x01' + padding + session_key, 'big')
+
+        return session_number, cipher_body + tag.digest()
+
+    def _open_envelope(self, session_number: int, n: int, sealed_body: bytes) -> str:
+        size = self._envelope_number_size(n)
+
+        if session_number >> 8 * size != 1:
+            raise ValueError('The given value is not a valid envelope cipher text.')
 
-        return ' '.join(encrypted_text)
+        session_key = session_number.to_bytes(size + 1, 'big')[-self._envelope_key_size :]
 
-    def _validate_key(self, key: str) -> None:
+        cipher_body = sealed_body[: -self._envelope_tag_size]
+        tag = sealed_body[-self._envelope_tag_size :]
+
+        mac_key, keystream = self._derive_envelope_keys(session_key, len(cipher_body))
+        expected_tag = hashlib.blake2b(
+            cipher_body, key=mac_key, digest_size=self._envelope_tag_size
+        ).digest()
+
+        if not hmac.compare_digest(tag, expected_tag):
+            raise ValueError('The given value is not a valid envelope cipher text.')
+
+        return self._xor_bytes(cipher_body, keystream).decode()
+
+    def _envelope_number_size(self, n: int) -> int:
+        # The byte length of the padded session key, which leaves room for the
+        # 0x01 marker below the modulus.
+        return (n.bit_length() - 2) // 8
+
+    def _derive_envelope_keys(self, session_key: bytes, size: int) -> tuple[bytes, bytes]:
+        key_material = hashlib.shake_256(session_key).digest(self._envelope_key_size + size)
+
+        return key_material[: self._envelope_key_size], key_material[self._envelope_key_size :]
+
+    def _xor_bytes(self, data: bytes, keystream: bytes) -> bytes:
+        # A single big int XOR runs in C, instead of a Python loop over the bytes.
+        xored = int.from_bytes(data, 'big') ^ int.from_bytes(keystream, 'big')
+
+        return xored.to_bytes(len(data), 'big')
+
+    def _validate_public_key(self, public_key: _public_key) -> None:
+        if isinstance(public_key, RSAPublicKey):
+            return
+
+        self._validate_key(public_key)
+
+    def _validate_private_key(self, private_key: _private_key) -> None:
+        if isinstance(private_key, RSAPrivateKey):
+            return
+
+        self._validate_key(private_key)
+
+    def _validate_key(self, key: tuple[int, int]) -> None:
         if not isinstance(key, tuple) or len(key) != 2:
             raise ValueError('The given value must be tuple[int, int].')
 
@@ -184,19 +929,33 @@ class RSA:
         if not isinstance(text, str):
             raise ValueError('The given value must be a str.')
 
+    def _validate_cipher_text(self, cipher_text: str | bytes) -> None:
+        if not isinstance(cipher_text, (str, bytes, bytearray)):
+            raise ValueError('The given value must be a str or bytes.')
+
     def _handle_text(self, text: str) -> str:
         return text.strip()
 
-    def decrypt(self, private_key: _private_key, cipher_text: str) -> str:
+    def decrypt(
+        self, private_key: _private_key, cipher_text: str | bytes, packing: str | None = None
+    ) -> str:
         """
         Decrypts the cipher text using the specified private key.
 
         Parameters
         ----------
-        private_key : _private_key
-            The private key for decryption.
-        cipher_text : str
-            The cipher text to be decrypted.
+        private_key : RSAPrivateKey | tuple[int, int]
+            The private key for decryption. A `RSAPrivateKey` is decrypted
+            with the Chinese Remainder Theorem, a legacy `(d, n)` tuple with
+            a single modular exponentiation.
+        cipher_text : str | bytes
+            The cipher text to be decrypted. Its format (decimal, bytes or
+            base64) is detected automatically.
+        packing : str | None, optional
+            The packing used to encrypt the text (`'char'`, `'block'` or
+            `'envelope'`). The bytes and base64 formats record it, so it is
+            only needed for decimal cipher texts, where None means `'char'`.
+            By default None.
 
         Returns
         -------
@@ -216,17 +975,481 @@ class RSA:
         "Hello World!"
         """
 
-        self._validate_key(private_key)
-        self._validate_text(cipher_text)
+        self._validate_private_key(private_key)
+        self._validate_cipher_text(cipher_text)
 
-        handled_text = self._handle_text(cipher_text)
+        if packing is not None:
+            self._validate_packing(packing)
 
-        d, n = private_key
+        cipher_numbers, cipher_packing, sealed_body = self._parse_cipher_text(cipher_text)
+
+        packing = self._resolve_packing(packing, cipher_packing)
+
+        if packing == 'envelope':
+            _, n = private_key
+            session_number = self._decrypt_number(private_key, cipher_numbers[0])
 
-        cipher_list = handled_text.split(' ')
+            try:
+                return self._open_envelope(session_number, n, sealed_body)
+            except UnicodeDecodeError:
+                raise ValueError('The given value is not a valid envelope cipher text.') from None
 
-        plain_chars = [chr(pow(int(char), d, n)) for char in cipher_list]
+        plain_numbers = self._decrypt_numbers(private_key, cipher_numbers, packing)
 
-        decrypted_text = ''.join(plain_chars)
+        if packing == 'block':
+            return self._unpack_blocks(plain_numbers)
+
+        decrypted_text = ''.join(map(chr, plain_numbers))
 
         return decrypted_text
+
+    def _resolve_packing(self, packing: str | None, cipher_packing: str | None) -> str:
+        if packing is not None and cipher_packing is not None and packing != cipher_packing:
+            raise ValueError('The given packing does not match the cipher text packing.')
+
+        if cipher_packing is None and packing == 'envelope':
+            raise ValueError('The envelope packing needs the bytes or base64 cipher text.')
+
+        return cipher_packing or packing or 'char'
+
+    def _decrypt_numbers(
+        self, private_key: _private_key, cipher_numbers: Iterable[int], packing: str
+    ) -> list[int]:
+        if packing == 'char' and self._token_cache is not None:
+            d, n = private_key
+
+            return self._token_cache.map(
+                ('decrypt', d, n),
+                cipher_numbers,
+                lambda number: self._decrypt_number(private_key, number),
+            )
+
+        return [self._decrypt_number(private_key, number) for number in cipher_numbers]
+
+    def _decrypt_number(self, private_key: _private_key, number: int) -> int:
+        powmod = self._arithmetic.powmod
+
+        if isinstance(private_key, RSAPrivateKey):
+            m_p = powmod(number, private_key.dp, private_key.p)
+            m_q = powmod(number, private_key.dq, private_key.q)
+            h = private_key.qinv * (m_p - m_q) % private_key.p
+            m = m_q + h * private_key.q
+
+            # Garner's recombination of the other primes, as in PKCS #1 (RSADP).
+            r = private_key.p * private_key.q
+
+            for r_i, d_i, t_i in private_key.other_prime_infos:
+                m_i = powmod(number, d_i, r_i)
+                h = (m_i - m) * t_i % r_i
+                m += r * h
+                r *= r_i
+
+            return m
+
+        d, n = private_key
+
+        return powmod(number, d, n)
+
+    def decrypt_stream(
+        self,
+        private_key: _private_key,
+        reader: IO,
+        writer: IO[str],
+        packing: str | None = None,
+        chunk_size: int = 65536,
+    ) -> int:
+        """
+        Decrypts a cipher text read from a stream and writes the plaintext as it goes.
+
+        The cipher text is read in chunks of `chunk_size`, so the memory use
+        doesn't depend on the cipher text size.
+
+        Parameters
+        ----------
+        private_key : RSAPrivateKey | tuple[int, int]
+            The private key for decryption.
+        reader : IO
+            A text or binary file-like object with the cipher text, in any
+            format (decimal, bytes or base64).
+        writer : IO[str]
+            A text file-like object where the plaintext is written.
+        packing : str | None, optional
+            The packing used to encrypt the text (`'char'` or `'block'`),
+            by default None. See `decrypt`. The `'envelope'` packing is
+            authenticated as a whole, so it can't be decrypted as a stream.
+        chunk_size : int, optional
+            The number of chars or bytes read at once, by default 65536.
+
+        Returns
+        -------
+        int
+            The number of chars written.
+
+        Raises
+        ------
+        ValueError
+            If any parameter or the cipher text is not valid. The plaintext
+            written before the invalid part is kept.
+
+        Examples
+        --------
+        >>> rsa = RSA()
+        >>> public_key, private_key = rsa.generate_keypair()
+        >>> with open('cipher.txt') as reader, open('plain.txt', 'w') as writer:
+        ...     rsa.decrypt_stream(private_key, reader, writer)
+        12
+        """
+
+        self._validate_private_key(private_key)
+
+        if packing is not None:
+            self._validate_packing(packing)
+
+        self._validate_chunk_size(chunk_size)
+
+        chunks = self._read_stream_chunks(reader, chunk_size)
+
+        for first_chunk in chunks:
+            first_chunk = first_chunk.lstrip()
+
+            if first_chunk:
+                break
+        else:
+            return 0
+
+        chunks = itertools.chain((first_chunk,), chunks)
+
+        if isinstance(first_chunk, bytes) and first_chunk[:1] == self._format_magic[:1]:
+            cipher_packing, cipher_numbers = self._parse_cipher_stream_bytes(chunks)
+        else:
+            text_chunks = map(self._decode_stream_chunk, chunks)
+
+            if first_chunk[:1].isdigit():
+                cipher_packing, cipher_numbers = None, self._parse_decimal_stream(text_chunks)
+            else:
+                cipher_packing, cipher_numbers = self._parse_cipher_stream_bytes(
+                    self._decode_base64_stream(text_chunks)
+                )
+
+        packing = self._resolve_packing(packing, cipher_packing)
+
+        if packing == 'envelope':
+            raise ValueError('The envelope packing can not be decrypted as a stream.')
+
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        written_qty = 0
+
+        while batch := list(itertools.islice(cipher_numbers, self._stream_batch_size)):
+            plain_numbers = self._decrypt_numbers(private_key, batch, packing)
+
+            try:
+                if packing == 'block':
+                    plain_text = decoder.decode(b''.join(map(self._unpack_block, plain_numbers)))
+                else:
+                    plain_text = ''.join(map(chr, plain_numbers))
+            except (UnicodeDecodeError, ValueError, OverflowError):
+                raise ValueError(f'The given value is not a valid {packing} cipher text.') from None
+
+            # The writer may not return the number of chars written, such as
+            # the file-like objects whose write returns None.
+            writer.write(plain_text)
+            written_qty += len(plain_text)
+
+        try:
+            decoder.decode(b'', final=True)
+        except UnicodeDecodeError:
+            raise ValueError('The given value is not a valid block cipher text.') from None
+
+        return written_qty
+
+    def _read_stream_chunks(self, reader: IO, chunk_size: int) -> Iterator[str | bytes]:
+        while chunk := reader.read(chunk_size):
+            if not isinstance(chunk, (str, bytes)):
+                raise ValueError('The given reader must read str or bytes.')
+
+            yield chunk
+
+    def _decode_stream_chunk(self, chunk: str | bytes) -> str:
+        if isinstance(chunk, str):
+            return chunk
+
+        try:
+            return chunk.decode('ascii')
+        except UnicodeDecodeError:
+            raise ValueError('The given value is not a valid cipher text.') from None
+
+    def _parse_decimal_stream(self, text_chunks: Iterable[str]) -> Iterator[int]:
+        # The last token of a chunk may continue in the next one, so it waits for it.
+        pending_token = ''
+
+        for chunk in text_chunks:
+            text = pending_token + chunk
+            tokens = text.split()
+            pending_token = tokens.pop() if tokens and not text[-1].isspace() else ''
+
+            for token in tokens:
+                yield self._parse_decimal_token(token)
+
+        if pending_token:
+            yield self._parse_decimal_token(pending_token)
+
+    def _parse_decimal_token(self, token: str) -> int:
+        if not (token.isascii() and token.isdigit()):
+            raise ValueError('The given value is not a valid cipher text.')
+
+        return int(token)
+
+    def _decode_base64_stream(self, text_chunks: Iterable[str]) -> Iterator[bytes]:
+        # Base64 decodes in groups of 4 chars, so the chars left over wait for the next chunk.
+        pending_chars = ''
+
+        for chunk in text_chunks:
+            pending_chars += ''.join(chunk.split())
+            usable_qty = len(pending_chars) - len(pending_chars) % 4
+
+            try:
+                yield base64.b64decode(pending_chars[:usable_qty], validate=True)
+            except binascii.Error:
+                raise ValueError('The given value is not a valid cipher text.') from None
+
+            pending_chars = pending_chars[usable_qty:]
+
+        if pending_chars:
+            raise ValueError('The given value is not a valid cipher text.')
+
+    def _parse_cipher_stream_bytes(self, byte_chunks: Iterable[bytes]) -> tuple[str, Iterator[int]]:
+        byte_chunks = iter(byte_chunks)
+        header_size = len(self._format_magic) + self._format_header.size
+        buffer = bytearray()
+
+        while len(buffer) < header_size:
+            chunk = next(byte_chunks, None)
+
+            if chunk is None:
+                raise ValueError('The given value is not a valid cipher text.')
+
+            buffer += chunk
+
+        packing, width = self._parse_cipher_header(bytes(buffer[:header_size]))
+        del buffer[:header_size]
+
+        def parse_numbers() -> Iterator[int]:
+            for chunk in itertools.chain((b'',), byte_chunks):
+                buffer.extend(chunk)
+                usable_size = len(buffer) - len(buffer) % width
+
+                for i in range(0, usable_size, width):
+                    yield int.from_bytes(buffer[i : i + width], 'big')
+
+                del buffer[:usable_size]
+
+            if buffer:
+                raise ValueError('The given value is not a valid cipher text.')
+
+        return packing, parse_numbers()
+
+    def encrypt_many(
+        self,
+        public_key: _public_key,
+        texts: Iterable[str],
+        packing: str = 'char',
+        output_format: str | None = None,
+        workers: int | None = None,
+        chunk_size: int = 16,
+    ) -> list[str | bytes]:
+        """
+        Encrypts many texts with the same public key in parallel processes.
+
+        Big int `pow` holds the GIL, so `encrypt` only uses one core. This
+        method sends the key to each worker process once and spreads the
+        texts across them in chunks, which scales with the number of cores.
+
+        Parameters
+        ----------
+        public_key : _public_key
+            The public key for encryption.
+        texts : Iterable[str]
+            The texts to be encrypted.
+        packing : str, optional
+            How each text is split into the encrypted numbers, by default
+            `'char'`. See `encrypt`.
+        output_format : str | None, optional
+            The format of the cipher texts, by default None. See `encrypt`.
+        workers : int | None, optional
+            The number of worker processes, by default None (the number of
+            CPUs). 1 encrypts in the current process.
+        chunk_size : int, optional
+            The number of texts sent to a worker at once, by default 16.
+
+        Returns
+        -------
+        list[str | bytes]
+            The encrypted texts, in the order of the given texts.
+
+        Raises
+        ------
+        ValueError
+            If any parameter or text is not valid.
+
+        Examples
+        --------
+        >>> rsa = RSA()
+        >>> public_key, private_key = rsa.generate_keypair(public_exponent=65537)
+        >>> cipher_texts = rsa.encrypt_many(public_key, ['Hello', 'World!'], workers=4)
+        """
+
+        self._validate_public_key(public_key)
+        self._validate_packing(packing)
+
+        if output_format is not None:
+            self._validate_output_format(output_format, packing)
+
+        texts = list(texts)
+
+        for text in texts:
+            self._validate_text(text)
+
+        return self._map_in_processes(
+            'encrypt', public_key, texts, (packing, output_format), workers, chunk_size
+        )
+
+    def decrypt_many(
+        self,
+        private_key: _private_key,
+        cipher_texts: Iterable[str | bytes],
+        packing: str | None = None,
+        workers: int | None = None,
+        chunk_size: int = 16,
+    ) -> list[str]:
+        """
+        Decrypts many cipher texts with the same private key in parallel processes.
+
+        Parameters
+        ----------
+        private_key : RSAPrivateKey | tuple[int, int]
+            The private key for decryption.
+        cipher_texts : Iterable[str | bytes]
+            The cipher texts to be decrypted.
+        packing : str | None, optional
+            The packing used to encrypt the decimal cipher texts, by default
+            None. See `decrypt`.
+        workers : int | None, optional
+            The number of worker processes, by default None (the number of
+            CPUs). 1 decrypts in the current process.
+        chunk_size : int, optional
+            The number of cipher texts sent to a worker at once, by default 16.
+
+        Returns
+        -------
+        list[str]
+            The decrypted plaintexts, in the order of the given cipher texts.
+
+        Raises
+        ------
+        ValueError
+            If any parameter or cipher text is not valid.
+
+        Examples
+        --------
+        >>> rsa.decrypt_many(private_key, cipher_texts, workers=4)
+        ['Hello', 'World!']
+        """
+
+        self._validate_private_key(private_key)
+
+        if packing is not None:
+            self._validate_packing(packing)
+
+        cipher_texts = list(cipher_texts)
+
+        for cipher_text in cipher_texts:
+            self._validate_cipher_text(cipher_text)
+
+        return self._map_in_processes(
+            'decrypt', private_key, cipher_texts, (packing,), workers, chunk_size
+        )
+
+    def _validate_chunk_size(self, chunk_size: int) -> None:
+        if not isinstance(chunk_size, int) or isinstance(chunk_size, bool):
+            raise ValueError('The chunk_size must be a int.')
+
+        if chunk_size < 1:
+            raise ValueError('The chunk_size must be >= 1.')
+
+    def _map_in_processes(
+        self,
+        method_name: str,
+        key: _public_key | _private_key,
+        items: list[Any],
+        options: tuple[Any, ...],
+        workers: int | None,
+        chunk_size: int,
+    ) -> list[Any]:
+        if workers is not None:
+            self._validate_workers(workers)
+
+        self._validate_chunk_size(chunk_size)
+
+        if workers == 1 or len(items) <= 1:
+            method = getattr(self, method_name)
+
+            return [method(key, item, *options) for item in items]
+
+        # The key and options go through the initializer, so each worker receives
+        # them once instead of with every chunk of items.
+        with concurrent.futures.ProcessPoolExecutor(
+            workers,
+            initializer=_init_bulk_worker,
+            initargs=(
+                self._key_length,
+                self._cache_size,
+                self._arithmetic.name,
+                method_name,
+                key,
+                options,
+            ),
+        ) as executor:
+            return list(executor.map(_run_bulk_item, items, chunksize=chunk_size))
+
+
+_prime_search_rsa: RSA | None = None
+_prime_search_cancel_event: Any = None
+
+
+def _init_prime_search_worker(key_length: int, arithmetic: str, cancel_event: Any) -> None:
+    global _prime_search_rsa, _prime_search_cancel_event
+
+    _prime_search_rsa = RSA(key_length, arithmetic=arithmetic)
+    _prime_search_cancel_event = cancel_event
+
+
+def _search_prime_chunk(
+    start: int, size: int, prime_size: int, public_exponent: int | None
+) -> tuple[int | None, int]:
+    return _prime_search_rsa._search_prime_window(
+        start, size, prime_size, public_exponent, _prime_search_cancel_event.is_set
+    )
+
+
+_bulk_method: Callable[..., Any] | None = None
+_bulk_key: _public_key | _private_key | None = None
+_bulk_options: tuple[Any, ...] = ()
+
+
+def _init_bulk_worker(
+    key_length: int,
+    cache_size: int,
+    arithmetic: str,
+    method_name: str,
+    key: _public_key | _private_key,
+    options: tuple[Any, ...],
+) -> None:
+    global _bulk_method, _bulk_key, _bulk_options
+
+    _bulk_method = getattr(RSA(key_length, cache_size, arithmetic), method_name)
+    _bulk_key = key
+    _bulk_options = options
+
+
+def _run_bulk_item(item: Any) -> Any:
+    return _bulk_method(_bulk_key, item, *_bulk_options)
@@ -0,0 +1,354 @@
+"""
+Defines a pool of pregenerated RSA key pairs refilled in the background.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import NamedTuple
+
+from ._exceptions import KeyGenerationCancelledError
+from ._rsa import RSA
+from ._rsa_private_key import RSAPrivateKey
+from ._rsa_public_key import RSAPublicKey
+
+_keypair = tuple[RSAPublicKey, RSAPrivateKey]
+
+
+class RSAKeyPoolMetrics(NamedTuple):
+    """
+    Metrics of the key pairs of one key length in a `RSAKeyPool`.
+    """
+
+    depth: int
+    size: int
+    acquired: int
+    waited: int
+    refilled: int
+    last_refill_time: float
+    mean_refill_time: float
+
+
+class RSAKeyPool:
+    """
+    Class for a pool of pregenerated RSA key pairs refilled in the background.
+
+    The pool keeps up to `size` key pairs of each key length. A background
+    thread generates a new key pair whenever one is acquired, so the prime
+    search runs off the request path and `acquire` only waits when the pool
+    runs dry.
+
+    Methods
+    -------
+    acquire(key_length: int | None = None) -> tuple[RSAPublicKey, RSAPrivateKey]:
+        Takes a key pair from the pool, waiting for the refill if it is empty.
+
+    metrics(key_length: int | None = None) -> RSAKeyPoolMetrics:
+        Returns the depth and refill metrics of a key length.
+
+    close() -> None:
+        Stops the background refill.
+
+    Examples
+    --------
+    >>> from fast_encrypt import RSAKeyPool
+    >>> pool = RSAKeyPool(size=8, key_lengths=(1024, 2048), public_exponent=65537)
+    >>> public_key, private_key = await pool.acquire(2048)
+    >>> pool.metrics(2048)
+    RSAKeyPoolMetrics(depth=7, size=8, acquired=1, waited=0, refilled=9, ...)
+    >>> pool.close()
+    """
+
+    def __init__(
+        self,
+        size: int = 4,
+        key_lengths: tuple[int, ...] = (1024,),
+        public_exponent: int | None = None,
+        workers: int = 1,
+    ) -> None:
+        """
+        Initializes the pool and starts filling it in the background.
+
+        Parameters
+        ----------
+        size : int, optional
+            The number of key pairs kept for each key length, by default 4.
+        key_lengths : tuple[int, ...], optional
+            The key lengths (bits qty) kept in the pool, by default (1024,).
+            The first one is the default of `acquire` and `metrics`.
+        public_exponent : int | None, optional
+            The public exponent of the generated key pairs, by default None
+            (random exponent). See `RSA.generate_keypair`.
+        workers : int, optional
+            The number of processes searching for the primes of each key
+            pair, by default 1 (search in the refill thread). See
+            `RSA.generate_keypair`.
+
+        Raises
+        ------
+        ValueError
+            If any parameter is not valid.
+        """
+
+        self._validate_size(size)
+        self._validate_key_lengths(key_lengths)
+
+        self._size = size
+        self._key_lengths = tuple(key_lengths)
+        self._rsas = {key_length: RSA(key_length) for key_length in self._key_lengths}
+        self._public_exponent = public_exponent
+        self._workers = workers
+
+        # Fails fast on an invalid public exponent or workers, instead of in the refill thread.
+        self._rsas[self._key_lengths[0]]._validate_public_exponent(public_exponent)
+        self._rsas[self._key_lengths[0]]._validate_workers(workers)
+
+        self._keypairs: dict[int, deque[_keypair]] = {
+            key_length: deque() for key_length in self._key_lengths
+        }
+        self._waiters: dict[int, deque[asyncio.Future]] = {
+            key_length: deque() for key_length in self._key_lengths
+        }
+        self._acquired = dict.fromkeys(self._key_lengths, 0)
+        self._waited = dict.fromkeys(self._key_lengths, 0)
+        self._refilled = dict.fromkeys(self._key_lengths, 0)
+        self._last_refill_time = dict.fromkeys(self._key_lengths, 0.0)
+        self._total_refill_time = dict.fromkeys(self._key_lengths, 0.0)
+
+        self._closed = False
+        self._cancel_event = threading.Event()
+        self._condition = threading.Condition()
+        self._refill_thread = threading.Thread(
+            target=self._refill, name='RSAKeyPool refill', daemon=True
+        )
+        self._refill_thread.start()
+
+    def _validate_size(self, size: int) -> None:
+        if not isinstance(size, int) or isinstance(size, bool):
+            raise ValueError('The size must be a int.')
+
+        if size < 1:
+            raise ValueError('The size must be >= 1.')
+
+    def _validate_key_lengths(self, key_lengths: tuple[int, ...]) -> None:
+        if not isinstance(key_lengths, (tuple, list)) or not key_lengths:
+            raise ValueError('The key_lengths must be a non-empty tuple[int, ...].')
+
+    async def acquire(self, key_length: int | None = None) -> _keypair:
+        """
+        Takes a key pair from the pool, waiting for the refill if it is empty.
+
+        Parameters
+        ----------
+        key_length : int | None, optional
+            The key length (bits qty) of the key pair, by default None (the
+            first key length of the pool).
+
+        Returns
+        -------
+        tuple[RSAPublicKey, RSAPrivateKey]
+            A pair of public and private keys, never handed out twice.
+
+        Raises
+        ------
+        ValueError
+            If the pool does not keep the key length.
+        RuntimeError
+            If the pool is closed.
+        Exception
+            The error raised by the refill while the acquisition waited. The
+            refill is retried on the next acquisition.
+        """
+
+        key_length = self._resolve_key_length(key_length)
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError('The key pool is closed.')
+
+            self._acquired[key_length] += 1
+            self._condition.notify()
+
+            if self._keypairs[key_length]:
+                return self._keypairs[key_length].popleft()
+
+            self._waited[key_length] += 1
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters[key_length].append(waiter)
+
+        return await waiter
+
+    def metrics(self, key_length: int | None = None) -> RSAKeyPoolMetrics:
+        """
+        Returns the depth and refill metrics of a key length.
+
+        Parameters
+        ----------
+        key_length : int | None, optional
+            The key length (bits qty), by default None (the first key length
+            of the pool).
+
+        Returns
+        -------
+        RSAKeyPoolMetrics
+            The number of key pairs ready (`depth`), the target `size`, the
+            number of `acquired` key pairs and of acquisitions that `waited`
+            for the refill, and the number of `refilled` key pairs with the
+            last and mean time (in seconds) to generate one.
+
+        Raises
+        ------
+        ValueError
+            If the pool does not keep the key length.
+        """
+
+        key_length = self._resolve_key_length(key_length)
+
+        with self._condition:
+            refilled = self._refilled[key_length]
+
+            return RSAKeyPoolMetrics(
+                len(self._keypairs[key_length]),
+                self._size,
+                self._acquired[key_length],
+                self._waited[key_length],
+                refilled,
+                self._last_refill_time[key_length],
+                self._total_refill_time[key_length] / refilled if refilled else 0.0,
+            )
+
+    def close(self) -> None:
+        """
+        Stops the background refill.
+
+        The key pair being generated is cancelled. Pending `acquire` calls
+        raise `RuntimeError`. Closing a closed pool does nothing.
+        """
+
+        with self._condition:
+            self._closed = True
+            self._cancel_event.set()
+            self._condition.notify()
+
+        self._refill_thread.join()
+
+        with self._condition:
+            for key_length, waiters in self._waiters.items():
+                while waiters:
+                    self._resolve_waiter(waiters.popleft(), key_length, None)
+
+    def _resolve_key_length(self, key_length: int | None) -> int:
+        if key_length is None:
+            return self._key_lengths[0]
+
+        if key_length not in self._rsas:
+            raise ValueError(f'The key pool does not keep {key_length} bits keys.')
+
+        return key_length
+
+    def _refill(self) -> None:
+        while True:
+            with self._condition:
+                key_length = self._next_key_length()
+
+                while key_length is None and not self._closed:
+                    self._condition.wait()
+                    key_length = self._next_key_length()
+
+                if self._closed:
+                    return
+
+            start = time.perf_counter()
+
+            try:
+                keypair = self._rsas[key_length].generate_keypair(
+                    self._public_exponent, self._workers, cancel_event=self._cancel_event
+                )
+            except KeyGenerationCancelledError:
+                return
+            except Exception as error:
+                with self._condition:
+                    waiters = self._waiters[key_length]
+
+                    while waiters:
+                        self._resolve_waiter(waiters.popleft(), key_length, error)
+
+                    # Retries on the next acquisition, instead of failing in a busy loop.
+                    if not self._closed:
+                        self._condition.wait()
+
+                continue
+
+            refill_time = time.perf_counter() - start
+
+            with self._condition:
+                self._refilled[key_length] += 1
+                self._last_refill_time[key_length] = refill_time
+                self._total_refill_time[key_length] += refill_time
+
+                waiters = self._waiters[key_length]
+
+                while waiters:
+                    if self._resolve_waiter(waiters.popleft(), key_length, keypair):
+                        break
+                else:
+                    self._keypairs[key_length].append(keypair)
+
+    def _next_key_length(self) -> int | None:
+        # The key length with the largest deficit is refilled first, so waiting
+        # acquisitions are served before the pools that are merely below size.
+        deficits = {
+            key_length: (
+                self._size - len(self._keypairs[key_length]) + len(self._waiters[key_length])
+            )
+            for key_length in self._key_lengths
+        }
+        key_length = max(deficits, key=deficits.__getitem__)
+
+        return key_length if deficits[key_length] > 0 else None
+
+    def _resolve_waiter(
+        self,
+        waiter: asyncio.Future,
+        key_length: int,
+        outcome: _keypair | Exception | None,
+    ) -> bool:
+        # A waiter whose acquisition was cancelled or whose loop is closed is
+        # skipped, so the outcome goes to the next waiter.
+        if waiter.done():
+            return False
+
+        try:
+            waiter.get_loop().call_soon_threadsafe(
+                self._set_waiter_result, waiter, key_length, outcome
+            )
+        except RuntimeError:
+            return False
+
+        return True
+
+    def _set_waiter_result(
+        self,
+        waiter: asyncio.Future,
+        key_length: int,
+        outcome: _keypair | Exception | None,
+    ) -> None:
+        if outcome is None:
+            if not waiter.done():
+                waiter.set_exception(RuntimeError('The key pool is closed.'))
+        elif isinstance(outcome, Exception):
+            if not waiter.done():
+                waiter.set_exception(outcome)
+        elif waiter.done():
+            # The acquisition was cancelled, so the key pair goes back to the pool.
+            with self._condition:
+                self._keypairs[key_length].append(outcome)
+        else:
+            waiter.set_result(outcome)
+
+    def __enter__(self) -> 'RSAKeyPool':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
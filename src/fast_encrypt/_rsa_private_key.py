@@ -0,0 +1,296 @@
+"""
+Defines a class for RSA private keys with Chinese Remainder Theorem parameters.
+"""
+
+import itertools
+import math
+from typing import Any, Iterator
+
+from ._key_serialization import pack_key_numbers, private_key_kind, unpack_key_numbers
+
+
+class RSAPrivateKey:
+    """
+    Class for RSA private keys with Chinese Remainder Theorem (CRT) parameters.
+
+    Besides the private exponent `d` and the modulus `n`, the key carries the
+    prime factors `p` and `q` of the modulus and the CRT values `dp`, `dq` and
+    `qinv` (`dP`, `dQ` and `qInv` in PKCS #1), which let `RSA.decrypt` replace
+    one modular exponentiation with the full modulus by two with half-size
+    moduli.
+
+    A multi-prime key also carries the other prime factors of the modulus,
+    each one with its CRT exponent and coefficient (`OtherPrimeInfo` in
+    PKCS #1), and is decrypted with all of them.
+
+    The key is immutable and keeps no `__dict__`. It is validated and its
+    CRT parameters are computed once, when it is created, and `from_bytes`
+    loads them back without computing them again.
+
+    The key still behaves as the legacy `(d, n)` tuple: it can be unpacked,
+    indexed, hashed and compared with tuples. Two keys are equal when all
+    their numbers are.
+
+    Attributes
+    ----------
+    d : int
+        The private exponent.
+    n : int
+        The modulus.
+    p : int
+        The first prime factor of the modulus.
+    q : int
+        The second prime factor of the modulus.
+    dp : int
+        The CRT exponent of `p` (`d mod (p - 1)`).
+    dq : int
+        The CRT exponent of `q` (`d mod (q - 1)`).
+    qinv : int
+        The CRT coefficient (`q ** -1 mod p`).
+    primes : tuple[int, ...]
+        All the prime factors of the modulus, starting with `p` and `q`.
+    other_prime_infos : tuple[tuple[int, int, int], ...]
+        The `(r, d mod (r - 1), (p * q * ...) ** -1 mod r)` triple of each
+        other prime `r`, where the product covers the primes before `r`.
+    byte_length : int
+        The byte length of the modulus.
+
+    Methods
+    -------
+    to_bytes() -> bytes:
+        Serializes the key and its CRT parameters in a compact binary format.
+
+    from_bytes(data: bytes) -> RSAPrivateKey:
+        Loads a key serialized by `to_bytes`.
+
+    Examples
+    --------
+    >>> from fast_encrypt import RSA
+    >>> rsa = RSA()
+    >>> public_key, private_key = rsa.generate_keypair()
+    >>> private_key.p * private_key.q == private_key.n
+    True
+    >>> d, n = private_key
+    >>> RSAPrivateKey.from_bytes(private_key.to_bytes()).primes == private_key.primes
+    True
+    """
+
+    __slots__ = (
+        '_d',
+        '_n',
+        '_p',
+        '_q',
+        '_dp',
+        '_dq',
+        '_qinv',
+        '_other_prime_infos',
+        '_byte_length',
+    )
+
+    def __init__(self, d: int, n: int, p: int, q: int, *other_primes: int) -> None:
+        """
+        Initializes the private key and precomputes its CRT parameters.
+
+        Parameters
+        ----------
+        d : int
+            The private exponent.
+        n : int
+            The modulus.
+        p : int
+            The first prime factor of the modulus.
+        q : int
+            The second prime factor of the modulus.
+        *other_primes : int
+            The other prime factors of a multi-prime modulus.
+
+        Raises
+        ------
+        ValueError
+            If any value is not an int or if the product of the primes is not
+            the modulus.
+        """
+
+        self._validate_numbers(d, n, p, q, *other_primes)
+
+        self._set_numbers(
+            d,
+            n,
+            p,
+            q,
+            d % (p - 1),
+            d % (q - 1),
+            pow(q, -1, p),
+            self._create_other_prime_infos(d, p * q, other_primes),
+        )
+
+    def _set_numbers(
+        self,
+        d: int,
+        n: int,
+        p: int,
+        q: int,
+        dp: int,
+        dq: int,
+        qinv: int,
+        other_prime_infos: tuple[tuple[int, int, int], ...],
+    ) -> None:
+        object.__setattr__(self, '_d', d)
+        object.__setattr__(self, '_n', n)
+        object.__setattr__(self, '_p', p)
+        object.__setattr__(self, '_q', q)
+        object.__setattr__(self, '_dp', dp)
+        object.__setattr__(self, '_dq', dq)
+        object.__setattr__(self, '_qinv', qinv)
+        object.__setattr__(self, '_other_prime_infos', other_prime_infos)
+        object.__setattr__(self, '_byte_length', (n.bit_length() + 7) // 8)
+
+    def _validate_numbers(self, d: int, n: int, *primes: int) -> None:
+        for number in (d, n, *primes):
+            if not isinstance(number, int) or isinstance(number, bool):
+                raise ValueError('The given values must be int.')
+
+        if min(primes) < 2 or len(set(primes)) != len(primes):
+            raise ValueError('The primes must be distinct.')
+
+        if math.prod(primes) != n:
+            raise ValueError('The n must be the product of the primes.')
+
+    def _create_other_prime_infos(
+        self, d: int, product: int, other_primes: tuple[int, ...]
+    ) -> tuple[tuple[int, int, int], ...]:
+        other_prime_infos = []
+
+        for r in other_primes:
+            other_prime_infos.append((r, d % (r - 1), pow(product, -1, r)))
+            product *= r
+
+        return tuple(other_prime_infos)
+
+    @property
+    def d(self) -> int:
+        return self._d
+
+    @property
+    def n(self) -> int:
+        return self._n
+
+    @property
+    def p(self) -> int:
+        return self._p
+
+    @property
+    def q(self) -> int:
+        return self._q
+
+    @property
+    def dp(self) -> int:
+        return self._dp
+
+    @property
+    def dq(self) -> int:
+        return self._dq
+
+    @property
+    def qinv(self) -> int:
+        return self._qinv
+
+    @property
+    def primes(self) -> tuple[int, ...]:
+        return (self._p, self._q, *(info[0] for info in self._other_prime_infos))
+
+    @property
+    def other_prime_infos(self) -> tuple[tuple[int, int, int], ...]:
+        return self._other_prime_infos
+
+    @property
+    def byte_length(self) -> int:
+        return self._byte_length
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the key and its CRT parameters in a compact binary format.
+
+        Returns
+        -------
+        bytes
+            The serialized key.
+        """
+
+        numbers = (self._d, self._n, self._p, self._q, self._dp, self._dq, self._qinv)
+
+        return pack_key_numbers(
+            private_key_kind, numbers + tuple(itertools.chain(*self._other_prime_infos))
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'RSAPrivateKey':
+        """
+        Loads a key serialized by `to_bytes`.
+
+        The CRT parameters are loaded as they were serialized, so only the
+        product of the primes is checked against the modulus.
+
+        Parameters
+        ----------
+        data : bytes
+            The serialized key.
+
+        Returns
+        -------
+        RSAPrivateKey
+            The private key.
+
+        Raises
+        ------
+        ValueError
+            If the data is not a serialized private key.
+        """
+
+        numbers = unpack_key_numbers(data, private_key_kind)
+
+        if len(numbers) < 7 or (len(numbers) - 7) % 3:
+            raise ValueError('The given value is not a valid key.')
+
+        d, n, p, q, dp, dq, qinv = numbers[:7]
+        other_prime_infos = tuple(zip(*[iter(numbers[7:])] * 3))
+
+        private_key = cls.__new__(cls)
+        private_key._validate_numbers(d, n, p, q, *(info[0] for info in other_prime_infos))
+        private_key._set_numbers(d, n, p, q, dp, dq, qinv, other_prime_infos)
+
+        return private_key
+
+    def __iter__(self) -> Iterator[int]:
+        return iter((self._d, self._n))
+
+    def __getitem__(self, index: int) -> int:
+        return (self._d, self._n)[index]
+
+    def __len__(self) -> int:
+        return 2
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, RSAPrivateKey):
+            return self.to_bytes() == other.to_bytes()
+
+        if isinstance(other, tuple):
+            return (self._d, self._n) == other
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        # Equal to the hash of the legacy tuple, since the key is equal to it.
+        return hash((self._d, self._n))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError('RSAPrivateKey is immutable.')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError('RSAPrivateKey is immutable.')
+
+    def __reduce__(self) -> tuple:
+        return type(self), (self._d, self._n, *self.primes)
+
+    def __repr__(self) -> str:
+        return f'RSAPrivateKey(n_bits={self._n.bit_length()}, primes={len(self.primes)})'
@@ -0,0 +1,162 @@
+"""
+Defines a class for immutable RSA public keys.
+"""
+
+from typing import Any, Iterator
+
+from ._key_serialization import pack_key_numbers, public_key_kind, unpack_key_numbers
+
+
+class RSAPublicKey:
+    """
+    Class for immutable RSA public keys.
+
+    The key is validated once, when it is created, so `RSA.encrypt` doesn't
+    validate it again on every call. It keeps no `__dict__`, so thousands of
+    keys can be kept in memory cheaply.
+
+    The key still behaves as the legacy `(e, n)` tuple: it can be unpacked,
+    indexed, hashed and compared with tuples.
+
+    Attributes
+    ----------
+    e : int
+        The public exponent.
+    n : int
+        The modulus.
+    byte_length : int
+        The byte length of the modulus, which is the width of each number
+        in the binary cipher texts.
+
+    Methods
+    -------
+    to_bytes() -> bytes:
+        Serializes the key in a compact binary format.
+
+    from_bytes(data: bytes) -> RSAPublicKey:
+        Loads a key serialized by `to_bytes`.
+
+    Examples
+    --------
+    >>> from fast_encrypt import RSA, RSAPublicKey
+    >>> rsa = RSA()
+    >>> public_key, private_key = rsa.generate_keypair(public_exponent=65537)
+    >>> e, n = public_key
+    >>> RSAPublicKey.from_bytes(public_key.to_bytes()) == public_key
+    True
+    """
+
+    __slots__ = ('_e', '_n', '_byte_length')
+
+    def __init__(self, e: int, n: int) -> None:
+        """
+        Initializes the public key.
+
+        Parameters
+        ----------
+        e : int
+            The public exponent.
+        n : int
+            The modulus.
+
+        Raises
+        ------
+        ValueError
+            If any value is not a positive int.
+        """
+
+        self._validate_numbers(e, n)
+
+        object.__setattr__(self, '_e', e)
+        object.__setattr__(self, '_n', n)
+        object.__setattr__(self, '_byte_length', (n.bit_length() + 7) // 8)
+
+    def _validate_numbers(self, e: int, n: int) -> None:
+        for number in (e, n):
+            if not isinstance(number, int) or isinstance(number, bool):
+                raise ValueError('The given values must be int.')
+
+            if number < 1:
+                raise ValueError('The given values must be positive.')
+
+    @property
+    def e(self) -> int:
+        return self._e
+
+    @property
+    def n(self) -> int:
+        return self._n
+
+    @property
+    def byte_length(self) -> int:
+        return self._byte_length
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the key in a compact binary format.
+
+        Returns
+        -------
+        bytes
+            The serialized key.
+        """
+
+        return pack_key_numbers(public_key_kind, (self._e, self._n))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'RSAPublicKey':
+        """
+        Loads a key serialized by `to_bytes`.
+
+        Parameters
+        ----------
+        data : bytes
+            The serialized key.
+
+        Returns
+        -------
+        RSAPublicKey
+            The public key.
+
+        Raises
+        ------
+        ValueError
+            If the data is not a serialized public key.
+        """
+
+        numbers = unpack_key_numbers(data, public_key_kind)
+
+        if len(numbers) != 2:
+            raise ValueError('The given value is not a valid key.')
+
+        return cls(*numbers)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter((self._e, self._n))
+
+    def __getitem__(self, index: int) -> int:
+        return (self._e, self._n)[index]
+
+    def __len__(self) -> int:
+        return 2
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (RSAPublicKey, tuple)):
+            return tuple(self) == tuple(other)
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self._e, self._n))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError('RSAPublicKey is immutable.')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError('RSAPublicKey is immutable.')
+
+    def __reduce__(self) -> tuple:
+        return type(self), (self._e, self._n)
+
+    def __repr__(self) -> str:
+        return f'RSAPublicKey(e={self._e}, n_bits={self._n.bit_length()})'
@@ -0,0 +1,154 @@
+"""
+Defines a size-bounded LRU cache for RSA char tokens.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable, NamedTuple
+
+
+class RSACacheInfo(NamedTuple):
+    """
+    Statistics of a `RSATokenCache`, in the same shape as `functools.lru_cache`.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class RSATokenCache:
+    """
+    Class for a size-bounded LRU cache of RSA char tokens.
+
+    Each entry maps a number (a code point or a cipher token) to its
+    modular exponentiation under one key. The entries of each key are
+    grouped by a namespace, such as `('encrypt', e, n)`, so they can be
+    evicted together.
+
+    Methods
+    -------
+    map(namespace: Hashable, numbers: Iterable[int], function: Callable[[int], int]) -> list[int]:
+        Maps the numbers with the function, reusing the cached results.
+
+    info() -> RSACacheInfo:
+        Returns the cache statistics.
+
+    evict(namespace: Hashable) -> None:
+        Removes every entry of the namespace.
+
+    clear() -> None:
+        Removes every entry and resets the statistics.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Initializes the cache with the given maximum number of entries.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of cached entries.
+        """
+
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple[Hashable, int], int] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def map(
+        self, namespace: Hashable, numbers: Iterable[int], function: Callable[[int], int]
+    ) -> list[int]:
+        """
+        Maps the numbers with the function, reusing the cached results.
+
+        Parameters
+        ----------
+        namespace : Hashable
+            The namespace of the key the function depends on.
+        numbers : Iterable[int]
+            The numbers to be mapped.
+        function : Callable[[int], int]
+            The function that computes the uncached results.
+
+        Returns
+        -------
+        list[int]
+            The mapped numbers.
+        """
+
+        results = []
+
+        for number in numbers:
+            entry_key = namespace, number
+
+            with self._lock:
+                result = self._entries.get(entry_key)
+
+                if result is not None:
+                    self._entries.move_to_end(entry_key)
+                    self._hits += 1
+                else:
+                    self._misses += 1
+
+            if result is None:
+                result = function(number)
+
+                with self._lock:
+                    self._entries[entry_key] = result
+
+                    if len(self._entries) > self._maxsize:
+                        self._entries.popitem(last=False)
+
+            results.append(result)
+
+        return results
+
+    def info(self) -> RSACacheInfo:
+        """
+        Returns the cache statistics.
+
+        Returns
+        -------
+        RSACacheInfo
+            The hits, misses, maximum size and current size of the cache.
+        """
+
+        with self._lock:
+            return RSACacheInfo(self._hits, self._misses, self._maxsize, len(self._entries))
+
+    def evict(self, namespace: Hashable) -> None:
+        """
+        Removes every entry of the namespace.
+
+        Parameters
+        ----------
+        namespace : Hashable
+            The namespace to be evicted.
+        """
+
+        with self._lock:
+            for entry_key in [key for key in self._entries if key[0] == namespace]:
+                del self._entries[entry_key]
+
+    def clear(self) -> None:
+        """
+        Removes every entry and resets the statistics.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state['_lock']
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -49,3 +49,35 @@ class SimpleEncryptor(metaclass=ABCMeta):
         str
             The decrypted plaintext.
         """
+
+    def _encrypt_normalized(self, text: str) -> str:
+        """
+        Encrypts a text already validated, stripped and normalized.
+
+        `Pipeline` calls it after normalizing the text once for all its
+        steps. By default, it encrypts the text with `encrypt`.
+        """
+
+        return self.encrypt(text)
+
+    def _decrypt_normalized(self, cipher_text: str) -> str:
+        """
+        Decrypts a cipher text already validated and stripped.
+
+        `Pipeline` calls it after stripping the cipher text once for all its
+        steps. By default, it decrypts the cipher text with `decrypt`.
+        """
+
+        return self.decrypt(cipher_text)
+
+    def _encrypt_stream_chunk(self, text: str, state: dict) -> str:
+        """
+        Encrypts a chunk of a stripped and normalized text stream.
+
+        `Pipeline.encrypt_stream` calls it for each chunk of the stream with
+        the same `state` dict, where the step keeps what it needs to carry
+        from one chunk to the next. By default, the chunk is encrypted on its
+        own with `_encrypt_normalized`.
+        """
+
+        return self._encrypt_normalized(text)
@@ -2,6 +2,7 @@
 Defines a class for encrypting and decrypting text using substitution cipher.
 """
 
+from ._normalization import normalize_text
 from ._simple_encryptor import SimpleEncryptor
 
 
@@ -45,7 +46,7 @@ class Substitution(SimpleEncryptor):
     "John Frusciante"
     """
 
-    def __init__(self, key: str) -> None:
+    def __init__(self, key: str, unicode_folding: bool = False) -> None:
         """
         Initializes the Substitution cipher with the given key.
 
@@ -53,17 +54,24 @@ class Substitution(SimpleEncryptor):
         ----------
         key : str
             The substitution key (with 26 no repeated alpha chars).
+        unicode_folding : bool, optional
+            If True, the text to be encrypted is also folded with the Unicode NFKD
+            normalization instead of only having its accents replaced, by default False.
 
         Raises
         ------
         ValueError
-            If the key is not a valid substitution key.
+            If the key is not a valid substitution key or the unicode_folding
+            is not a bool.
         """
 
         self._alphabet = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
 
         self._validate_key(key)
         self._substitution_dict = self._create_substitution_dict(key)
+        self._validate_unicode_folding(unicode_folding)
+        self._unicode_folding = unicode_folding
+        self._encryption_table, self._decryption_table = self._create_translation_tables()
 
     def _validate_key(self, key: str) -> None:
         if not isinstance(key, str):
@@ -85,6 +93,10 @@ class Substitution(SimpleEncryptor):
 
             key_chars.append(char.upper())
 
+    def _validate_unicode_folding(self, unicode_folding: bool) -> None:
+        if not isinstance(unicode_folding, bool):
+            raise ValueError('The unicode_folding must be a bool.')
+
     def _create_substitution_dict(self, key: str) -> dict[str, str]:
         substitution_dict = {}
 
@@ -93,6 +105,18 @@ class Substitution(SimpleEncryptor):
 
         return substitution_dict
 
+    def _create_translation_tables(self) -> tuple[dict[int, int], dict[int, int]]:
+        original_chars = ''.join(self._substitution_dict.keys())
+        substitute_chars = ''.join(self._substitution_dict.values())
+
+        original_chars += original_chars.lower()
+        substitute_chars += substitute_chars.lower()
+
+        encryption_table = str.maketrans(original_chars, substitute_chars)
+        decryption_table = str.maketrans(substitute_chars, original_chars)
+
+        return encryption_table, decryption_table
+
     def encrypt(self, text: str) -> str:
         """
         Encrypts the input text using substitution cipher.
@@ -120,41 +144,17 @@ class Substitution(SimpleEncryptor):
 
         handled_text = self._handle_text(text)
 
-        encrypted_text = ''
+        return self._encrypt_normalized(handled_text)
 
-        for char in handled_text:
-            for original, substitute in self._substitution_dict.items():
-                if char.upper() == original:
-                    encrypted_text += substitute if char.isupper() else substitute.lower()
-                    break
-            else:
-                encrypted_text += char
-
-        return encrypted_text
+    def _encrypt_normalized(self, text: str) -> str:
+        return text.translate(self._encryption_table)
 
     def _validate_text(self, text: str) -> None:
         if not isinstance(text, str):
             raise ValueError('The given value must be a str.')
 
     def _handle_text(self, text: str) -> str:
-        handled_text = text.strip()
-
-        substitute_letters = {
-            'A': ('Á', 'À', 'Ã', 'Â', 'Ä'),
-            'E': ('É', 'È', 'Ê', 'Ë'),
-            'I': ('Í', 'Ì', 'Î', 'Ï'),
-            'O': ('Ò', 'Ó', 'Ô', 'Õ', 'Ö'),
-            'U': ('Ú', 'Ù', 'Û', 'Ü'),
-            'C': ('Ç',),
-        }
-
-        for key, letters in substitute_letters.items():
-            for letter in letters:
-                if letter in handled_text.upper():
-                    handled_text = handled_text.replace(letter, key)
-                    handled_text = handled_text.replace(letter.lower(), key.lower())
-
-        return handled_text
+        return normalize_text(text.strip(), self._unicode_folding)
 
     def decrypt(self, cipher_text: str) -> str:
         """
@@ -183,17 +183,10 @@ class Substitution(SimpleEncryptor):
 
         handled_cipher_text = self._handle_cipher_text(cipher_text)
 
-        decrypted_text = ''
-
-        for char in handled_cipher_text:
-            for original, substitute in self._substitution_dict.items():
-                if char.upper() == substitute:
-                    decrypted_text += original if char.isupper() else original.lower()
-                    break
-            else:
-                decrypted_text += char
+        return self._decrypt_normalized(handled_cipher_text)
 
-        return decrypted_text
+    def _decrypt_normalized(self, cipher_text: str) -> str:
+        return cipher_text.translate(self._decryption_table)
 
     def _handle_cipher_text(self, cipher_text: str) -> str:
         return cipher_text.strip()
@@ -2,6 +2,9 @@
 Defines a class for encrypting and decrypting text using the Vigenère cipher.
 """
 
+import re
+
+from ._normalization import normalize_text
 from ._simple_encryptor import SimpleEncryptor
 
 
@@ -46,7 +49,10 @@ class Vigenere(SimpleEncryptor):
     "Jimmy Page"
     """
 
-    def __init__(self, key: str) -> None:
+    _letter_runs = re.compile('([A-Za-z]+)')
+    _non_letters = re.compile('[^A-Za-z]+')
+
+    def __init__(self, key: str, unicode_folding: bool = False) -> None:
         """
         Initializes the Vigenère cipher with the given key.
 
@@ -54,17 +60,28 @@ class Vigenere(SimpleEncryptor):
         ----------
         key : str
             The key for encryption and decryption.
+        unicode_folding : bool, optional
+            If True, the text to be encrypted is also folded with the Unicode NFKD
+            normalization instead of only having its accents replaced, by default False.
 
         Raises
         ------
         ValueError
-            If the key contains non-alphabetic characters.
+            If the key contains non-alphabetic characters or the unicode_folding
+            is not a bool.
         """
 
         self._alphabet = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
 
         self._validate_key(key)
         self._key = key.strip().upper()
+        self._validate_unicode_folding(unicode_folding)
+        self._unicode_folding = unicode_folding
+        self._shift_schedule = self._create_shift_schedule()
+        self._encryption_tables = self._create_translation_tables(self._shift_schedule)
+        self._decryption_tables = self._create_translation_tables(
+            [-shift for shift in self._shift_schedule]
+        )
 
     def _validate_key(self, key: str) -> None:
         if not isinstance(key, str):
@@ -77,6 +94,54 @@ class Vigenere(SimpleEncryptor):
             if not char.isalpha() or char.upper() not in self._alphabet:
                 raise ValueError('The key must contains alphabetic chars.')
 
+    def _validate_unicode_folding(self, unicode_folding: bool) -> None:
+        if not isinstance(unicode_folding, bool):
+            raise ValueError('The unicode_folding must be a bool.')
+
+    def _create_shift_schedule(self) -> list[int]:
+        return [self._alphabet.index(char) for char in self._key]
+
+    def _create_translation_tables(self, shift_schedule: list[int]) -> list[dict[int, int]]:
+        original_chars = self._alphabet + self._alphabet.lower()
+
+        translation_tables = []
+
+        for shift in shift_schedule:
+            shift %= 26
+            shifted_alphabet = self._alphabet[shift:] + self._alphabet[:shift]
+            shifted_chars = shifted_alphabet + shifted_alphabet.lower()
+
+            translation_tables.append(str.maketrans(original_chars, shifted_chars))
+
+        return translation_tables
+
+    def _shift_letters(self, text: str, translation_tables: list[dict[int, int]]) -> str:
+        letters = self._non_letters.sub('', text)
+
+        key_period = len(translation_tables)
+        shifted_chars = list(letters)
+
+        for key_index, translation_table in enumerate(translation_tables[: len(letters)]):
+            shifted_chars[key_index::key_period] = letters[key_index::key_period].translate(
+                translation_table
+            )
+
+        shifted_letters = ''.join(shifted_chars)
+
+        if len(shifted_letters) == len(text):
+            return shifted_letters
+
+        text_pieces = self._letter_runs.split(text)
+
+        position = 0
+
+        for i in range(1, len(text_pieces), 2):
+            run_length = len(text_pieces[i])
+            text_pieces[i] = shifted_letters[position : position + run_length]
+            position += run_length
+
+        return ''.join(text_pieces)
+
     def encrypt(self, text: str) -> str:
         """
         Encrypts the input text using the Vigenère cipher.
@@ -104,46 +169,29 @@ class Vigenere(SimpleEncryptor):
 
         handled_text = self._handle_text(text)
 
-        encrypted_text = ''
-
-        key_index = 0
+        return self._encrypt_normalized(handled_text)
 
-        for char in handled_text:
-            if char.isalpha():
-                shift = ord(self._key[key_index % len(self._key)]) - ord('A')
-                encrypted_char = chr((ord(char.upper()) - ord('A') + shift) % 26 + ord('A'))
+    def _encrypt_normalized(self, text: str) -> str:
+        return self._shift_letters(text, self._encryption_tables)
 
-                encrypted_text += encrypted_char if char.isupper() else encrypted_char.lower()
+    def _encrypt_stream_chunk(self, text: str, state: dict) -> str:
+        # The key only advances on letters, so the next chunk starts at the key
+        # index after the letters of this one.
+        key_index = state.get('key_index', 0)
+        key_period = len(self._encryption_tables)
 
-                key_index += 1
-            else:
-                encrypted_text += char
+        state['key_index'] = (key_index + len(self._non_letters.sub('', text))) % key_period
 
-        return encrypted_text
+        return self._shift_letters(
+            text, self._encryption_tables[key_index:] + self._encryption_tables[:key_index]
+        )
 
     def _validate_text(self, text: str) -> None:
         if not isinstance(text, str):
             raise ValueError('The given value must be a str.')
 
     def _handle_text(self, text: str) -> str:
-        handled_text = text.strip()
-
-        substitute_letters = {
-            'A': ('Á', 'À', 'Ã', 'Â', 'Ä'),
-            'E': ('É', 'È', 'Ê', 'Ë'),
-            'I': ('Í', 'Ì', 'Î', 'Ï'),
-            'O': ('Ò', 'Ó', 'Ô', 'Õ', 'Ö'),
-            'U': ('Ú', 'Ù', 'Û', 'Ü'),
-            'C': ('Ç',),
-        }
-
-        for key, letters in substitute_letters.items():
-            for letter in letters:
-                if letter in handled_text.upper():
-                    handled_text = handled_text.replace(letter, key)
-                    handled_text = handled_text.replace(letter.lower(), key.lower())
-
-        return handled_text
+        return normalize_text(text.strip(), self._unicode_folding)
 
     def decrypt(self, cipher_text: str) -> str:
         """
@@ -172,22 +220,10 @@ class Vigenere(SimpleEncryptor):
 
         handled_cipher_text = self._handle_cipher_text(cipher_text)
 
-        decrypted_text = ''
-
-        key_index = 0
-
-        for char in handled_cipher_text:
-            if char.isalpha():
-                shift = ord(self._key[key_index % len(self._key)]) - ord('A')
-                decrypted_char = chr((ord(char.upper()) - ord('A') - shift + 26) % 26 + ord('A'))
-
-                decrypted_text += decrypted_char if char.isupper() else decrypted_char.lower()
-
-                key_index += 1
-            else:
-                decrypted_text += char
+        return self._decrypt_normalized(handled_cipher_text)
 
-        return decrypted_text
+    def _decrypt_normalized(self, cipher_text: str) -> str:
+        return self._shift_letters(cipher_text, self._decryption_tables)
 
     def _handle_cipher_text(self, cipher_text: str) -> str:
         return cipher_text.strip()
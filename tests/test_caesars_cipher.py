@@ -52,6 +52,36 @@ class TestCaesarsCipher:
         assert encryption_result == expected_encryption
         assert decryption_result == expected_decryption
 
+    def test_when_receives_shift_3_and_then_encrypts_and_decrypts_xyz_XYZ_wraps_around_the_alphabet(
+        self,
+    ):
+        caesars = CaesarsCipher(3)
+        entry = 'xyz XYZ 123'
+
+        encryption_result = caesars.encrypt(entry)
+        expected_encryption = 'abc ABC 123'
+
+        decryption_result = caesars.decrypt(expected_encryption)
+        expected_decryption = 'xyz XYZ 123'
+
+        assert encryption_result == expected_encryption
+        assert decryption_result == expected_decryption
+
+    def test_when_receives_shift_1_and_unicode_folding_and_then_encrypts_Espana_km2_returns_the_folded_cipher_text(
+        self,
+    ):
+        caesars = CaesarsCipher(1, unicode_folding=True)
+        entry = 'España km²'
+
+        result = caesars.encrypt(entry)
+        expected = 'Ftqbob ln2'
+
+        assert result == expected
+
+    def test_when_unicode_folding_receives_1_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            CaesarsCipher(1, unicode_folding=1)
+
     def test_when_shift_receives_0_raises_ValueError(self):
         with pytest.raises(ValueError):
             CaesarsCipher(0)
@@ -43,6 +43,18 @@ class TestHomophonicSubstitution:
 
         assert decrypted_text == expected
 
+    def test_when_receives_key_KEY_and_then_encrypts_a_repeated_letter_uses_its_three_homophones(
+        self,
+    ):
+        h_substitution = HomophonicSubstitution('KEY')
+        entry = 'A' * 300
+
+        encrypted_text = h_substitution.encrypt(entry)
+        decrypted_text = h_substitution.decrypt(encrypted_text)
+
+        assert len(set(encrypted_text)) == 3
+        assert decrypted_text == entry
+
     def test_when_key_receives_nothing_raises_TypeError(self):
         with pytest.raises(TypeError):
             HomophonicSubstitution()
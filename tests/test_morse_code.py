@@ -56,6 +56,21 @@ class TestMorseCode:
         assert encryption_result == expected_encryption
         assert decryption_result == expected_decryption
 
+    def test_when_receives_unicode_folding_and_then_encrypts_Espana_returns_the_folded_morse_code(
+        self,
+    ):
+        morse = MorseCode(unicode_folding=True)
+        entry = 'España'
+
+        result = morse.encrypt(entry)
+        expected = '. ... .--. .- -. .-'
+
+        assert result == expected
+
+    def test_when_unicode_folding_receives_None_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            MorseCode(None)
+
     def test_when_the_encrypt_method_receives_int_raises_ValueError(self):
         morse = MorseCode()
 
@@ -103,3 +118,40 @@ class TestMorseCode:
 
         with pytest.raises(ValueError):
             morse.decrypt('.-.-.-.---.-.-.')
+
+    def test_when_encrypts_and_decrypts_accented_letters_returns_the_unaccented_values(self):
+        morse = MorseCode()
+        entry = 'Ação é Ótima'
+
+        encryption_result = morse.encrypt(entry)
+        expected_encryption = '.- -.-. .- --- . --- - .. -- .-'
+
+        assert encryption_result == expected_encryption
+        assert morse.decrypt(encryption_result) == 'ACAOEOTIMA'
+
+    def test_when_encrypts_unknown_chars_skips_them(self):
+        morse = MorseCode()
+        entry = 'Hi @ you # 2'
+
+        result = morse.encrypt(entry)
+        expected = '.... .. -.-- --- ..- ..---'
+
+        assert result == expected
+
+    def test_when_encrypts_words_separated_by_whitespace_joins_them(self):
+        morse = MorseCode()
+
+        assert morse.encrypt('Hello  World\tagain') == (
+            '.... . .-.. .-.. --- .-- --- .-. .-.. -.. .- --. .- .. -.'
+        )
+
+    def test_when_decrypts_codes_separated_by_many_spaces_returns_the_letters(self):
+        morse = MorseCode()
+
+        assert morse.decrypt('  .... ..   .. ') == 'HII'
+
+    def test_when_decrypts_an_unknown_code_raises_ValueError(self):
+        morse = MorseCode()
+
+        with pytest.raises(ValueError):
+            morse.decrypt('...... .-')
@@ -1,6 +1,18 @@
+import io
+import os
+
 import pytest
 
-from src.fast_encrypt import Atbash, CaesarsCipher, HomophonicSubstitution, MorseCode, Pipeline
+from src.fast_encrypt import (
+    Atbash,
+    CaesarsCipher,
+    HomophonicSubstitution,
+    MorseCode,
+    Pipeline,
+    Substitution,
+    Vigenere,
+)
+from src.fast_encrypt._simple_encryptor import SimpleEncryptor
 
 
 class TestPipeline:
@@ -135,3 +147,331 @@ class TestPipeline:
 
         with pytest.raises(ValueError):
             pipeline.decrypt(None)
+
+    def test_when_compiles_Atbash_CaesarsCipher_Substitution_MorseCode_returns_the_fused_plan(self):
+        pipeline = Pipeline(
+            [Atbash(), CaesarsCipher(3), Substitution('QWERTYUIOPASDFGHJKLZXCVBNM'), MorseCode()]
+        )
+
+        result = pipeline.compile()
+        expected = ['Substitution(Atbash, CaesarsCipher, Substitution)', 'MorseCode']
+
+        assert result == expected
+
+    def test_when_compiles_Atbash_Atbash_MorseCode_returns_only_MorseCode(self):
+        pipeline = Pipeline([Atbash(), Atbash(), MorseCode()])
+
+        assert pipeline.compile() == ['MorseCode']
+
+    def test_when_compiles_Atbash_Atbash_returns_an_identity_Substitution(self):
+        pipeline = Pipeline([Atbash(), Atbash()])
+
+        assert pipeline.compile() == ['Substitution(Atbash, Atbash)']
+        assert pipeline.encrypt(' Olá Mundo! ') == 'Ola Mundo!'
+
+    def test_when_compiles_steps_with_different_unicode_folding_does_not_fuse_them(self):
+        pipeline = Pipeline([Atbash(), CaesarsCipher(3, unicode_folding=True)])
+
+        assert pipeline.compile() == ['Atbash', 'CaesarsCipher']
+
+    def test_when_compiles_the_pipeline_returns_the_same_cipher_texts(self):
+        steps = [
+            CaesarsCipher(3),
+            Atbash(),
+            Substitution('QWERTYUIOPASDFGHJKLZXCVBNM'),
+            Vigenere('KEY'),
+            CaesarsCipher(5),
+            Atbash(),
+        ]
+        pipeline = Pipeline(steps)
+        compiled_pipeline = Pipeline(steps)
+        compiled_pipeline.compile()
+        entry = 'Brasil (oficialmente República Federativa do Brasil), é o maior país'
+
+        cipher_text = pipeline.encrypt(entry)
+
+        assert compiled_pipeline.encrypt(entry) == cipher_text
+        assert compiled_pipeline.decrypt(cipher_text) == pipeline.decrypt(cipher_text)
+
+    def test_when_compiles_an_Atbash_Atbash_run_after_a_custom_step_returns_the_same_cipher_texts(
+        self,
+    ):
+        class Lower(SimpleEncryptor):
+            def encrypt(self, text: str) -> str:
+                return f' {text.lower()} ã'
+
+            def decrypt(self, cipher_text: str) -> str:
+                return f' {cipher_text.lower()} ã'
+
+        steps = [Lower(), Atbash(), Atbash()]
+        pipeline = Pipeline(steps)
+        compiled_pipeline = Pipeline(steps)
+        entry = 'Olá Mundo!'
+
+        plan = compiled_pipeline.compile()
+        cipher_text = pipeline.encrypt(entry)
+
+        assert plan == ['Lower', 'Substitution(Atbash, Atbash)']
+        assert compiled_pipeline.encrypt(entry) == cipher_text
+        assert compiled_pipeline.decrypt(' Ágata ') == pipeline.decrypt(' Ágata ')
+
+    def test_when_compiles_an_Atbash_run_decrypts_accented_cipher_texts_as_each_step(self):
+        steps = [Atbash(), CaesarsCipher(3), Atbash(), CaesarsCipher(5)]
+        pipeline = Pipeline(steps)
+        compiled_pipeline = Pipeline(steps)
+        cipher_text = ' Ágata, Ação '
+
+        plan = compiled_pipeline.compile()
+
+        assert plan == ['Substitution(Atbash, CaesarsCipher, Atbash)', 'CaesarsCipher']
+        assert compiled_pipeline.decrypt(cipher_text) == pipeline.decrypt(cipher_text)
+
+    def test_when_compiles_CaesarsCipher_Vigenere_Vigenere_returns_a_fused_Vigenere(self):
+        pipeline = Pipeline([CaesarsCipher(3), Vigenere('KEY'), Vigenere('AB')])
+
+        result = pipeline.compile()
+        expected = ['Vigenere(CaesarsCipher, Vigenere, Vigenere)']
+
+        assert result == expected
+
+    def test_when_compiles_CaesarsCipher_Vigenere_Vigenere_returns_the_same_cipher_texts(self):
+        steps = [
+            CaesarsCipher(3),
+            Vigenere('KEY'),
+            Vigenere('LEMON'),
+            CaesarsCipher(7),
+            MorseCode(),
+        ]
+        pipeline = Pipeline(steps)
+        compiled_pipeline = Pipeline(steps)
+        compiled_pipeline.compile()
+        entry = 'Josh Klinghoffer, 1979'
+
+        cipher_text = pipeline.encrypt(entry)
+
+        assert compiled_pipeline.encrypt(entry) == cipher_text
+        assert compiled_pipeline.decrypt(cipher_text) == pipeline.decrypt(cipher_text)
+
+    def test_when_compiles_Vigenere_keys_with_a_large_lcm_splits_the_fused_key_period(self):
+        steps = [
+            Vigenere('KEYBOARDING'),
+            CaesarsCipher(3),
+            Vigenere('CRYPTOGRAPHIC'),
+            Vigenere('ABCDEFGHIJKLMNOPQ'),
+            Vigenere('ENCYCLOPEDIAGALACTI'),
+        ]
+        pipeline = Pipeline(steps)
+        compiled_pipeline = Pipeline(steps)
+        entry = 'Brasil (oficialmente República Federativa do Brasil) ' * 50
+
+        plan = compiled_pipeline.compile()
+        cipher_text = pipeline.encrypt(entry)
+
+        assert plan == [
+            'Vigenere(Vigenere, CaesarsCipher, Vigenere)',
+            'Vigenere(Vigenere, Vigenere)',
+        ]
+        assert compiled_pipeline.encrypt(entry) == cipher_text
+        assert compiled_pipeline.decrypt(cipher_text) == pipeline.decrypt(cipher_text)
+
+    def test_when_compiles_Vigenere_AB_Vigenere_ZY_CaesarsCipher_1_returns_only_MorseCode(self):
+        pipeline = Pipeline([Vigenere('AB'), Vigenere('ZY'), CaesarsCipher(1), MorseCode()])
+
+        assert pipeline.compile() == ['MorseCode']
+
+    def test_when_compiles_a_zero_sum_shift_run_after_a_custom_step_returns_the_same_cipher_texts(
+        self,
+    ):
+        class Lower(SimpleEncryptor):
+            def encrypt(self, text: str) -> str:
+                return f' {text.lower()} ã'
+
+            def decrypt(self, cipher_text: str) -> str:
+                return cipher_text.lower()
+
+        steps = [Lower(), CaesarsCipher(1), Vigenere('Z')]
+        pipeline = Pipeline(steps)
+        compiled_pipeline = Pipeline(steps)
+        entry = 'Olá Mundo!'
+
+        plan = compiled_pipeline.compile()
+        cipher_text = pipeline.encrypt(entry)
+
+        assert plan == ['Lower', 'Vigenere(CaesarsCipher, Vigenere)']
+        assert compiled_pipeline.encrypt(entry) == cipher_text
+        assert compiled_pipeline.decrypt(cipher_text) == pipeline.decrypt(cipher_text)
+
+    def test_when_encrypts_with_a_custom_step_returns_the_same_value_as_each_step(self):
+        class Reverse(SimpleEncryptor):
+            def encrypt(self, text: str) -> str:
+                return f' {text[::-1]} '
+
+            def decrypt(self, cipher_text: str) -> str:
+                return cipher_text[::-1]
+
+        steps = [Reverse(), CaesarsCipher(3), Vigenere('KEY')]
+        pipeline = Pipeline(steps)
+        entry = 'Olá Mundo!'
+
+        expected = entry
+
+        for step in steps:
+            expected = step.encrypt(expected)
+
+        assert pipeline.encrypt(entry) == expected
+
+    def test_when_steps_have_different_unicode_folding_returns_the_same_value_as_each_step(self):
+        steps = [CaesarsCipher(3), Vigenere('KEY', unicode_folding=True), MorseCode()]
+        pipeline = Pipeline(steps)
+        entry = 'España ² ﬁ'
+
+        expected = entry
+
+        for step in steps:
+            expected = step.encrypt(expected)
+
+        assert pipeline.encrypt(entry) == expected
+
+    def test_when_steps_share_unicode_folding_returns_the_same_value_as_each_step(self):
+        steps = [
+            CaesarsCipher(3, unicode_folding=True),
+            Vigenere('KEY', unicode_folding=True),
+            MorseCode(unicode_folding=True),
+        ]
+        pipeline = Pipeline(steps)
+        entry = '  España ² ﬁ  '
+
+        expected = entry
+
+        for step in steps:
+            expected = step.encrypt(expected)
+
+        assert pipeline.encrypt(entry) == expected
+        assert pipeline.decrypt(expected) == 'ESPANA2FI'
+
+    def test_when_encrypts_a_stream_in_chunks_of_3_returns_the_same_value_as_encrypt(self):
+        pipeline = Pipeline([CaesarsCipher(3), Vigenere('KEY'), MorseCode()])
+        entry = '  Josh Klinghoffer, Olá Mundo!  '
+        writer = io.StringIO()
+
+        result = pipeline.encrypt_stream(io.StringIO(entry), writer, chunk_size=3, queue_size=1)
+
+        assert writer.getvalue() == pipeline.encrypt(entry)
+        assert result == len(writer.getvalue())
+
+    def test_when_encrypts_a_stream_with_a_compiled_pipeline_returns_the_same_value_as_encrypt(
+        self,
+    ):
+        pipeline = Pipeline([Atbash(), CaesarsCipher(3), Vigenere('LEMON', unicode_folding=True)])
+        pipeline.compile()
+        entry = 'España ² ﬁ, Brasil ' * 10
+        writer = io.StringIO()
+
+        pipeline.encrypt_stream(io.StringIO(entry), writer, chunk_size=7)
+
+        assert writer.getvalue() == pipeline.encrypt(entry)
+
+    def test_when_encrypts_a_whitespace_stream_writes_nothing(self):
+        pipeline = Pipeline([CaesarsCipher(3), MorseCode()])
+        writer = io.StringIO()
+
+        assert pipeline.encrypt_stream(io.StringIO('   \n  '), writer, chunk_size=2) == 0
+        assert writer.getvalue() == ''
+
+    def test_when_the_stream_writer_fails_raises_its_error(self):
+        class FailingWriter:
+            def write(self, text: str) -> int:
+                raise OSError('The disk is full.')
+
+        pipeline = Pipeline([CaesarsCipher(3), Vigenere('KEY'), MorseCode()])
+
+        with pytest.raises(OSError):
+            pipeline.encrypt_stream(
+                io.StringIO('Hello World! ' * 100), FailingWriter(), chunk_size=4
+            )
+
+    def test_when_a_stream_stage_fails_raises_its_error(self):
+        class FailingCaesarsCipher(CaesarsCipher):
+            def _encrypt_stream_chunk(self, text: str, state: dict) -> str:
+                raise OSError('The stage failed.')
+
+        pipeline = Pipeline([CaesarsCipher(3), FailingCaesarsCipher(3), MorseCode()])
+        writer = io.StringIO()
+
+        with pytest.raises(OSError):
+            pipeline.encrypt_stream(io.StringIO('Hello World! ' * 100), writer, chunk_size=4)
+
+        assert writer.getvalue() == ''
+
+    def test_when_a_stream_stage_process_exits_raises_RuntimeError(self):
+        class ExitingCaesarsCipher(CaesarsCipher):
+            def _encrypt_stream_chunk(self, text: str, state: dict) -> str:
+                os._exit(1)
+
+        pipeline = Pipeline([CaesarsCipher(3), ExitingCaesarsCipher(3), MorseCode()])
+
+        with pytest.raises(RuntimeError):
+            pipeline.encrypt_stream(
+                io.StringIO('Hello World! ' * 1000), io.StringIO(), chunk_size=4, queue_size=1
+            )
+
+    def test_when_the_stream_reader_reads_bytes_raises_ValueError(self):
+        pipeline = Pipeline([CaesarsCipher(3)])
+
+        with pytest.raises(ValueError):
+            pipeline.encrypt_stream(io.BytesIO(b'Hello World!'), io.StringIO())
+
+    def test_when_streams_a_custom_step_raises_ValueError(self):
+        class Reverse(SimpleEncryptor):
+            def encrypt(self, text: str) -> str:
+                return text[::-1]
+
+            def decrypt(self, cipher_text: str) -> str:
+                return cipher_text[::-1]
+
+        pipeline = Pipeline([Reverse()])
+
+        with pytest.raises(ValueError):
+            pipeline.encrypt_stream(io.StringIO('Hello World!'), io.StringIO())
+
+    def test_when_stream_chunk_size_receives_0_raises_ValueError(self):
+        pipeline = Pipeline([CaesarsCipher(3)])
+
+        with pytest.raises(ValueError):
+            pipeline.encrypt_stream(io.StringIO('Hello World!'), io.StringIO(), chunk_size=0)
+
+    def test_when_encrypts_many_and_decrypts_many_with_2_workers_returns_the_texts_in_order(self):
+        pipeline = Pipeline([CaesarsCipher(3), Vigenere('KEY'), MorseCode()])
+        entries = ['Hello World!', 'John Frusciante', 'Olá Mundo', 'Jimmy Page', 'Saul Hudson']
+
+        cipher_texts = pipeline.encrypt_many(entries, workers=2, chunk_size=2)
+        plaintexts = pipeline.decrypt_many(cipher_texts, workers=2, chunk_size=2)
+
+        assert cipher_texts == [pipeline.encrypt(entry) for entry in entries]
+        assert plaintexts == ['HELLOWORLD', 'JOHNFRUSCIANTE', 'OLAMUNDO', 'JIMMYPAGE', 'SAULHUDSON']
+
+    def test_when_encrypts_many_unordered_returns_the_same_cipher_texts(self):
+        pipeline = Pipeline([Atbash(), CaesarsCipher(3)])
+        entries = [f'Record {i}' for i in range(20)]
+
+        cipher_texts = pipeline.encrypt_many(entries, workers=2, chunk_size=3, ordered=False)
+
+        assert sorted(cipher_texts) == sorted(pipeline.encrypt(entry) for entry in entries)
+
+    def test_when_the_encrypt_many_method_receives_a_text_as_int_raises_ValueError(self):
+        pipeline = Pipeline([CaesarsCipher(3)])
+
+        with pytest.raises(ValueError):
+            pipeline.encrypt_many(['abc', 1])
+
+    def test_when_the_decrypt_many_method_receives_chunk_size_0_raises_ValueError(self):
+        pipeline = Pipeline([CaesarsCipher(3)])
+
+        with pytest.raises(ValueError):
+            pipeline.decrypt_many(['abc', 'def'], chunk_size=0)
+
+    def test_when_the_encrypt_many_method_receives_ordered_as_int_raises_ValueError(self):
+        pipeline = Pipeline([CaesarsCipher(3)])
+
+        with pytest.raises(ValueError):
+            pipeline.encrypt_many(['abc', 'def'], workers=1, ordered=1)
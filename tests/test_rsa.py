@@ -1,6 +1,9 @@
+import io
+import threading
+
 import pytest
 
-from src.fast_encrypt import RSA
+from src.fast_encrypt import KeyGenerationCancelledError, KeyGenerationTimeoutError, RSA
 
 
 class TestRSA:
@@ -49,6 +52,418 @@ class TestRSA:
 
         assert decrypted_text == expected
 
+    def test_when_decrypts_with_the_private_key_and_its_legacy_tuple_returns_the_same_value(
+        self,
+    ):
+        rsa = RSA()
+        entry = 'Hello World!'
+
+        public_key, private_key = rsa.generate_keypair()
+
+        encrypted_text = rsa.encrypt(public_key, entry)
+        crt_decrypted_text = rsa.decrypt(private_key, encrypted_text)
+        legacy_decrypted_text = rsa.decrypt((private_key.d, private_key.n), encrypted_text)
+
+        assert crt_decrypted_text == entry
+        assert legacy_decrypted_text == entry
+
+    def test_when_generates_keypair_with_public_exponent_65537_encrypts_and_decrypts_Hello_World(
+        self,
+    ):
+        rsa = RSA()
+        entry = 'Hello World!'
+
+        public_key, private_key = rsa.generate_keypair(public_exponent=65537)
+
+        encrypted_text = rsa.encrypt(public_key, entry)
+        decrypted_text = rsa.decrypt(private_key, encrypted_text)
+
+        assert public_key[0] == 65537
+        assert decrypted_text == entry
+
+    def test_when_generates_keypair_with_key_length_1024_returns_distinct_1024_bits_primes(self):
+        rsa = RSA()
+
+        public_key, private_key = rsa.generate_keypair(public_exponent=65537)
+
+        assert private_key.p != private_key.q
+        assert private_key.p.bit_length() == 1024
+        assert private_key.q.bit_length() == 1024
+        assert rsa._is_prime(private_key.p)
+        assert rsa._is_prime(private_key.q)
+
+    def test_when_generates_keypair_with_the_same_seed_and_2_workers_returns_the_same_keypair(
+        self,
+    ):
+        rsa = RSA()
+
+        public_key, private_key = rsa.generate_keypair(public_exponent=65537, seed=42)
+        parallel_public_key, parallel_private_key = rsa.generate_keypair(
+            public_exponent=65537, workers=2, seed=42
+        )
+
+        assert parallel_public_key == public_key
+        assert (parallel_private_key.p, parallel_private_key.q) == (private_key.p, private_key.q)
+
+    def test_when_generates_keypair_with_2_workers_encrypts_and_decrypts_Hello_World(self):
+        rsa = RSA()
+        entry = 'Hello World!'
+
+        public_key, private_key = rsa.generate_keypair(workers=2)
+
+        encrypted_text = rsa.encrypt(public_key, entry)
+        decrypted_text = rsa.decrypt(private_key, encrypted_text)
+
+        assert decrypted_text == entry
+
+    def test_when_generate_keypair_receives_workers_0_raises_ValueError(self):
+        rsa = RSA()
+
+        with pytest.raises(ValueError):
+            rsa.generate_keypair(workers=0)
+
+    def test_when_generate_keypair_receives_seed_abc_raises_ValueError(self):
+        rsa = RSA()
+
+        with pytest.raises(ValueError):
+            rsa.generate_keypair(seed='abc')
+
+    def test_when_generates_keypair_with_3_primes_encrypts_and_decrypts_Hello_World(self):
+        rsa = RSA()
+        entry = 'Hello World!'
+
+        public_key, private_key = rsa.generate_keypair(public_exponent=65537, primes=3)
+
+        encrypted_text = rsa.encrypt(public_key, entry)
+        decrypted_text = rsa.decrypt(private_key, encrypted_text)
+
+        assert len(set(private_key.primes)) == 3
+        assert [prime.bit_length() for prime in private_key.primes] == [683, 683, 682]
+        assert decrypted_text == entry
+
+    def test_when_generate_keypair_receives_primes_5_raises_ValueError(self):
+        rsa = RSA()
+
+        with pytest.raises(ValueError):
+            rsa.generate_keypair(primes=5)
+
+    def test_when_generates_keypair_with_on_progress_reports_the_tested_candidates(self):
+        rsa = RSA()
+        progress = []
+
+        rsa.generate_keypair(
+            public_exponent=65537,
+            on_progress=lambda tested_qty, elapsed: progress.append((tested_qty, elapsed)),
+        )
+
+        assert progress
+        assert progress == sorted(progress)
+        assert progress[0][0] > 0
+
+    def test_when_generate_keypair_receives_a_tiny_timeout_raises_KeyGenerationTimeoutError(self):
+        rsa = RSA()
+
+        with pytest.raises(KeyGenerationTimeoutError):
+            rsa.generate_keypair(timeout=1e-9)
+
+    def test_when_generate_keypair_receives_a_set_cancel_event_raises_KeyGenerationCancelledError(
+        self,
+    ):
+        rsa = RSA()
+        cancel_event = threading.Event()
+        cancel_event.set()
+
+        with pytest.raises(KeyGenerationCancelledError):
+            rsa.generate_keypair(cancel_event=cancel_event, workers=2)
+
+    def test_when_generate_keypair_receives_timeout_0_raises_ValueError(self):
+        rsa = RSA()
+
+        with pytest.raises(ValueError):
+            rsa.generate_keypair(timeout=0)
+
+    def test_when_generate_keypair_receives_public_exponent_4_raises_ValueError(self):
+        rsa = RSA()
+
+        with pytest.raises(ValueError):
+            rsa.generate_keypair(public_exponent=4)
+
+    def test_when_generate_keypair_receives_public_exponent_abc_raises_ValueError(self):
+        rsa = RSA()
+
+        with pytest.raises(ValueError):
+            rsa.generate_keypair(public_exponent='abc')
+
+    def test_when_encrypts_and_decrypts_a_text_with_block_packing_returns_the_proper_value(
+        self,
+    ):
+        rsa = RSA()
+        entry = 'Brasil (oficialmente República Federativa do Brasil), é o maior país da América do Sul e da região da América Latina, sendo o quinto maior do mundo em área territorial (equivalente a 47,3% do território sul-americano), com 8 510 417,771 km², e o sétimo em população (com 203 milhões de habitantes, em agosto de 2022).'
+
+        public_key, private_key = rsa.generate_keypair(public_exponent=65537)
+
+        encrypted_text = rsa.encrypt(public_key, entry, packing='block')
+        decrypted_text = rsa.decrypt(private_key, encrypted_text, packing='block')
+
+        assert len(encrypted_text.split()) == 2
+        assert decrypted_text == entry
+
+    def test_when_encrypts_to_bytes_and_decrypts_a_text_returns_the_proper_value(self):
+        rsa = RSA()
+        entry = 'Olá Mundo!'
+
+        public_key, private_key = rsa.generate_keypair(public_exponent=65537)
+
+        encrypted_text = rsa.encrypt(public_key, entry, packing='block', output_format='bytes')
+        decrypted_text = rsa.decrypt(private_key, encrypted_text)
+
+        assert isinstance(encrypted_text, bytes)
+        assert len(encrypted_text) == 8 + 256
+        assert decrypted_text == entry
+
+    def test_when_encrypts_to_base64_and_decrypts_a_text_returns_the_proper_value(self):
+        rsa = RSA()
+        entry = 'John Frusciante'
+
+        public_key, private_key = rsa.generate_keypair(public_exponent=65537)
+
+        encrypted_text = rsa.encrypt(public_key, entry, output_format='base64')
+        decrypted_text = rsa.decrypt(private_key, encrypted_text)
+
+        assert encrypted_text.startswith('RkUB')
+        assert decrypted_text == entry
+
+    def test_when_encrypts_and_decrypts_a_text_with_envelope_packing_returns_the_proper_value(
+        self,
+    ):
+        rsa = RSA()
+        entry = 'Brasil (oficialmente República Federativa do Brasil) 🇧🇷 ' * 1000
+
+        public_key, private_key = rsa.generate_keypair(public_exponent=65537)
+
+        encrypted_text = rsa.encrypt(public_key, entry, packing='envelope')
+        encrypted_bytes = rsa.encrypt(public_key, entry, packing='envelope', output_format='bytes')
+
+        assert isinstance(encrypted_text, str)
+        assert rsa.decrypt(private_key, encrypted_text) == entry.strip()
+        assert rsa.decrypt(private_key, encrypted_bytes, packing='envelope') == entry.strip()
+
+    def test_when_encrypts_an_envelope_with_public_exponent_3_the_cube_root_does_not_recover_the_session_key(
+        self,
+    ):
+        rsa = RSA()
+        entry = 'Hello World!'
+
+        public_key, private_key = rsa.generate_keypair(public_exponent=3)
+
+        encrypted_bytes = rsa.encrypt(public_key, entry, packing='envelope', output_format='bytes')
+        sealed_body_size = len(entry) + 16
+        cipher_number = int.from_bytes(
+            encrypted_bytes[-public_key.byte_length - sealed_body_size : -sealed_body_size], 'big'
+        )
+
+        # Integer cube root by Newton's method, starting above the root.
+        root = 1 << (cipher_number.bit_length() + 2) // 3
+        next_root = (2 * root + cipher_number // root**2) // 3
+
+        while next_root < root:
+            root = next_root
+            next_root = (2 * root + cipher_number // root**2) // 3
+
+        assert root**3 != cipher_number
+        assert rsa.decrypt(private_key, encrypted_bytes) == entry
+
+    def test_when_decrypts_a_tampered_envelope_raises_ValueError(self):
+        rsa = RSA()
+
+        public_key, private_key = rsa.generate_keypair(public_exponent=65537)
+
+        encrypted_bytes = bytearray(
+            rsa.encrypt(public_key, 'Hello World!', packing='envelope', output_format='bytes')
+        )
+        encrypted_bytes[-20] ^= 1
+
+        with pytest.raises(ValueError):
+            rsa.decrypt(private_key, encrypted_bytes)
+
+    def test_when_the_encrypt_method_receives_envelope_packing_and_decimal_output_format_raises_ValueError(
+        self,
+    ):
+        rsa = RSA()
+
+        with pytest.raises(ValueError):
+            rsa.encrypt((65537, 3233), 'abc', packing='envelope', output_format='decimal')
+
+    def test_when_the_decrypt_method_receives_a_packing_different_from_the_cipher_text_raises_ValueError(
+        self,
+    ):
+        rsa = RSA()
+        public_key, private_key = rsa.generate_keypair(public_exponent=65537)
+        encrypted_text = rsa.encrypt(public_key, 'abc', output_format='bytes')
+
+        with pytest.raises(ValueError):
+            rsa.decrypt(private_key, encrypted_text, packing='block')
+
+    def test_when_the_decrypt_method_receives_an_invalid_base64_cipher_text_raises_ValueError(self):
+        rsa = RSA()
+
+        with pytest.raises(ValueError):
+            rsa.decrypt((2753, 3233), 'RkUBabc')
+
+    def test_when_the_encrypt_method_receives_output_format_abc_raises_ValueError(self):
+        rsa = RSA()
+
+        with pytest.raises(ValueError):
+            rsa.encrypt((65537, 3233), 'abc', output_format='abc')
+
+    def test_when_the_encrypt_method_receives_packing_abc_raises_ValueError(self):
+        rsa = RSA()
+
+        with pytest.raises(ValueError):
+            rsa.encrypt((65537, 3233), 'abc', packing='abc')
+
+    def test_when_receives_cache_size_and_then_encrypts_and_decrypts_banana_counts_the_cache_hits(
+        self,
+    ):
+        rsa = RSA(cache_size=16)
+        entry = 'banana'
+
+        public_key, private_key = rsa.generate_keypair(public_exponent=65537)
+
+        encrypted_text = rsa.encrypt(public_key, entry)
+        decrypted_text = rsa.decrypt(private_key, encrypted_text)
+
+        assert decrypted_text == entry
+        assert rsa.encrypt(public_key, entry) == encrypted_text
+        assert rsa.cache_info() == (12, 6, 16, 6)
+
+    def test_when_receives_cache_size_2_keeps_only_the_2_most_recent_tokens(self):
+        rsa = RSA(cache_size=2)
+
+        rsa.encrypt((65537, 3233), 'abcab')
+
+        assert rsa.cache_info() == (0, 5, 2, 2)
+
+    def test_when_the_cache_clear_method_receives_a_key_evicts_only_its_tokens(self):
+        rsa = RSA(cache_size=16)
+
+        rsa.encrypt((65537, 3233), 'abc')
+        rsa.encrypt((17, 3233), 'abc')
+        rsa.cache_clear((65537, 3233))
+
+        assert rsa.cache_info().currsize == 3
+
+        rsa.cache_clear()
+
+        assert rsa.cache_info() == (0, 0, 16, 0)
+
+    def test_when_cache_size_receives_minus_1_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            RSA(cache_size=-1)
+
+    def test_when_decrypts_a_stream_in_small_chunks_writes_the_same_value_as_decrypt(self):
+        rsa = RSA()
+        entry = 'Brasil (oficialmente República Federativa do Brasil) 🇧🇷 ' * 20
+
+        public_key, private_key = rsa.generate_keypair(public_exponent=65537)
+
+        formats = ('char', 'decimal'), ('block', 'bytes'), ('block', 'base64')
+
+        for packing, output_format in formats:
+            encrypted_text = rsa.encrypt(public_key, entry, packing, output_format)
+            reader = (
+                io.BytesIO(encrypted_text)
+                if isinstance(encrypted_text, bytes)
+                else io.StringIO(encrypted_text)
+            )
+            writer = io.StringIO()
+
+            written_qty = rsa.decrypt_stream(private_key, reader, writer, packing, chunk_size=7)
+
+            assert writer.getvalue() == entry.strip()
+            assert written_qty == len(entry.strip())
+
+    def test_when_decrypts_a_stream_to_a_writer_returning_None_returns_the_chars_written(self):
+        class ListWriter:
+            def __init__(self):
+                self.chunks = []
+
+            def write(self, text: str) -> None:
+                self.chunks.append(text)
+
+        rsa = RSA()
+        entry = 'Olá Mundo! ' * 200
+
+        public_key, private_key = rsa.generate_keypair(public_exponent=65537)
+        encrypted_text = rsa.encrypt(public_key, entry, 'block', 'bytes')
+        writer = ListWriter()
+
+        written_qty = rsa.decrypt_stream(private_key, io.BytesIO(encrypted_text), writer)
+
+        assert ''.join(writer.chunks) == entry.strip()
+        assert written_qty == len(entry.strip())
+
+    def test_when_the_decrypt_stream_method_receives_an_envelope_raises_ValueError(self):
+        rsa = RSA()
+
+        public_key, private_key = rsa.generate_keypair(public_exponent=65537)
+        encrypted_text = rsa.encrypt(public_key, 'Hello World!', packing='envelope')
+
+        with pytest.raises(ValueError):
+            rsa.decrypt_stream(private_key, io.StringIO(encrypted_text), io.StringIO())
+
+    def test_when_encrypts_many_and_decrypts_many_with_2_workers_returns_the_texts_in_order(
+        self,
+    ):
+        rsa = RSA()
+        entries = [f'Hello World {number}!' for number in range(5)]
+
+        public_key, private_key = rsa.generate_keypair(public_exponent=65537)
+
+        encrypted_texts = rsa.encrypt_many(public_key, entries, workers=2, chunk_size=2)
+        decrypted_texts = rsa.decrypt_many(private_key, encrypted_texts, workers=2, chunk_size=2)
+
+        assert decrypted_texts == entries
+        assert rsa.decrypt(private_key, encrypted_texts[3]) == entries[3]
+
+    def test_when_the_encrypt_many_method_receives_a_text_as_int_raises_ValueError(self):
+        rsa = RSA()
+
+        with pytest.raises(ValueError):
+            rsa.encrypt_many((65537, 3233), ['abc', 1])
+
+    def test_when_the_decrypt_many_method_receives_chunk_size_0_raises_ValueError(self):
+        rsa = RSA()
+
+        with pytest.raises(ValueError):
+            rsa.decrypt_many((2753, 3233), ['1 2', '3 4'], chunk_size=0)
+
+    @pytest.mark.parametrize('arithmetic', ['python', 'gmpy2'])
+    def test_when_generates_keypair_with_a_seed_returns_the_same_keypair_with_any_arithmetic(
+        self, arithmetic
+    ):
+        if arithmetic == 'gmpy2':
+            pytest.importorskip('gmpy2')
+
+        python_rsa = RSA(arithmetic='python')
+        rsa = RSA(arithmetic=arithmetic)
+        entry = 'Hello World!'
+
+        expected_public_key, expected_private_key = python_rsa.generate_keypair(seed=7)
+        public_key, private_key = rsa.generate_keypair(seed=7)
+
+        encrypted_text = rsa.encrypt(public_key, entry)
+
+        assert public_key == expected_public_key
+        assert private_key.primes == expected_private_key.primes
+        assert encrypted_text == python_rsa.encrypt(expected_public_key, entry)
+        assert rsa.decrypt(private_key, encrypted_text) == entry
+        assert rsa.decrypt(tuple(private_key), encrypted_text) == entry
+
+    def test_when_arithmetic_receives_abc_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            RSA(arithmetic='abc')
+
     def test_when_key_length_receives_None_raises_ValueError(self):
         with pytest.raises(ValueError):
             RSA(None)
@@ -0,0 +1,89 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.fast_encrypt import RSA, RSAKeyPool
+
+
+class TestRSAKeyPool:
+    def test_when_acquires_a_keypair_encrypts_and_decrypts_Hello_World(self):
+        rsa = RSA()
+        entry = 'Hello World!'
+
+        with RSAKeyPool(size=1, public_exponent=65537) as pool:
+            public_key, private_key = asyncio.run(pool.acquire())
+
+        encrypted_text = rsa.encrypt(public_key, entry)
+        decrypted_text = rsa.decrypt(private_key, encrypted_text)
+
+        assert public_key[0] == 65537
+        assert decrypted_text == entry
+
+    def test_when_acquires_3_keypairs_from_a_pool_of_size_1_returns_distinct_keypairs(self):
+        async def acquire_keypairs(pool):
+            return await asyncio.gather(*(pool.acquire() for _ in range(3)))
+
+        with RSAKeyPool(size=1, public_exponent=65537) as pool:
+            keypairs = asyncio.run(acquire_keypairs(pool))
+            metrics = pool.metrics()
+
+        assert len({public_key for public_key, _ in keypairs}) == 3
+        assert metrics.acquired == 3
+        assert metrics.refilled >= 3
+        assert metrics.mean_refill_time > 0
+
+    def test_when_the_pool_is_closed_the_acquire_method_raises_RuntimeError(self):
+        pool = RSAKeyPool(size=1, public_exponent=65537)
+        pool.close()
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(pool.acquire())
+
+    def test_when_a_cancelled_acquire_loop_is_closed_the_next_acquire_returns_a_keypair(
+        self, monkeypatch
+    ):
+        generate_keypair = RSA.generate_keypair
+        refill_allowed = threading.Event()
+
+        def wait_and_generate_keypair(*args, **kwargs):
+            refill_allowed.wait()
+            return generate_keypair(*args, **kwargs)
+
+        monkeypatch.setattr(RSA, 'generate_keypair', wait_and_generate_keypair)
+
+        with RSAKeyPool(size=1, public_exponent=65537) as pool:
+            with pytest.raises(asyncio.TimeoutError):
+                asyncio.run(asyncio.wait_for(pool.acquire(), timeout=0.05))
+
+            refill_allowed.set()
+            public_key, private_key = asyncio.run(asyncio.wait_for(pool.acquire(), timeout=30))
+
+        assert public_key[0] == 65537
+
+    def test_when_the_refill_fails_the_acquire_method_raises_the_error(self, monkeypatch):
+        def fail_to_generate_keypair(*args, **kwargs):
+            raise OSError('The refill failed.')
+
+        monkeypatch.setattr(RSA, 'generate_keypair', fail_to_generate_keypair)
+
+        with RSAKeyPool(size=1, public_exponent=65537) as pool:
+            with pytest.raises(OSError):
+                asyncio.run(asyncio.wait_for(pool.acquire(), timeout=30))
+
+    def test_when_the_acquire_method_receives_a_key_length_not_kept_raises_ValueError(self):
+        with RSAKeyPool(size=1, public_exponent=65537) as pool:
+            with pytest.raises(ValueError):
+                asyncio.run(pool.acquire(2048))
+
+    def test_when_size_receives_0_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            RSAKeyPool(size=0)
+
+    def test_when_key_lengths_receives_1023_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            RSAKeyPool(key_lengths=(1023,))
+
+    def test_when_public_exponent_receives_4_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            RSAKeyPool(public_exponent=4)
@@ -0,0 +1,115 @@
+import pickle
+
+import pytest
+
+from src.fast_encrypt import RSA, RSAPrivateKey
+
+
+class TestRSAPrivateKey:
+    def test_when_receives_d_2753_n_3233_p_61_q_53_returns_the_proper_crt_values(self):
+        private_key = RSAPrivateKey(2753, 3233, 61, 53)
+
+        assert private_key.dp == 53
+        assert private_key.dq == 49
+        assert private_key.qinv == 38
+
+    def test_when_receives_the_other_prime_59_returns_its_crt_values(self):
+        private_key = RSAPrivateKey(51703, 190747, 61, 53, 59)
+
+        assert private_key.primes == (61, 53, 59)
+        assert private_key.other_prime_infos == ((59, 25, 54),)
+
+    def test_when_decrypts_with_a_3_prime_key_returns_the_same_value_as_the_legacy_tuple(self):
+        rsa = RSA()
+        private_key = RSAPrivateKey(51703, 190747, 61, 53, 59)
+
+        assert rsa.decrypt(private_key, '43346') == 'A'
+        assert rsa.decrypt((51703, 190747), '43346') == 'A'
+
+    def test_when_unpacks_the_private_key_returns_d_and_n(self):
+        private_key = RSAPrivateKey(2753, 3233, 61, 53)
+
+        d, n = private_key
+
+        assert (d, n) == (2753, 3233)
+
+    def test_when_indexes_the_private_key_returns_d_and_n(self):
+        private_key = RSAPrivateKey(2753, 3233, 61, 53)
+
+        assert (private_key[0], private_key[1], private_key[-1]) == (2753, 3233, 3233)
+        assert len(private_key) == 2
+
+    def test_when_compares_with_the_legacy_tuple_returns_True_and_the_same_hash(self):
+        private_key = RSAPrivateKey(2753, 3233, 61, 53)
+
+        assert private_key == (2753, 3233)
+        assert hash(private_key) == hash((2753, 3233))
+        assert private_key != (2753, 3127)
+
+    def test_when_compares_keys_with_the_same_numbers_returns_True(self):
+        private_key = RSAPrivateKey(51703, 190747, 61, 53, 59)
+
+        assert private_key == RSAPrivateKey(51703, 190747, 61, 53, 59)
+        assert private_key == RSAPrivateKey.from_bytes(private_key.to_bytes())
+        assert private_key != RSAPrivateKey(51703, 190747, 53, 61, 59)
+        assert len({private_key, RSAPrivateKey(51703, 190747, 61, 53, 59)}) == 1
+
+    def test_when_n_is_not_the_product_of_p_and_q_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            RSAPrivateKey(2753, 3234, 61, 53)
+
+    def test_when_p_and_q_are_equal_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            RSAPrivateKey(2753, 3721, 61, 61)
+
+    def test_when_receives_d_as_str_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            RSAPrivateKey('2753', 3233, 61, 53)
+
+    def test_when_n_is_not_the_product_of_the_3_primes_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            RSAPrivateKey(51703, 3233, 61, 53, 59)
+
+    def test_when_loads_the_serialized_key_returns_the_same_crt_values(self):
+        private_key = RSAPrivateKey(51703, 190747, 61, 53, 59)
+
+        loaded_key = RSAPrivateKey.from_bytes(private_key.to_bytes())
+
+        assert tuple(loaded_key) == (51703, 190747)
+        assert (loaded_key.dp, loaded_key.dq, loaded_key.qinv) == (
+            private_key.dp,
+            private_key.dq,
+            private_key.qinv,
+        )
+        assert loaded_key.other_prime_infos == ((59, 25, 54),)
+
+    def test_when_loads_a_serialized_public_key_raises_ValueError(self):
+        rsa = RSA()
+        public_key, _ = rsa.generate_keypair(public_exponent=65537, seed=1)
+
+        with pytest.raises(ValueError):
+            RSAPrivateKey.from_bytes(public_key.to_bytes())
+
+    def test_when_loads_truncated_bytes_raises_ValueError(self):
+        data = RSAPrivateKey(2753, 3233, 61, 53).to_bytes()
+
+        with pytest.raises(ValueError):
+            RSAPrivateKey.from_bytes(data[:-1])
+
+    def test_when_sets_an_attribute_raises_AttributeError(self):
+        private_key = RSAPrivateKey(2753, 3233, 61, 53)
+
+        with pytest.raises(AttributeError):
+            private_key._d = 1
+
+    def test_when_pickles_the_key_returns_an_equal_key(self):
+        private_key = RSAPrivateKey(51703, 190747, 61, 53, 59)
+
+        loaded_key = pickle.loads(pickle.dumps(private_key))
+
+        assert loaded_key == private_key
+        assert loaded_key.primes == (61, 53, 59)
+        assert loaded_key.other_prime_infos == private_key.other_prime_infos
+
+    def test_when_receives_d_2753_n_3233_returns_byte_length_2(self):
+        assert RSAPrivateKey(2753, 3233, 61, 53).byte_length == 2
@@ -0,0 +1,66 @@
+import pickle
+
+import pytest
+
+from src.fast_encrypt import RSA, RSAPublicKey
+
+
+class TestRSAPublicKey:
+    def test_when_unpacks_the_public_key_returns_e_and_n(self):
+        public_key = RSAPublicKey(17, 3233)
+
+        e, n = public_key
+
+        assert (e, n) == (17, 3233)
+        assert public_key[0] == 17
+
+    def test_when_compares_with_the_legacy_tuple_returns_True(self):
+        assert RSAPublicKey(17, 3233) == (17, 3233)
+        assert hash(RSAPublicKey(17, 3233)) == hash((17, 3233))
+
+    def test_when_receives_n_3233_returns_byte_length_2(self):
+        assert RSAPublicKey(17, 3233).byte_length == 2
+
+    def test_when_loads_the_serialized_key_returns_an_equal_key(self):
+        public_key = RSAPublicKey(65537, 2**2047 + 1)
+
+        assert RSAPublicKey.from_bytes(public_key.to_bytes()) == public_key
+
+    def test_when_loads_a_serialized_private_key_raises_ValueError(self):
+        rsa = RSA()
+        _, private_key = rsa.generate_keypair(public_exponent=65537, seed=1)
+
+        with pytest.raises(ValueError):
+            RSAPublicKey.from_bytes(private_key.to_bytes())
+
+    def test_when_loads_str_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            RSAPublicKey.from_bytes('FK')
+
+    def test_when_sets_an_attribute_raises_AttributeError(self):
+        public_key = RSAPublicKey(17, 3233)
+
+        with pytest.raises(AttributeError):
+            public_key._e = 3
+
+    def test_when_pickles_the_key_returns_an_equal_key(self):
+        public_key = RSAPublicKey(17, 3233)
+
+        assert pickle.loads(pickle.dumps(public_key)) == public_key
+
+    def test_when_encrypts_with_the_key_and_the_legacy_tuple_returns_the_same_cipher_text(self):
+        rsa = RSA()
+        public_key, private_key = rsa.generate_keypair(public_exponent=65537, seed=1)
+
+        cipher_text = rsa.encrypt(public_key, 'Hello World!')
+
+        assert cipher_text == rsa.encrypt(tuple(public_key), 'Hello World!')
+        assert rsa.decrypt(private_key, cipher_text) == 'Hello World!'
+
+    def test_when_receives_e_as_str_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            RSAPublicKey('17', 3233)
+
+    def test_when_receives_n_0_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            RSAPublicKey(17, 0)
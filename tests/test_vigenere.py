@@ -56,6 +56,21 @@ class TestVigenere:
         assert encryption_result == expected_encryption
         assert decryption_result == expected_decryption
 
+    def test_when_receives_key_KEY_and_then_encrypts_and_decrypts_text_with_non_letters_does_not_advance_the_key(
+        self,
+    ):
+        vigenere = Vigenere('KEY')
+        entry = 'a-b c!d'
+
+        encryption_result = vigenere.encrypt(entry)
+        expected_encryption = 'k-f a!n'
+
+        decryption_result = vigenere.decrypt(expected_encryption)
+        expected_decryption = 'a-b c!d'
+
+        assert encryption_result == expected_encryption
+        assert decryption_result == expected_decryption
+
     def test_when_key_receives_0_raises_ValueError(self):
         with pytest.raises(ValueError):
             Vigenere(0)